@@ -0,0 +1,219 @@
+import argparse
+import json
+import pathlib
+import platform
+import sys
+import time
+
+import fix_oll_data as sim
+import regenerate_cases
+
+# --- Simulator / data pipeline benchmarks ---
+# Results are keyed by benchmark name: rates (higher is better), or latencies
+# in microseconds for names ending in '_us' (lower is better). --save stores
+# them as the JSON baseline; otherwise each run is compared with the baseline
+# and anything slower by more than --threshold is flagged (exit status 1).
+
+BASELINE_PATH = pathlib.Path(__file__).resolve().parent / 'benchmarks' / 'baseline.json'
+
+# Reported but not flagged: one pool run is dominated by process start-up,
+# so it varies too much between runs to gate on.
+UNGATED = {'regenerate.pool.cases'}
+
+MOVE_GROUPS = {
+    'face': ['U', 'D', 'R', 'L', 'F', 'B'],
+    'face_prime': ["U'", "D'", "R'", "L'", "F'", "B'"],
+    'face_double': ['U2', 'D2', 'R2', 'L2', 'F2', 'B2'],
+    'slice': ['M', 'E', 'S', "M'", "E'", "S'"],
+    'wide': ['r', 'l', 'u', 'd', 'f', 'b', "r'", "u'"],
+    'rotation': ['x', 'y', 'z', "x'", "y'", "z'"],
+}
+
+def _best_rate(fn, units, repeat=5, min_time=0.1):
+    # Best-of-`repeat` rate in units/second; each sample loops until min_time.
+    best = 0.0
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            fn()
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, units * loops / elapsed)
+    return best
+
+def _best_latency(fn, repeat=5, min_time=0.002):
+    # Best-of-`repeat` time per call in microseconds; each sample loops until
+    # min_time.
+    best = float('inf')
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            fn()
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / loops * 1e6)
+    return best
+
+def _all_cases():
+    cases = regenerate_cases.load_cases(regenerate_cases.CASE_FILES)
+    return [(kind, c) for kind, items in cases.items() for c in items]
+
+def bench_moves():
+    results = {}
+    for group, names in MOVE_GROUPS.items():
+        moves = [(n.rstrip("'"), n.endswith("'")) for n in names]
+
+        def run(moves=moves):
+            state = sim.solved()
+            for base, is_prime in moves * 50:
+                state = sim.apply_move(state, base, is_prime)
+        results[f'apply_move.{group}'] = _best_rate(run, len(moves) * 50)
+    return results
+
+def _clear_alg_caches():
+    sim._compile_normalized.cache_clear()
+    sim.normalize_alg.cache_clear()
+
+def bench_algorithms(cases):
+    algs = [c['solution'] for _, c in cases]
+    n_moves = sum(len(a.split()) for a in algs)
+
+    def parse():
+        for a in algs:
+            sim.parse_moves(a)
+
+    parsed = [sim.parse_moves(a) for a in algs]
+
+    def invert():
+        for m in parsed:
+            sim.invert_moves(m)
+
+    resolved = [sim.resolve_alg(a, invert=True) for a in algs]
+
+    def move_loop():
+        for gathers in resolved:
+            sim.apply_moves(sim.solved(), gathers)
+
+    def warm():
+        for a in algs:
+            sim.apply_alg(a, invert=True)
+
+    states = [sim.apply_alg(a, invert=True) for a in algs]
+
+    def patterns():
+        for s in states:
+            sim.patterns_from_state(s)
+
+    results = {
+        'parse_moves.moves': _best_rate(parse, n_moves),
+        'invert_moves.moves': _best_rate(invert, n_moves),
+        'apply_moves.moves': _best_rate(move_loop, n_moves),
+        'apply_alg.warm.algs': _best_rate(warm, len(algs)),
+        'patterns_from_state.states': _best_rate(patterns, len(states)),
+    }
+    # Cold (uncached) algorithm compilation, per case file: the overall rate,
+    # and the median and slowest single-algorithm latency.
+    for kind in regenerate_cases.CASE_FILES:
+        kind_algs = [c['solution'] for k, c in cases if k == kind]
+
+        def cold(kind_algs=kind_algs):
+            _clear_alg_caches()
+            for a in kind_algs:
+                sim.apply_alg(a, invert=True)
+        results[f'apply_alg.cold.{kind}.algs'] = _best_rate(cold, len(kind_algs))
+
+        def cold_one(a):
+            _clear_alg_caches()
+            sim.apply_alg(a, invert=True)
+        latencies = sorted(_best_latency(lambda a=a: cold_one(a)) for a in kind_algs)
+        results[f'apply_alg.cold.{kind}.median_us'] = latencies[len(latencies) // 2]
+        results[f'apply_alg.cold.{kind}.worst_us'] = latencies[-1]
+    return results
+
+def bench_regeneration(cases):
+    by_kind = regenerate_cases.load_cases(regenerate_cases.CASE_FILES)
+
+    def serial():
+        _clear_alg_caches()
+        regenerate_cases.find_mismatches(by_kind, jobs=1)
+
+    def pool():
+        regenerate_cases.find_mismatches(by_kind, jobs=None)
+
+    def cached():
+        regenerate_cases.find_mismatches(by_kind, jobs=1, cache=cache)
+
+    cache = {}
+    regenerate_cases.find_mismatches(by_kind, jobs=1, cache=cache)
+    return {
+        'regenerate.serial.cases': _best_rate(serial, len(cases), repeat=3),
+        'regenerate.pool.cases': _best_rate(pool, len(cases), repeat=3),
+        'regenerate.cached.cases': _best_rate(cached, len(cases), repeat=3),
+    }
+
+def run_all():
+    cases = _all_cases()
+    results = {}
+    results.update(bench_moves())
+    results.update(bench_algorithms(cases))
+    results.update(bench_regeneration(cases))
+    return results
+
+def is_latency(name):
+    return name.endswith('_us')
+
+def compare(results, baseline, threshold):
+    # Gated names that got slower by more than `threshold` (a fraction): a
+    # rate that dropped or a latency that grew.
+    regressions = []
+    for name, value in results.items():
+        base = baseline.get(name)
+        if not base or name in UNGATED:
+            continue
+        if value > base * (1 + threshold) if is_latency(name) else value < base * (1 - threshold):
+            regressions.append(name)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the cube simulator and case-data pipeline.')
+    parser.add_argument('--save', action='store_true', help='store this run as the baseline')
+    parser.add_argument('--baseline', type=pathlib.Path, default=BASELINE_PATH)
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='flag benchmarks slower than the baseline by this fraction (default 0.25)')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args(argv)
+
+    results = run_all()
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())['results']
+    regressions = [] if args.save else compare(results, baseline, args.threshold)
+
+    if args.json:
+        print(json.dumps({'results': results, 'regressions': regressions}, indent=2))
+    else:
+        for name, value in results.items():
+            base = baseline.get(name)
+            delta = f'{(value / base - 1) * 100:+6.1f}%' if base else '    new'
+            flag = '  REGRESSION' if name in regressions else '  (not gated)' if name in UNGATED else ''
+            unit = f'{value:14,.1f}us' if is_latency(name) else f'{value:14,.0f}/s'
+            print(f'{name:32} {unit} {delta}{flag}')
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'results': results,
+        }, indent=2))
+        print(f'Saved baseline to {args.baseline}')
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
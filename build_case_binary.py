@@ -0,0 +1,120 @@
+import json
+import struct
+
+from regenerate_cases import CASE_FILES, DATA_DIR, write_if_changed
+
+# --- Packed case database (data/cases.bin) ---
+# All three case files in one little-endian buffer, decoded by js/case-data.js:
+#
+#   header   'CFOP', u16 version, u16 strings, u16 oll, u16 pll, u16 f2l, u16 0
+#   offsets  (strings + 1) x u32 end offsets into the string blob
+#   oll      u16 id, u16 solution, u32 top pattern << 12 | ring pattern
+#   pll      u16 id, u16 solution, u32 ring stickers, 2 bits each (A=0..D=3),
+#            sticker 0 in the lowest bits
+#   f2l      u16 id, u16 name, u16 solution, u8 corner pos << 2 | ori,
+#            u8 edge pos << 1 | ori
+#   strings  deduplicated UTF-8 ids, names and solutions
+#
+# Bump FORMAT_VERSION (here and in js/case-data.js) when the layout or the
+# enums below change.
+
+FORMAT_VERSION = 1
+BINARY_PATH = DATA_DIR / 'cases.bin'
+
+CORNER_POSITIONS = ['UFR', 'UFL', 'UBL', 'UBR', 'FR_SLOT']
+EDGE_POSITIONS = ['UR', 'UF', 'UL', 'UB', 'FR']
+PLL_LABELS = 'ABCD'
+
+_header = struct.Struct('<4sHHHHHH')
+_oll_record = struct.Struct('<HHI')
+_pll_record = struct.Struct('<HHI')
+_f2l_record = struct.Struct('<HHHBB')
+
+class _StringTable:
+    def __init__(self):
+        self.strings = []
+        self.index = {}
+
+    def add(self, s):
+        if s not in self.index:
+            self.index[s] = len(self.strings)
+            self.strings.append(s)
+        return self.index[s]
+
+def _pack_pll(pattern):
+    word = 0
+    for i, ch in enumerate(pattern):
+        word |= PLL_LABELS.index(ch) << (2 * i)
+    return word
+
+def _unpack_pll(word):
+    return ''.join(PLL_LABELS[(word >> (2 * i)) & 3] for i in range(12))
+
+def encode_cases(oll, pll, f2l):
+    strings = _StringTable()
+    oll_bytes = b''.join(
+        _oll_record.pack(strings.add(c['id']), strings.add(c['solution']),
+                         int(c['topPattern'], 2) << 12 | int(c['ringPattern'], 2))
+        for c in oll)
+    pll_bytes = b''.join(
+        _pll_record.pack(strings.add(c['id']), strings.add(c['solution']), _pack_pll(c['pattern']))
+        for c in pll)
+    f2l_bytes = b''.join(
+        _f2l_record.pack(strings.add(c['id']), strings.add(c['name']), strings.add(c['solution']),
+                         CORNER_POSITIONS.index(c['cornerPos']) << 2 | c['cornerOri'],
+                         EDGE_POSITIONS.index(c['edgePos']) << 1 | c['edgeOri'])
+        for c in f2l)
+
+    blob = bytearray()
+    ends = []
+    for s in strings.strings:
+        blob += s.encode('utf-8')
+        ends.append(len(blob))
+    offsets = struct.pack(f'<{len(ends) + 1}I', 0, *ends)
+
+    header = _header.pack(b'CFOP', FORMAT_VERSION, len(strings.strings), len(oll), len(pll), len(f2l), 0)
+    return header + offsets + oll_bytes + pll_bytes + f2l_bytes + bytes(blob)
+
+def decode_cases(data):
+    magic, version, n_strings, n_oll, n_pll, n_f2l, _ = _header.unpack_from(data, 0)
+    if magic != b'CFOP' or version != FORMAT_VERSION:
+        raise ValueError('not a version %d case database' % FORMAT_VERSION)
+    pos = _header.size
+    offsets = struct.unpack_from(f'<{n_strings + 1}I', data, pos)
+    pos += 4 * (n_strings + 1)
+    blob_start = pos + 8 * (n_oll + n_pll + n_f2l)
+    strings = [data[blob_start + offsets[i]:blob_start + offsets[i + 1]].decode('utf-8')
+               for i in range(n_strings)]
+
+    oll = []
+    for _ in range(n_oll):
+        id_, sol, bits = _oll_record.unpack_from(data, pos)
+        pos += _oll_record.size
+        oll.append({'id': strings[id_], 'topPattern': format(bits >> 12, '08b'),
+                    'ringPattern': format(bits & 0xfff, '012b'), 'solution': strings[sol]})
+    pll = []
+    for _ in range(n_pll):
+        id_, sol, word = _pll_record.unpack_from(data, pos)
+        pos += _pll_record.size
+        pll.append({'id': strings[id_], 'pattern': _unpack_pll(word), 'solution': strings[sol]})
+    f2l = []
+    for _ in range(n_f2l):
+        id_, name, sol, corner, edge = _f2l_record.unpack_from(data, pos)
+        pos += _f2l_record.size
+        f2l.append({'id': strings[id_], 'name': strings[name],
+                    'cornerPos': CORNER_POSITIONS[corner >> 2], 'cornerOri': corner & 3,
+                    'edgePos': EDGE_POSITIONS[edge >> 1], 'edgeOri': edge & 1,
+                    'solution': strings[sol]})
+    return oll, pll, f2l
+
+def main():
+    cases = [json.loads(CASE_FILES[kind].read_text()) for kind in ('oll', 'pll', 'f2l')]
+    data = encode_cases(*cases)
+    if list(decode_cases(data)) != cases:
+        raise ValueError('packed case database does not round-trip')
+    write_if_changed(BINARY_PATH, data)
+    json_size = sum(len(CASE_FILES[kind].read_bytes()) for kind in CASE_FILES)
+    print(f"Wrote {BINARY_PATH.name}: {len(data)} bytes (JSON: {json_size} bytes).")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+import struct
+
+import numpy as np
+
+from cubie import FACE_MOVES, MOVE_CUBES
+from pruning_tables import UNREACHED, bfs_distances, coordinate
+from regenerate_cases import DATA_DIR, write_if_changed
+
+# --- Optimal cross table (data/cross_table.bin) ---
+# Every one of the 190,080 cross states (DR DF DL DB edges: positions and
+# flips, the `cross` coordinate of pruning_tables.py) mapped to the first face
+# turn of an optimal (HTM) solution. js/cross.js walks the table move by move:
+#
+#   header  'XTBL', u16 version, u16 move count (18)
+#   edges   18 x 12 u8: new position of the edge at each position, per move
+#   flips   18 x 12 u8: flip each of those edges gains
+#   next    190,080 u8: index into FACE_MOVES, or 255 once the cross is solved
+#
+# Moves are ordered U U2 U' R R2 R' F F2 F' D D2 D' L L2 L' B B2 B'.
+
+FORMAT_VERSION = 1
+TABLE_PATH = DATA_DIR / 'cross_table.bin'
+SOLVED_MOVE = 255
+
+def edge_tables():
+    # dest[m][p], flip[m][p]: where move m sends the edge at position p.
+    dest = [[0]*12 for _ in FACE_MOVES]
+    flip = [[0]*12 for _ in FACE_MOVES]
+    for m, name in enumerate(FACE_MOVES):
+        _, _, ep, eo = MOVE_CUBES[name]
+        for i, src in enumerate(ep):
+            dest[m][src] = i
+            flip[m][src] = eo[i]
+    return dest, flip
+
+def next_moves(moves, dist):
+    # Lowest-numbered move that brings each state one turn closer.
+    best = np.full(len(dist), SOLVED_MOVE, dtype=np.uint8)
+    for m in range(moves.shape[1]):
+        pick = (best == SOLVED_MOVE) & (dist > 0) & (dist[moves[:, m]] == dist.astype(np.int16) - 1)
+        best[pick] = m
+    return best
+
+def build_table():
+    coord = coordinate('cross')
+    moves = coord.move_table()
+    dist = bfs_distances(moves, coord.solved_index())
+    if (dist == UNREACHED).any():
+        raise ValueError('cross coordinate has unreachable states')
+    best = next_moves(moves, dist)
+    if ((best == SOLVED_MOVE) != (dist == 0)).any():
+        raise ValueError('cross state without an improving move')
+    dest, flip = edge_tables()
+    header = struct.pack('<4sHH', b'XTBL', FORMAT_VERSION, len(FACE_MOVES))
+    data = header + bytes(sum(dest, [])) + bytes(sum(flip, [])) + best.tobytes()
+    return data, dist
+
+def read_next_moves(path=TABLE_PATH):
+    # The `next` section of a table file, checked against its header.
+    data = path.read_bytes()
+    magic, version, n_moves = struct.unpack_from('<4sHH', data)
+    if magic != b'XTBL' or version != FORMAT_VERSION or n_moves != len(FACE_MOVES):
+        raise ValueError(f'{path.name} is not a version {FORMAT_VERSION} cross table')
+    return data[struct.calcsize('<4sHH') + 2 * n_moves * 12:]
+
+def main():
+    data, dist = build_table()
+    write_if_changed(TABLE_PATH, data)
+    print(f"Wrote {TABLE_PATH.name}: {len(dist)} cross states, max {int(dist.max())} moves, {len(data)} bytes.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+import argparse
+import json
+import sys
+
+import cubie
+from fix_oll_data import case_state, colors, corner_facelets, edge_facelets, locate_piece, strip_rotations
+from regenerate_cases import CASE_FILES, DATA_DIR, derive_f2l, write_if_changed
+
+# --- F2L verification and four-slot index ---
+# data/f2l_cases.json holds front-right slot cases only. Each case is checked
+# against its solution (stored fields re-derived, and the rest of the first two
+# layers left untouched), then conjugated by a y turn into the other three
+# slots and rewritten without rotations. data/f2l_index.json maps
+# "SLOT|cornerPos|cornerOri|edgePos|edgeOri" to [id, algorithm].
+
+INDEX_PATH = DATA_DIR / 'f2l_index.json'
+
+# Slot -> (corner, edge, y turn that brings the slot to front-right).
+SLOTS = {
+    'FR': ('DFR', 'FR', ''),
+    'FL': ('DFL', 'FL', "y'"),
+    'BL': ('DBL', 'BL', 'y2'),
+    'BR': ('DBR', 'BR', 'y'),
+}
+_inverse_y = {'': '', 'y': "y'", "y'": 'y', 'y2': 'y2'}
+
+def _piece_colors(name):
+    # Colours of the piece whose home is `name`; the position names start with
+    # the reference (twist/flip 0) face: D for slot corners, F/B for slot edges.
+    return [colors[f] for f in name]
+
+_f2l_corners = [cubie.CORNERS.index(c) for c, _, _ in SLOTS.values()]
+_f2l_edges = [cubie.EDGES.index(e) for e in ('DR', 'DF', 'DL', 'DB')] + \
+    [cubie.EDGES.index(e) for _, e, _ in SLOTS.values()]
+
+def slot_algorithm(solution, slot):
+    turn = SLOTS[slot][2]
+    return strip_rotations(f'{turn} {solution} {_inverse_y[turn]}')
+
+def _position_name(position, slot):
+    # The data names the slot's own corner position after the slot.
+    return f'{slot}_SLOT' if position == SLOTS[slot][0] else position
+
+def slot_case(alg, slot):
+    # (cornerPos, cornerOri, edgePos, edgeOri) of `slot`'s pair in the state
+    # that `alg` solves.
+    return pair_case(case_state(alg), slot)
+
+def pair_case(state, slot):
+    # The same for the pair as it sits in `state`.
+    corner, edge, _ = SLOTS[slot]
+    corner_pos, corner_ori = locate_piece(state, corner_facelets, _piece_colors(corner))
+    edge_pos, edge_ori = locate_piece(state, edge_facelets, _piece_colors(edge))
+    return _position_name(corner_pos, slot), corner_ori, edge_pos, edge_ori
+
+def disturbed_pieces(alg, slot):
+    # First-two-layer pieces other than `slot`'s pair that `alg` does not
+    # leave solved.
+    cp, co, ep, eo = cubie.from_stickers(case_state(alg))
+    corner, edge, _ = SLOTS[slot]
+    bad = [cubie.CORNERS[i] for i in _f2l_corners
+           if cubie.CORNERS[i] != corner and (cp[i] != i or co[i])]
+    bad += [cubie.EDGES[i] for i in _f2l_edges
+            if cubie.EDGES[i] != edge and (ep[i] != i or eo[i])]
+    return bad
+
+def check_case(case):
+    problems = []
+    derived = derive_f2l(case['solution'])
+    for field, value in derived.items():
+        if case.get(field) != value:
+            problems.append(f"{field} is {case.get(field)!r}, solution gives {value!r}")
+    disturbed = disturbed_pieces(case['solution'], 'FR')
+    if disturbed:
+        problems.append(f"solution disturbs {', '.join(disturbed)}")
+    return problems
+
+def key(slot, corner_pos, corner_ori, edge_pos, edge_ori):
+    return f'{slot}|{corner_pos}|{corner_ori}|{edge_pos}|{edge_ori}'
+
+def build_index(cases):
+    index = {}
+    for c in cases:
+        for slot in SLOTS:
+            alg = slot_algorithm(c['solution'], slot)
+            disturbed = disturbed_pieces(alg, slot)
+            if disturbed:
+                raise ValueError(f"{c['id']} in {slot} disturbs {', '.join(disturbed)}")
+            k = key(slot, *slot_case(alg, slot))
+            if k in index:
+                raise ValueError(f"{c['id']} and {index[k][0]} share {k}")
+            index[k] = [c['id'], alg]
+    return index
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Verify F2L cases and build the four-slot index.')
+    parser.add_argument('--check', action='store_true',
+                        help='only verify the cases; exit with status 1 if any fail')
+    args = parser.parse_args(argv)
+
+    cases = json.loads(CASE_FILES['f2l'].read_text())
+    failed = 0
+    for c in cases:
+        for problem in check_case(c):
+            print(f"{c['id']}: {problem}")
+            failed += 1
+    if args.check or failed:
+        print(f"{failed} problems in {len(cases)} F2L cases.")
+        return 1 if failed else 0
+
+    index = build_index(cases)
+    write_if_changed(INDEX_PATH, json.dumps(index, separators=(',', ':')))
+    print(f"Wrote {len(index)} F2L index entries for {len(cases)} cases in {len(SLOTS)} slots.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+import shutil
+import subprocess
+import sys
+
+from regenerate_cases import DATA_DIR, ROOT, write_if_changed
+
+# --- Precomputed min2phase tables (data/min2phase_tables.bin) ---
+# min2phase builds its move and pruning tables in the browser before the first
+# solve. This runs the same code once under Node.js (min2phase.exportTables)
+# and stores the result, which the solver page hands to min2phase.loadTables
+# as an ArrayBuffer. The file layout is defined next to those functions in
+# js/min2phase.js; the output is deterministic.
+
+TABLE_PATH = DATA_DIR / 'min2phase_tables.bin'
+LIBRARY_PATH = ROOT / 'js' / 'min2phase.js'
+
+_export = r"""
+const min2phase = require(process.argv[1]);
+const data = Buffer.from(min2phase.exportTables());
+// Round trip: loading the export must give the same solutions.
+const states = [];
+for (let i = 0; i < 20; i++) states.push(min2phase.randomCube());
+const before = states.map(s => min2phase.solve(s));
+min2phase.loadTables(new Uint8Array(data).buffer);
+const after = states.map(s => min2phase.solve(s));
+if (before.join() !== after.join()) throw new Error('loaded tables give different solutions');
+process.stdout.write(data);
+"""
+
+def node_path():
+    node = shutil.which('node')
+    if node is None:
+        raise RuntimeError('Node.js is needed to run js/min2phase.js')
+    return node
+
+def export_tables():
+    result = subprocess.run([node_path(), '-e', _export, str(LIBRARY_PATH)],
+                            capture_output=True, check=False)
+    if result.returncode:
+        raise RuntimeError(result.stderr.decode('utf-8', 'replace').strip())
+    return result.stdout
+
+def main():
+    data = export_tables()
+    write_if_changed(TABLE_PATH, data)
+    print(f"Wrote {TABLE_PATH.name}: {len(data)} bytes.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
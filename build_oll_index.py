@@ -0,0 +1,40 @@
+import json
+import pathlib
+
+from fix_oll_data import MOVE_PERMS, apply_perm, case_state, compose, patterns_from_state
+from regenerate_cases import write_if_changed
+
+# --- OLL recognition index ---
+# Every case is expanded under the four U turns and keyed by its packed
+# top+ring bits (top pattern in the high 8 bits, ring pattern in the low 12),
+# so the solver page recognises a case in any orientation with one lookup.
+# The stored AUF is the U move to do before the case algorithm.
+
+_aufs = ['', "U'", 'U2', 'U']
+_u_turns = [compose(*[MOVE_PERMS['U']]*k) for k in range(4)]
+
+def pack_patterns(top, ring):
+    return int(top + ring, 2)
+
+def build_index(cases):
+    index = {}
+    for c in cases:
+        state = case_state(c['solution'])
+        for k, turn in enumerate(_u_turns):
+            key = pack_patterns(*patterns_from_state(apply_perm(state, turn)))
+            existing = index.get(key)
+            if existing is None:
+                index[key] = [c['id'], _aufs[k]]
+            elif existing[0] != c['id']:
+                raise ValueError(f"{c['id']} and {existing[0]} share pattern {key:020b}")
+    return index
+
+def main():
+    cases = json.loads(pathlib.Path('data/oll_cases.json').read_text())
+    index = build_index(cases)
+    out_path = pathlib.Path('data/oll_index.json')
+    write_if_changed(out_path, json.dumps({str(k): v for k, v in sorted(index.items())}, separators=(',', ':')))
+    print(f"Wrote {len(index)} OLL index entries for {len(cases)} cases.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import json
+import pathlib
+
+from fix_oll_data import MOVE_PERMS, apply_perm, case_state, pll_pattern_from_state
+from regenerate_cases import write_if_changed
+
+# --- PLL recognition table ---
+# Every case is expanded under all pre-AUFs, post-AUFs and whole-cube y
+# rotations. Keys come from pll_pattern_from_state (ring stickers labelled by
+# the centre they belong to), which makes the key independent of the
+# colour scheme, so the solver page recognises a case with one lookup.
+#
+# A y rotation never needs to be stored: for a last-layer permutation P,
+# y P y' has the same effect as U P U', so every rotated view is also
+# reached by one of the pre-AUFs and the table records that instead.
+
+_aufs = ['', 'U', 'U2', "U'"]
+_views = [MOVE_PERMS[m] for m in ('y', 'y2', "y'")]
+
+def _add(table, key, entry):
+    existing = table.setdefault(key, entry)
+    if existing[0] != entry[0]:
+        raise ValueError(f"{entry[0]} and {existing[0]} share ring {key}")
+
+def build_table(cases):
+    table = {}
+    rotated = []
+    for c in cases:
+        for pre in _aufs:
+            for post in _aufs:
+                state = case_state(c['solution'], pre, post)
+                _add(table, pll_pattern_from_state(state), [c['id'], pre, post])
+                rotated.extend((c['id'], apply_perm(state, v)) for v in _views)
+    for case_id, view in rotated:
+        key = pll_pattern_from_state(view)
+        if table.get(key, [None])[0] != case_id:
+            raise ValueError(f"{case_id} seen from a y rotation ({key}) is not covered by an AUF")
+    return table
+
+def main():
+    cases = json.loads(pathlib.Path('data/pll_cases.json').read_text())
+    table = build_table(cases)
+    out_path = pathlib.Path('data/pll_table.json')
+    write_if_changed(out_path, json.dumps(dict(sorted(table.items())), separators=(',', ':')))
+    print(f"Wrote {len(table)} PLL table entries for {len(cases)} cases.")
+
+if __name__ == '__main__':
+    main()
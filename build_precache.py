@@ -0,0 +1,136 @@
+import argparse
+import hashlib
+import html.parser
+import re
+import sys
+
+from regenerate_cases import ROOT, write_if_changed
+
+# --- Service worker precache manifest ---
+# service-worker.js precaches PRECACHE_MANIFEST, a list of [url, revision]
+# pairs for every file the site serves; the revision is a hash of the file's
+# content. Each asset is cached under its own revision, so a deploy only
+# re-downloads the files whose content changed. The list is regenerated from
+# the tree, never edited by hand; --check fails instead of writing when the
+# service worker is out of date, and both modes fail when a page links to a
+# local file that is not served.
+
+SERVICE_WORKER_PATH = ROOT / 'service-worker.js'
+# Directory -> suffixes of the files served from it.
+SITE_FILES = {
+    '.': ('.html', '.json'),
+    'css': ('.css',),
+    'js': ('.js',),
+    'data': ('.json', '.bin'),
+    'icons': ('.svg', '.png'),
+}
+# Served but left to the runtime cache: only the min2phase solver backend
+# fetches it, and it is by far the largest file.
+NOT_PRECACHED = {'data/min2phase_tables.bin'}
+REVISION_LENGTH = 10
+
+_manifest_block = re.compile(r'const PRECACHE_MANIFEST = \[.*?\n\];', re.S)
+_entry = re.compile(r"\['([^']*)', '([^']*)'\]")
+
+def site_files():
+    files = []
+    for folder, suffixes in SITE_FILES.items():
+        for path in sorted((ROOT / folder).iterdir()):
+            if path.is_file() and path.suffix in suffixes:
+                files.append(path.relative_to(ROOT).as_posix())
+    return files
+
+def revision(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:REVISION_LENGTH]
+
+def build_manifest():
+    # [(url, revision)]; './' is served as index.html.
+    manifest = [('./', revision(ROOT / 'index.html'))]
+    manifest += [(f'./{name}', revision(ROOT / name)) for name in site_files()
+                 if name not in NOT_PRECACHED]
+    return manifest
+
+def render(manifest):
+    lines = [f"  ['{url}', '{rev}']," for url, rev in manifest]
+    lines[-1] = lines[-1].rstrip(',')
+    return 'const PRECACHE_MANIFEST = [\n' + '\n'.join(lines) + '\n];'
+
+def current_manifest(text):
+    block = _manifest_block.search(text)
+    if not block:
+        raise ValueError(f'no PRECACHE_MANIFEST in {SERVICE_WORKER_PATH.name}')
+    return _entry.findall(block.group(0))
+
+class _LinkParser(html.parser.HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name in ('src', 'href') and value:
+                self.links.append(value)
+
+def local_links(page):
+    # Same-site files a page loads or links to (no anchors, schemes or
+    # query strings).
+    parser = _LinkParser()
+    parser.feed(page.read_text(encoding='utf-8'))
+    out = set()
+    for link in parser.links:
+        link = link.split('#')[0].split('?')[0]
+        if link and not re.match(r'[a-z]+:|//', link):
+            out.add('./' + link.removeprefix('./'))
+    return out
+
+def unlisted_links(manifest):
+    # {page: [links]} for local links that the manifest would not precache.
+    urls = {url for url, _ in manifest}
+    missing = {}
+    for page in sorted(ROOT.glob('*.html')):
+        links = sorted(local_links(page) - urls)
+        if links:
+            missing[page.name] = links
+    return missing
+
+def diff(old, new):
+    old, new = dict(old), dict(new)
+    lines = [f'  missing  {url}' for url in new if url not in old]
+    lines += [f'  extra    {url}' for url in old if url not in new]
+    lines += [f'  changed  {url}' for url in new if url in old and old[url] != new[url]]
+    return lines
+
+def write_manifest(manifest):
+    # Rewrites the manifest in service-worker.js; returns the diff lines.
+    text = SERVICE_WORKER_PATH.read_text(encoding='utf-8')
+    changes = diff(current_manifest(text), manifest)
+    write_if_changed(SERVICE_WORKER_PATH, _manifest_block.sub(lambda m: render(manifest), text))
+    return changes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Regenerate the service worker precache manifest.')
+    parser.add_argument('--check', action='store_true',
+                        help='only compare; exit with status 1 if service-worker.js is out of date')
+    args = parser.parse_args(argv)
+
+    manifest = build_manifest()
+    failed = False
+    for page, links in unlisted_links(manifest).items():
+        print(f"{page} links to files that are not served: {', '.join(links)}")
+        failed = True
+
+    if args.check:
+        changes = diff(current_manifest(SERVICE_WORKER_PATH.read_text(encoding='utf-8')), manifest)
+        if changes:
+            print(f'{SERVICE_WORKER_PATH.name} precache manifest is out of date:')
+            print('\n'.join(changes))
+            failed = True
+        else:
+            print(f'Precache manifest up to date ({len(manifest)} assets).')
+    elif not failed:
+        changes = write_manifest(manifest)
+        print(f'Precache manifest: {len(manifest)} assets, {len(changes)} changed.')
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+import argparse
+import os
+import random
+import struct
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import cubie
+from build_min2phase_tables import LIBRARY_PATH, TABLE_PATH, node_path
+from regenerate_cases import DATA_DIR, write_if_changed
+
+# --- Random-state scramble pool (data/scrambles.bin) ---
+# Each scramble reaches a uniformly random cube state (cubie.random_cube),
+# found by solving that state with min2phase under Node.js, using the
+# precomputed tables, and reading the solution backwards. The states are
+# split across one Node process per job. Every scramble is checked against
+# its state before it is written. js/timer.js draws from the pool:
+#
+#   header     'SCRM', u16 version, u16 move count (18), u32 scrambles
+#   scrambles  u8 length, then that many u8 indexes into FACE_MOVES
+#
+# Moves are ordered U U2 U' R R2 R' F F2 F' D D2 D' L L2 L' B B2 B'. The same
+# seed always gives the same pool.
+
+FORMAT_VERSION = 1
+POOL_PATH = DATA_DIR / 'scrambles.bin'
+DEFAULT_COUNT = 2000
+# Longest solution min2phase may return; random states need at most 20.
+MAX_LENGTH = 21
+
+_header = struct.Struct('<4sHHI')
+
+_solve = r"""
+const fs = require('fs');
+const min2phase = require(process.argv[1]);
+const data = fs.readFileSync(process.argv[2]);
+min2phase.loadTables(data.buffer.slice(data.byteOffset, data.byteOffset + data.length));
+const search = new min2phase.Search();
+const out = fs.readFileSync(0, 'utf8').split('\n').filter(Boolean).map((facelets) => {
+  const scramble = search.solution(facelets, Number(process.argv[3]), 1e9, 0, min2phase.INVERSE_SOLUTION);
+  if (scramble.startsWith('Error')) throw new Error(`${scramble} for ${facelets}`);
+  return scramble.trim().split(/\s+/).join(' ');
+});
+process.stdout.write(out.join('\n') + '\n');
+"""
+
+def random_states(count, seed):
+    rng = random.Random(seed)
+    return [cubie.random_cube(rng) for _ in range(count)]
+
+def solve_chunk(states):
+    # Scrambles (generators) for `states`, from one Node process.
+    if not TABLE_PATH.exists():
+        raise RuntimeError(f'{TABLE_PATH.name} is missing; run build_min2phase_tables.py first')
+    text = ''.join(cubie.to_facelets(s) + '\n' for s in states)
+    result = subprocess.run([node_path(), '-e', _solve, str(LIBRARY_PATH), str(TABLE_PATH), str(MAX_LENGTH)],
+                            input=text, capture_output=True, text=True, check=False)
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip())
+    return result.stdout.splitlines()
+
+def solve_all(states, jobs):
+    size = -(-len(states) // jobs)
+    chunks = [states[i:i + size] for i in range(0, len(states), size)]
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return [s for scrambles in pool.map(solve_chunk, chunks) for s in scrambles]
+
+def check_scrambles(states, scrambles):
+    if len(scrambles) != len(states):
+        raise ValueError(f'{len(scrambles)} scrambles for {len(states)} states')
+    for state, scramble in zip(states, scrambles):
+        if cubie.apply_alg(scramble) != state:
+            raise ValueError(f'{scramble!r} does not reach its state')
+
+def encode_pool(scrambles):
+    out = [_header.pack(b'SCRM', FORMAT_VERSION, len(cubie.FACE_MOVES), len(scrambles))]
+    for scramble in scrambles:
+        moves = [cubie.FACE_MOVES.index(m) for m in scramble.split()]
+        out.append(bytes([len(moves)] + moves))
+    return b''.join(out)
+
+def decode_pool(data):
+    magic, version, n_moves, count = _header.unpack_from(data)
+    if magic != b'SCRM' or version != FORMAT_VERSION or n_moves != len(cubie.FACE_MOVES):
+        raise ValueError(f'not a version {FORMAT_VERSION} scramble pool')
+    scrambles, pos = [], _header.size
+    for _ in range(count):
+        length = data[pos]
+        scrambles.append(' '.join(cubie.FACE_MOVES[m] for m in data[pos + 1:pos + 1 + length]))
+        pos += 1 + length
+    return scrambles
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write a pool of random-state scrambles for the timer.')
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT, help='scrambles in the pool')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for the states')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='Node processes to solve with')
+    args = parser.parse_args(argv)
+
+    states = random_states(args.count, args.seed)
+    scrambles = solve_all(states, max(1, min(args.jobs, args.count)))
+    check_scrambles(states, scrambles)
+    data = encode_pool(scrambles)
+    if decode_pool(data) != scrambles:
+        raise ValueError('scramble pool does not decode to its scrambles')
+    write_if_changed(POOL_PATH, data)
+    average = sum(len(s.split()) for s in scrambles) / len(scrambles)
+    print(f'Wrote {len(scrambles)} scrambles to {POOL_PATH.name}: {len(data)} bytes, '
+          f'{average:.2f} moves on average.')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
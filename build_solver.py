@@ -0,0 +1,752 @@
+import argparse
+import hashlib
+import re
+import sys
+
+import build_precache
+from regenerate_cases import ROOT, write_if_changed
+
+# --- js/solver.<hash>.js and js/solver-worker.<hash>.js ---
+# solver.html's script and the Web Worker that does its solving are
+# assembled from the fragments below, with one of two backends picked by
+# --backend:
+#
+#   cfop       rubiks-cube-solver.js: cross / F2L / OLL / PLL partitions
+#   min2phase  min2phase.js: near-optimal two-phase solution
+#
+# Both show the CFOP analysis (cross progress, OLL / PLL recognition) of the
+# entered state. Each bundle is minified and named after a hash of its
+# content, so browsers and the service worker never serve a stale copy;
+# solver.html is pointed at the new page script, older bundles are removed
+# and the service worker manifest is regenerated.
+
+JS_DIR = ROOT / 'js'
+PAGE_PATH = ROOT / 'solver.html'
+BUNDLE_NAME = 'solver.{}.js'
+WORKER_NAME = 'solver-worker.{}.js'
+BUNDLE_PATTERN = re.compile(r'js/solver(?:\.[0-9a-f]{8})?\.js')
+_generated = re.compile(r'solver(?:-worker)?\.[0-9a-f]{8}\.js')
+HASH_LENGTH = 8
+
+HEADER = r"""(() => {
+  const cube = document.getElementById('cube');
+  const scene = document.getElementById('scene');
+  const dragArea = document.querySelector('.board-wrap');
+  const solveBtn = document.getElementById('solve-btn');
+  const resetBtn = document.getElementById('reset-btn');
+  const solutionContainer = document.getElementById('solution-container');
+  const paletteColors = document.querySelectorAll('.palette-color');
+
+  let currentColor = 'white';
+"""
+
+CASE_DATA = r"""
+  let ollCases = new Map();
+  let ollIndex = {};
+  let pllCases = new Map();
+  let pllTable = {};
+
+  // Load Cases
+  fetch('data/oll_cases.json').then(r => r.json()).then(d => ollCases = new Map(d.map(c => [c.id, c]))).catch(e => console.error("Failed to load OLL", e));
+  // Packed top+ring bits -> [case id, AUF], built by build_oll_index.py
+  fetch('data/oll_index.json').then(r => r.json()).then(d => ollIndex = d).catch(e => console.error("Failed to load OLL index", e));
+  fetch('data/pll_cases.json').then(r => r.json()).then(d => pllCases = new Map(d.map(c => [c.id, c]))).catch(e => console.error("Failed to load PLL", e));
+  // Centre-labelled ring -> [case id, pre-AUF, post-AUF], built by build_pll_table.py
+  fetch('data/pll_table.json').then(r => r.json()).then(d => pllTable = d).catch(e => console.error("Failed to load PLL table", e));
+"""
+
+PALETTE_AND_DRAG = r"""
+  // --- Palette Logic ---
+  paletteColors.forEach(el => {
+    el.addEventListener('click', () => {
+      paletteColors.forEach(p => p.classList.remove('active'));
+      el.classList.add('active');
+      currentColor = el.dataset.color;
+    });
+  });
+
+  // --- 3D Rotation Logic ---
+  let rotX = -25;
+  let rotY = -45;
+  let isDragging = false;
+  let startX, startY;
+
+  const updateRotation = () => {
+    cube.style.transform = `rotateX(${rotX}deg) rotateY(${rotY}deg)`;
+  };
+
+  dragArea.addEventListener('mousedown', (e) => {
+    isDragging = true;
+    startX = e.clientX;
+    startY = e.clientY;
+    dragArea.style.cursor = 'grabbing';
+    e.preventDefault();
+  });
+
+  document.addEventListener('mousemove', (e) => {
+    if (!isDragging) return;
+    const dx = e.clientX - startX;
+    const dy = e.clientY - startY;
+    rotY += dx * 1.5;
+    rotX -= dy * 1.5;
+    startX = e.clientX;
+    startY = e.clientY;
+    updateRotation();
+  });
+
+  document.addEventListener('mouseup', () => {
+    isDragging = false;
+    dragArea.style.cursor = 'default';
+  });
+
+  // Touch support
+  dragArea.addEventListener('touchstart', (e) => {
+    isDragging = true;
+    startX = e.touches[0].clientX;
+    startY = e.touches[0].clientY;
+    e.preventDefault();
+  });
+
+  document.addEventListener('touchmove', (e) => {
+    if (!isDragging) return;
+    const dx = e.touches[0].clientX - startX;
+    const dy = e.touches[0].clientY - startY;
+    rotY += dx * 1.5;
+    rotX -= dy * 1.5;
+    startX = e.touches[0].clientX;
+    startY = e.touches[0].clientY;
+    updateRotation();
+  });
+
+  document.addEventListener('touchend', () => {
+    isDragging = false;
+  });
+"""
+
+CUBE_STATE = r"""
+  // --- Cube State ---
+  const faces = ['U', 'L', 'F', 'R', 'B', 'D'];
+  const faceEls = {};
+  faces.forEach(f => faceEls[f] = cube.querySelector(`.face-${f.toLowerCase()}`));
+
+  // 54 stickers state. Map "FaceIndex" -> Color
+  const cubeState = new Map();
+
+  const getColorForFace = (f) => {
+    switch(f) {
+      case 'U': return 'yellow';
+      case 'F': return 'green';
+      case 'R': return 'orange';
+      case 'B': return 'blue';
+      case 'L': return 'red';
+      case 'D': return 'white';
+    }
+    return '';
+  };
+
+  const createStickers = () => {
+    faces.forEach(f => {
+      const faceEl = faceEls[f];
+      faceEl.innerHTML = '';
+      for (let i = 0; i < 9; i++) {
+        const el = document.createElement('div');
+        el.className = 'sticker';
+        const id = `${f}${i}`;
+        el.dataset.id = id;
+
+        // Centers are fixed
+        if (i === 4) {
+          const centerColor = getColorForFace(f);
+          el.classList.add(centerColor);
+          el.style.cursor = 'default';
+          cubeState.set(id, centerColor);
+        } else {
+          el.addEventListener('click', handleStickerClick);
+        }
+        faceEl.appendChild(el);
+      }
+    });
+  };
+
+  const handleStickerClick = (e) => {
+    const el = e.target;
+    const id = el.dataset.id;
+
+    // Remove old color class
+    ['white', 'yellow', 'green', 'blue', 'red', 'orange'].forEach(c => el.classList.remove(c));
+
+    // Add new color
+    el.classList.add(currentColor);
+    cubeState.set(id, currentColor);
+  };
+
+  // Face letters of the entered state, face by face in `faceOrder`; each
+  // sticker is named after the face whose center has its color.
+  const faceletString = (faceOrder) => {
+    const colorToFace = {};
+    for (const f of faceOrder) colorToFace[cubeState.get(`${f}4`)] = f;
+    let out = "";
+    for (const f of faceOrder) {
+      for (let i = 0; i < 9; i++) {
+        const id = `${f}${i}`;
+        const color = cubeState.get(id);
+        if (!color) throw new Error(`Missing color at ${id}`);
+        out += colorToFace[color];
+      }
+    }
+    return out;
+  };
+"""
+
+VALIDATION = r"""
+  const validateState = () => {
+    const counts = { white:0, yellow:0, green:0, blue:0, red:0, orange:0 };
+    for (const color of cubeState.values()) {
+      if (counts[color] !== undefined) counts[color]++;
+    }
+
+    const missing = [];
+    for (const [c, count] of Object.entries(counts)) {
+      if (count !== 9) missing.push(`${c}: ${count}/9`);
+    }
+
+    if (missing.length > 0) {
+      return `Invalid State:\n${missing.join('\n')}`;
+    }
+    return null;
+  };
+"""
+
+CFOP_ANALYSIS = r"""
+  // --- CFOP Analysis ---
+  const analyzeCFOP = () => {
+    const report = [];
+
+    // 1. Cross Check (White Cross on D)
+    // Edges: DF (D1, F7), DR (D5, R7), DB (D7, B7), DL (D3, L7)
+    // D face: 0 1 2 (top), 3 4 5 (mid), 6 7 8 (bottom).
+    // D1 is top-mid (adj F). D5 is right-mid (adj R). D7 is bottom-mid (adj B). D3 is left-mid (adj L).
+    // F7, R7, B7 and L7 are the bottom-mid stickers next to D.
+    const checkEdge = (dId, fId, dColor, fColor) => {
+      return cubeState.get(dId) === dColor && cubeState.get(fId) === fColor;
+    };
+
+    const dColor = 'white'; // D center
+    const fColor = 'green'; // F center
+    const rColor = 'orange';
+    const bColor = 'blue';
+    const lColor = 'red';
+
+    const crossEdges = [
+      checkEdge('D1', 'F7', dColor, fColor),
+      checkEdge('D5', 'R7', dColor, rColor),
+      checkEdge('D7', 'B7', dColor, bColor),
+      checkEdge('D3', 'L7', dColor, lColor)
+    ];
+
+    const solvedCrossEdges = crossEdges.filter(x => x).length;
+    if (solvedCrossEdges === 4) {
+      report.push("✅ Cross is Solved");
+    } else {
+      report.push(`⚠️ Cross: ${solvedCrossEdges}/4 edges solved`);
+    }
+
+    // 2. OLL Identification (Yellow on U)
+    // OLL Pattern: U face colors (U0..U8 without the center) + ring colors.
+    const uColor = 'yellow';
+    let uPattern = "";
+    for(let i=0; i<9; i++) {
+      if (i===4) continue; // Skip center
+      uPattern += (cubeState.get(`U${i}`) === uColor ? "1" : "0");
+    }
+
+    // Ring pattern for OLL (12 bits)
+    // Same order as ring_mapping in fix_oll_data.py:
+    // B(2,1,0) L(0,1,2) R(2,1,0) F(0,1,2)
+    // Bit is 1 if color == uColor (Yellow), else 0.
+    let ringPattern = "";
+    const ringIndices = [
+      ['B',2], ['B',1], ['B',0],
+      ['L',0], ['L',1], ['L',2],
+      ['R',2], ['R',1], ['R',0],
+      ['F',0], ['F',1], ['F',2]
+    ];
+
+    for(const [f, i] of ringIndices) {
+      ringPattern += (cubeState.get(`${f}${i}`) === uColor ? "1" : "0");
+    }
+
+    // Find OLL
+    // The index already contains every case under all four U turns,
+    // so one lookup recognises the case in any orientation.
+    const ollMatch = ollIndex[parseInt(uPattern + ringPattern, 2)];
+    if (ollMatch) {
+      const [ollId, auf] = ollMatch;
+      const ollCase = ollCases.get(ollId);
+      report.push(`💡 OLL Case: ${ollId}`);
+      if (ollCase) report.push(`   Alg: ${auf ? auf + ' ' : ''}${ollCase.solution}`);
+    } else if (uPattern === "11111111") {
+      report.push("✅ OLL is Solved");
+
+      // 3. PLL Identification
+      // Ring colors relabelled by center: F=A, R=B, B=C, L=D.
+      const centerToChar = {
+        [cubeState.get('F4')]: 'A',
+        [cubeState.get('R4')]: 'B',
+        [cubeState.get('B4')]: 'C',
+        [cubeState.get('L4')]: 'D'
+      };
+
+      let pllString = "";
+      // Same ring order as the OLL pattern (ring_mapping in fix_oll_data.py)
+      for(const [f, i] of ringIndices) {
+        pllString += centerToChar[cubeState.get(`${f}${i}`)] || '?';
+      }
+
+      const isSolved =
+        cubeState.get('F0')===cubeState.get('F1') && cubeState.get('F1')===cubeState.get('F2') &&
+        cubeState.get('R0')===cubeState.get('R1') && cubeState.get('R1')===cubeState.get('R2') &&
+        cubeState.get('B0')===cubeState.get('B1') && cubeState.get('B1')===cubeState.get('B2') &&
+        cubeState.get('L0')===cubeState.get('L1') && cubeState.get('L1')===cubeState.get('L2');
+
+      if (isSolved) {
+        report.push("✅ PLL is Solved (Cube Solved)");
+      } else {
+        // The table covers every AUF and y rotation, so this is a single lookup.
+        const pllMatch = pllTable[pllString];
+        const pllCase = pllMatch && pllCases.get(pllMatch[0]);
+        if (pllCase) {
+          const [pllId, preAuf, postAuf] = pllMatch;
+          report.push(`💡 PLL Case: ${pllId}`);
+          report.push(`   Alg: ${[preAuf, pllCase.solution, postAuf].filter(Boolean).join(' ')}`);
+        } else {
+          report.push("ℹ️ PLL Stage (no matching case)");
+        }
+      }
+    }
+
+    return report;
+  };
+"""
+
+# Solving runs in a Web Worker (js/solver-worker.<hash>.js) assembled from the
+# worker fragments below, so the page stays responsive during a solve. A
+# backend's worker part defines solveFacelets(facelets) -> result (or a
+# promise of it), taking the state as face letters in U R F D L B order; its
+# page part defines renderSolution(result, facelets) -> solution HTML.
+WORKER_BACKENDS = {
+    'cfop': r"""(() => {
+  importScripts('rubiks-cube-solver.js');
+
+  // rubiks-cube-solver expects lowercase face letters in F R U D L B order
+  const toSolverOrder = (facelets) =>
+    ['F', 'R', 'U', 'D', 'L', 'B'].map(f => facelets.substr('URFDLB'.indexOf(f) * 9, 9)).join('').toLowerCase();
+
+  const solveFacelets = (facelets) => {
+    const solver = new rubiksCubeSolver.Solver(toSolverOrder(facelets));
+    solver.solve();
+    return solver.getPartitions();
+  };
+""",
+    'min2phase': r"""(() => {
+  importScripts('min2phase.js');
+
+  // The move and pruning tables are precomputed by build_min2phase_tables.py
+  // and loaded once when the worker starts; min2phase only builds them itself
+  // when the file cannot be loaded.
+  const ready = fetch('../data/min2phase_tables.bin')
+    .then(r => {
+      if (!r.ok) throw new Error(`HTTP ${r.status}`);
+      return r.arrayBuffer();
+    })
+    .then(buffer => min2phase.loadTables(buffer))
+    .catch(e => {
+      console.error("Failed to load min2phase tables", e);
+      min2phase.initFull();
+    });
+
+  const solveFacelets = (facelets) => ready.then(() => {
+    const solution = min2phase.solve(facelets).trim();
+    // min2phase reports bad states as "Error N" rather than throwing
+    if (solution.startsWith('Error')) throw new Error(solution);
+    return solution;
+  });
+""",
+}
+
+WORKER_FOOTER = r"""
+  // Requests are { id, facelets }; each reply echoes the id.
+  self.onmessage = (e) => {
+    const { id, facelets } = e.data;
+    Promise.resolve(facelets).then(solveFacelets)
+      .then(result => self.postMessage({ id, result }))
+      .catch(err => self.postMessage({ id, error: String((err && err.message) || err) }));
+  };
+})();
+"""
+
+RENDERERS = {
+    'cfop': r"""
+  // --- Solution display (rubiks-cube-solver, CFOP) ---
+  const formatMoves = (moves) => {
+    if (!moves) return "None";
+    if (Array.isArray(moves)) return moves.join("<br>");
+    return moves;
+  };
+
+  const steps = [
+    ['cross', '1. Cross'],
+    ['f2l', '2. F2L (First Two Layers)'],
+    ['oll', '3. OLL (Orientation)'],
+    ['pll', '4. PLL (Permutation)']
+  ];
+
+  const renderSolution = (solution) => {
+    let html = `
+      <div class="solution-section">
+        <h3>CFOP Solution</h3>
+    `;
+
+    let totalMoves = 0;
+    for (const [phase, title] of steps) {
+      html += `
+        <div class="solution-step">
+          <h4>${title}</h4>
+          <div class="solution-moves">${formatMoves(solution[phase])}</div>
+        </div>
+      `;
+      const p = solution[phase];
+      if (Array.isArray(p)) {
+        p.forEach(s => totalMoves += s.split(' ').length);
+      } else if (typeof p === 'string') {
+        totalMoves += p.split(' ').length;
+      }
+    }
+
+    html += `
+        <div class="solution-step" style="margin-top: 15px; border-top: 1px solid var(--border); padding-top: 10px;">
+          <h4>Total Moves: ${totalMoves}</h4>
+        </div>
+    `;
+    return html;
+  };
+""",
+    'min2phase': r"""
+  // --- Solution display (min2phase) ---
+  const renderSolution = (solution, facelets) => {
+    const length = solution ? solution.split(/\s+/).length : 0;
+    return `
+      <div class="solution-section">
+        <div class="solution-step">
+          <h4>Optimal Solution (${length} moves)</h4>
+          <div class="solution-moves">${solution || 'Cube is already solved!'}</div>
+        </div>
+        <div class="solution-step" style="margin-top: 15px; border-top: 1px solid var(--border); padding-top: 10px;">
+          <h4>Debug Info</h4>
+          <p class="muted" style="font-size: 0.8em; word-break: break-all;">
+            Facelet String: ${facelets}
+          </p>
+        </div>
+    `;
+  };
+""",
+}
+
+SOLVER_POOL = r"""
+  // --- Solver worker pool ---
+  // A warm spare worker is always kept: a solve goes to an idle worker, and
+  // starting a new solve (or resetting) while one is running terminates the
+  // stale worker instead of waiting for it.
+  const WORKER_URL = '{worker_url}';
+  const idleWorkers = [];
+  let running = null; // { worker, id, resolve, reject }
+  let nextRequestId = 0;
+
+  const spawnWorker = () => {
+    if (typeof Worker === 'undefined') return;
+    idleWorkers.push(new Worker(WORKER_URL));
+  };
+
+  const cancelSolve = () => {
+    if (!running) return;
+    running.worker.terminate();
+    const error = new Error('Solve cancelled');
+    error.cancelled = true;
+    running.reject(error);
+    running = null;
+  };
+
+  const requestSolve = (facelets) => new Promise((resolve, reject) => {
+    cancelSolve();
+    if (!idleWorkers.length) spawnWorker();
+    const worker = idleWorkers.shift();
+    if (!worker) {
+      reject(new Error('This browser cannot run the solver (no Web Worker support).'));
+      return;
+    }
+    const id = ++nextRequestId;
+    running = { worker, id, resolve, reject };
+    const finish = () => {
+      running = null;
+      idleWorkers.push(worker);
+    };
+    worker.onmessage = (e) => {
+      if (!running || running.id !== e.data.id) return;
+      finish();
+      if (e.data.error) reject(new Error(e.data.error));
+      else resolve(e.data.result);
+    };
+    worker.onerror = (e) => {
+      if (!running || running.id !== id) return;
+      e.preventDefault();
+      running = null;
+      worker.terminate();
+      reject(new Error(e.message || 'Solver worker failed'));
+    };
+    worker.postMessage({ id, facelets });
+    if (!idleWorkers.length) spawnWorker();
+  });
+
+  spawnWorker();
+"""
+
+FOOTER = r"""
+  const solve = () => {
+    const error = validateState();
+    if (error) {
+      alert(error);
+      return;
+    }
+
+    solutionContainer.innerHTML = '<div class="solution-section"><p>Analyzing...</p></div>';
+
+    let facelets;
+    Promise.resolve().then(() => {
+      // Order: U1-U9, R1-R9, F1-F9, D1-D9, L1-L9, B1-B9
+      facelets = faceletString(['U', 'R', 'F', 'D', 'L', 'B']);
+      return requestSolve(facelets);
+    }).then((result) => {
+      let html = renderSolution(result, facelets);
+
+      const cfopReport = analyzeCFOP();
+      if (cfopReport.length > 0) {
+        html += `
+          <div class="solution-step" style="margin-top:15px; border-top:1px solid var(--border); padding-top:10px;">
+            <h4>CFOP Analysis</h4>
+            <ul style="padding-left: 20px; margin: 5px 0;">
+              ${cfopReport.map(line => `<li>${line}</li>`).join('')}
+            </ul>
+          </div>
+        `;
+      }
+
+      solutionContainer.innerHTML = html + '</div>';
+    }).catch((e) => {
+      // A newer solve (or a reset) has taken over the output
+      if (e.cancelled) return;
+      console.error(e);
+      solutionContainer.innerHTML = `
+        <div class="solution-section">
+          <p class="error" style="color: var(--accent-strong); font-weight: bold;">Unsolvable state.</p>
+          <p class="muted">Error details: ${e.message || e}</p>
+          <p class="muted" style="font-size:0.9em">Ensure all centers are correct and no pieces are twisted.</p>
+        </div>
+      `;
+    });
+  };
+
+  solveBtn.addEventListener('click', solve);
+  resetBtn.addEventListener('click', () => {
+    cancelSolve();
+    cubeState.clear();
+    createStickers();
+    solutionContainer.innerHTML = '<div class="solution-section"><p class="muted">Enter cube state to see solution.</p></div>';
+  });
+
+  createStickers();
+
+})();
+"""
+
+def assemble(backend, worker_url):
+    return ''.join([HEADER, CASE_DATA, PALETTE_AND_DRAG, CUBE_STATE, VALIDATION,
+                    CFOP_ANALYSIS, RENDERERS[backend],
+                    SOLVER_POOL.replace('{worker_url}', worker_url), FOOTER])
+
+def assemble_worker(backend):
+    return WORKER_BACKENDS[backend] + WORKER_FOOTER
+
+# --- Minifier ---
+# Comments and indentation go, and spaces next to punctuation are dropped.
+# Line breaks are kept so automatic semicolon insertion is unaffected, and
+# string / template literal contents are copied verbatim (templates may nest
+# through ${...}). A '/' starts a regex literal only after an operator or an
+# opening bracket, which is all the fragments need.
+
+_word = re.compile(r'[A-Za-z0-9_$\\]')
+_regex_before = set('(,=:[!&|?{};+-*%<>~^')
+_no_break_after = set('{([;,=:?&|+-*<>')
+_no_break_before = set('})];,.:?')
+
+def _squeeze(code):
+    # Whitespace outside literals: spaces only where two words or two
+    # same-sign operators (a - -b) would merge, line breaks only where ASI
+    # could depend on them.
+    out = []
+    for ch in code:
+        if ch in ' \t\r\n':
+            if out and out[-1] in ' \n':
+                if ch == '\n':
+                    out[-1] = '\n'
+                continue
+            out.append('\n' if ch == '\n' else ' ')
+            continue
+        if out and out[-1] == ' ' and len(out) > 1 and not (
+                _word.match(out[-2]) and _word.match(ch) or out[-2] == ch and ch in '+-'):
+            out.pop()
+        elif out and out[-1] == '\n' and (ch in _no_break_before or len(out) > 1 and out[-2] in _no_break_after):
+            out.pop()
+        out.append(ch)
+    return ''.join(out)
+
+def minify(source):
+    pieces = []   # (is_code, text)
+    code = []
+    stack = []    # open template literals / their ${ } brace depth
+    i, n = 0, len(source)
+
+    def flush():
+        if code:
+            pieces.append((True, ''.join(code)))
+            code.clear()
+
+    def last_significant():
+        for is_code, text in reversed(pieces + [(True, ''.join(code))]):
+            stripped = text.rstrip()
+            if stripped:
+                return stripped[-1] if is_code else 'x'
+        return ''
+
+    while i < n:
+        ch = source[i]
+        if stack and stack[-1] == '`':
+            # Inside a template literal.
+            j = i
+            while j < n and source[j] != '`' and not source.startswith('${', j):
+                j += 2 if source[j] == '\\' else 1
+            pieces.append((False, source[i:j]))
+            if source.startswith('${', j):
+                pieces.append((False, '${'))
+                stack.append(0)
+                i = j + 2
+            else:
+                pieces.append((False, '`'))
+                stack.pop()
+                i = j + 1
+            continue
+        if ch == '`':
+            flush()
+            pieces.append((False, '`'))
+            stack.append('`')
+            i += 1
+        elif ch in '\'"':
+            j = i + 1
+            while source[j] != ch:
+                j += 2 if source[j] == '\\' else 1
+            flush()
+            pieces.append((False, source[i:j + 1]))
+            i = j + 1
+        elif source.startswith('//', i):
+            while i < n and source[i] != '\n':
+                i += 1
+        elif source.startswith('/*', i):
+            i = source.index('*/', i) + 2
+            code.append(' ')
+        elif ch == '/' and last_significant() in _regex_before:
+            j, in_class = i + 1, False
+            while in_class or source[j] != '/':
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] in '[]':
+                    in_class = source[j] == '['
+                j += 1
+            j += 1
+            while j < n and source[j].isalpha():
+                j += 1
+            flush()
+            pieces.append((False, source[i:j]))
+            i = j
+        elif stack and ch in '{}':
+            if ch == '{':
+                stack[-1] += 1
+            elif stack[-1] == 0:
+                # End of a ${...} substitution: back inside the template.
+                flush()
+                pieces.append((False, '}'))
+                stack.pop()
+                i += 1
+                continue
+            else:
+                stack[-1] -= 1
+            code.append(ch)
+            i += 1
+        else:
+            code.append(ch)
+            i += 1
+    flush()
+    if stack:
+        raise ValueError('unterminated template literal')
+
+    out = []
+    for is_code, text in pieces:
+        # Literals start and end with a quote, so spaces beside them are
+        # never needed.
+        out.append(_squeeze(text).strip(' ') if is_code else text)
+    return ''.join(out).strip() + '\n'
+
+def content_hash(data):
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+
+def _repoint(path, name):
+    # Point every reference to a solver bundle in `path` at js/<name>.
+    text = path.read_text(encoding='utf-8')
+    new, count = BUNDLE_PATTERN.subn(f'js/{name}', text)
+    if not count:
+        raise ValueError(f'no solver script reference in {path.name}')
+    return write_if_changed(path, new)
+
+def _write_bundle(template, source, minified):
+    bundle = minify(source) if minified else source
+    path = JS_DIR / template.format(content_hash(bundle))
+    return path, len(source), len(bundle), write_if_changed(path, bundle)
+
+def build(backend, minified=True):
+    # [(path, source size, bundle size)] for the worker and the page script;
+    # the page bundle names the worker, so its hash covers both.
+    worker = _write_bundle(WORKER_NAME, assemble_worker(backend), minified)
+    page = _write_bundle(BUNDLE_NAME, assemble(backend, f'js/{worker[0].name}'), minified)
+    changed = worker[3] or page[3]
+    for old in JS_DIR.glob('solver*.js'):
+        if old not in (worker[0], page[0]) and _generated.fullmatch(old.name):
+            old.unlink()
+            changed = True
+    changed |= _repoint(PAGE_PATH, page[0].name)
+    build_precache.write_manifest(build_precache.build_manifest())
+    return [worker[:3], page[:3]], changed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the solver page script and its worker.')
+    parser.add_argument('--backend', choices=sorted(WORKER_BACKENDS), default='cfop',
+                        help='solving library used by solver.html (default cfop)')
+    parser.add_argument('--no-minify', action='store_true',
+                        help='write the assembled source as is (for debugging)')
+    args = parser.parse_args(argv)
+
+    bundles, changed = build(args.backend, not args.no_minify)
+    status = 'Wrote' if changed else 'Unchanged:'
+    for path, source_size, size in bundles:
+        print(f"{status} js/{path.name} ({args.backend}): {size} bytes from {source_size}.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
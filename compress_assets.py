@@ -0,0 +1,131 @@
+import argparse
+import datetime
+import gzip
+import json
+import subprocess
+import sys
+
+from build_precache import SITE_FILES, site_files
+from regenerate_cases import ROOT, write_if_changed
+
+# --- Precompressed assets and size report ---
+# Every precached asset gets a `<file>.gz` sibling at maximum compression, for
+# static hosts that serve precompressed variants (e.g. nginx gzip_static). The
+# output is byte-for-byte reproducible (no name or timestamp in the header),
+# so unchanged assets are not rewritten. Variants that would not be smaller
+# are skipped, and stale ones removed.
+#
+# Each run with a different set of sizes appends a snapshot to
+# benchmarks/asset_sizes.json ({date, commit, files: {path: [raw, gzip]}}),
+# and the report shows the change against the previous snapshot. Rerun it
+# whenever assets change, so the last snapshot always matches the tree;
+# --check only compares (no files written) and fails when it does not.
+
+HISTORY_PATH = ROOT / 'benchmarks' / 'asset_sizes.json'
+LEVEL = 9
+
+def compress(data):
+    return gzip.compress(data, compresslevel=LEVEL, mtime=0)
+
+def compress_all(names, write=True):
+    # {name: [raw bytes, gzip bytes]}; gzip bytes equal raw when no variant
+    # is kept. With write=False only the sizes are computed.
+    sizes = {}
+    for name in names:
+        path = ROOT / name
+        data = path.read_bytes()
+        packed = compress(data)
+        target = path.with_name(path.name + '.gz')
+        if len(packed) < len(data):
+            if write:
+                write_if_changed(target, packed)
+            sizes[name] = [len(data), len(packed)]
+        else:
+            if write:
+                target.unlink(missing_ok=True)
+            sizes[name] = [len(data), len(data)]
+    return sizes
+
+def remove_orphans(names):
+    # .gz files in the asset folders whose source is no longer an asset.
+    keep = {ROOT / f'{name}.gz' for name in names}
+    removed = []
+    for folder in SITE_FILES:
+        for path in sorted((ROOT / folder).glob('*.gz')):
+            if path not in keep:
+                path.unlink()
+                removed.append(path.relative_to(ROOT).as_posix())
+    return removed
+
+def current_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+def load_history():
+    if HISTORY_PATH.exists():
+        return json.loads(HISTORY_PATH.read_text())
+    return []
+
+def _delta(now, before):
+    if before is None:
+        return 'new'
+    change = now - before
+    return f'{change:+d}' if change else ''
+
+def report(sizes, previous):
+    rows = sorted(sizes.items(), key=lambda item: -item[1][0])
+    width = max(len(name) for name in sizes)
+    print(f"{'asset':<{width}}  {'raw':>9}  {'gzip':>9}  ratio  {'change (gzip)':>13}")
+    for name, (raw, packed) in rows:
+        before = previous.get(name)
+        print(f'{name:<{width}}  {raw:>9,}  {packed:>9,}  {packed / raw:>5.0%}  '
+              f'{_delta(packed, before and before[1]):>13}')
+    for name in sorted(set(previous) - set(sizes)):
+        print(f"{name:<{width}}  {'':>9}  {'':>9}  {'':>5}  {'removed':>13}")
+    raw_total = sum(raw for raw, _ in sizes.values())
+    packed_total = sum(packed for _, packed in sizes.values())
+    before_total = sum(packed for _, packed in previous.values()) if previous else None
+    print(f"{'total':<{width}}  {raw_total:>9,}  {packed_total:>9,}  {packed_total / raw_total:>5.0%}  "
+          f'{_delta(packed_total, before_total):>13}')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write .gz variants of the site assets and report their sizes.')
+    parser.add_argument('--no-record', action='store_true',
+                        help='do not append this run to the size history')
+    parser.add_argument('--check', action='store_true',
+                        help='only compare; exit with status 1 if the last snapshot is out of date')
+    args = parser.parse_args(argv)
+
+    names = site_files()
+    history = load_history()
+    previous = history[-1]['files'] if history else {}
+    if args.check:
+        sizes = compress_all(names, write=False)
+        if sizes != previous:
+            print(f'{HISTORY_PATH.relative_to(ROOT)} is out of date:')
+            report(sizes, previous)
+            return 1
+        print(f'Asset size history up to date ({len(sizes)} assets).')
+        return 0
+
+    sizes = compress_all(names)
+    remove_orphans(names)
+    report(sizes, previous)
+    if not args.no_record and sizes != previous:
+        history.append({
+            'date': datetime.date.today().isoformat(),
+            'commit': current_commit(),
+            'files': sizes,
+        })
+        HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # One snapshot per line keeps the history diffable.
+        HISTORY_PATH.write_text('[\n' + ',\n'.join(json.dumps(snap) for snap in history) + '\n]\n')
+        print(f'Recorded snapshot {len(history)} in {HISTORY_PATH.relative_to(ROOT)}')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+import numpy as np
+
+from fix_oll_data import (
+    MOVE_PERMS, colors, compile_alg, faces, ring_mapping, solved, top_order,
+)
+
+# --- Batched simulator ---
+# N cube states live in one (N, 54) uint8 array using the same sticker layout
+# as fix_oll_data. Stickers are stored as the index of their colour's home face
+# in `faces` (0 = U/yellow ... 5 = B/blue). Every move or compiled algorithm is
+# a single gather over axis 1.
+
+color_codes = {colors[f]: i for i, f in enumerate(faces)}
+code_colors = [colors[f] for f in faces]
+
+_u_code = color_codes[colors['U']]
+_top_idx = np.array(top_order, dtype=np.intp)
+_ring_idx = np.array(ring_mapping, dtype=np.intp)
+
+def encode(states):
+    # Sticker tuples from fix_oll_data -> (N, 54) uint8 array.
+    return np.array([[color_codes[c] for c in s] for s in states], dtype=np.uint8)
+
+def decode(batch):
+    return [tuple(code_colors[c] for c in row) for row in batch.tolist()]
+
+def solved_batch(n):
+    return np.tile(encode([solved()]), (n, 1))
+
+def apply_perm_batch(batch, perm):
+    return np.take(batch, np.asarray(perm, dtype=np.intp), axis=1)
+
+def apply_move_batch(batch, move):
+    return apply_perm_batch(batch, MOVE_PERMS[move])
+
+def apply_alg_batch(batch, alg, invert=False):
+    return apply_perm_batch(batch, compile_alg(alg, invert))
+
+def random_moves_batch(batch, moves, length, rng=None):
+    # Applies `length` independently drawn moves from `moves` to every row.
+    rng = np.random.default_rng(rng)
+    table = np.array([MOVE_PERMS[m] for m in moves], dtype=np.intp)
+    for _ in range(length):
+        choice = rng.integers(len(moves), size=len(batch))
+        batch = np.take_along_axis(batch, table[choice], axis=1)
+    return batch
+
+def patterns_from_batch(batch):
+    # Batched patterns_from_state: (N, 8) top bits and (N, 12) ring bits.
+    top = (batch[:, _top_idx] == _u_code).astype(np.uint8)
+    ring = (batch[:, _ring_idx] == _u_code).astype(np.uint8)
+    return top, ring
+
+def pattern_strings(bits):
+    return [''.join(map(str, row)) for row in bits.tolist()]
+
+def is_solved_batch(batch):
+    # True where every face is a single colour (any whole-cube orientation).
+    by_face = batch.reshape(len(batch), 6, 9)
+    return (by_face == by_face[:, :, 4:5]).all(axis=(1, 2))
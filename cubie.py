@@ -0,0 +1,205 @@
+import random
+from functools import lru_cache
+from operator import getitem, itemgetter
+
+from fix_oll_data import (
+    MOVE_PERMS, apply_perm, colors, compile_alg, corner_facelets, edge_facelets, faces,
+    normalize_alg, reorient, solved, sticker,
+)
+
+# --- Cubie-level cube model ---
+# A cube is a tuple (cp, co, ep, eo): corner permutation and twist (8 each),
+# edge permutation and flip (12 each). cp[i] is the corner piece sitting at
+# position i and co[i] its twist (the index of its U/D sticker in that
+# position's clockwise facelet list); edges likewise with flips. Positions and
+# pieces use the order of corner_facelets / edge_facelets, which is also the
+# min2phase (Kociemba) order: URF UFL ULB UBR DFR DLF DBL DRB and
+# UR UF UL UB DR DF DL DB FR FL BL BR.
+#
+# States are always relative to the centres, so whole-cube rotations are
+# invisible at this level and only the 18 face turns have move tables.
+
+CORNERS = list(corner_facelets)
+EDGES = list(edge_facelets)
+_corner_idx = list(corner_facelets.values())
+_edge_idx = list(edge_facelets.values())
+
+SOLVED = (tuple(range(8)), (0,)*8, tuple(range(12)), (0,)*12)
+
+# Facelet strings as built by solver.js for min2phase: faces in URFDLB order,
+# each face read row by row exactly like the sticker model.
+FACELET_ORDER = 'URFDLB'
+_facelet_stickers = [sticker(f, i) for f in FACELET_ORDER for i in range(9)]
+_centers = {f: sticker(f, 4) for f in faces}
+
+# Piece lookup by the set of faces it shows; the home facelets of each piece
+# give its reference (twist/flip 0) face.
+_home_faces = {i: f for f in faces for i in range(sticker(f, 0), sticker(f, 9))}
+_corner_home = [[_home_faces[i] for i in idx] for idx in _corner_idx]
+_edge_home = [[_home_faces[i] for i in idx] for idx in _edge_idx]
+_corner_by_faces = {frozenset(fs): p for p, fs in enumerate(_corner_home)}
+_edge_by_faces = {frozenset(fs): p for p, fs in enumerate(_edge_home)}
+
+def _parity(perm):
+    # Permutation parity: (length - number of cycles) mod 2.
+    seen = [False]*len(perm)
+    cycles = 0
+    for i in range(len(perm)):
+        if not seen[i]:
+            cycles += 1
+            j = i
+            while not seen[j]:
+                seen[j] = True
+                j = perm[j]
+    return (len(perm) - cycles) % 2
+
+def _read_pieces(state, face_of, facelets, by_faces, home):
+    perm, ori = [], []
+    for idx in facelets:
+        shown = [face_of.get(state[i]) for i in idx]
+        piece = by_faces.get(frozenset(shown))
+        if piece is None or len(set(shown)) != len(shown):
+            raise ValueError(f'invalid piece {shown}')
+        perm.append(piece)
+        ori.append(shown.index(home[piece][0]))
+    return tuple(perm), tuple(ori)
+
+def verify(cube):
+    # Raises ValueError unless `cube` is a solvable state.
+    cp, co, ep, eo = cube
+    if sorted(cp) != list(range(8)) or sorted(ep) != list(range(12)):
+        raise ValueError('every piece must appear exactly once')
+    if sum(co) % 3:
+        raise ValueError('corner twist does not sum to zero')
+    if sum(eo) % 2:
+        raise ValueError('edge flip does not sum to zero')
+    if _parity(cp) != _parity(ep):
+        raise ValueError('corner and edge permutation parity differ')
+    return cube
+
+def random_cube(rng=random):
+    # Uniformly random solvable state: free permutations and orientations,
+    # then the last twist and flip set so the sums are zero, and two edges
+    # swapped when the permutation parities differ.
+    cp, ep = list(range(8)), list(range(12))
+    rng.shuffle(cp)
+    rng.shuffle(ep)
+    co = [rng.randrange(3) for _ in range(7)]
+    eo = [rng.randrange(2) for _ in range(11)]
+    co.append(-sum(co) % 3)
+    eo.append(sum(eo) % 2)
+    if _parity(cp) != _parity(ep):
+        ep[0], ep[1] = ep[1], ep[0]
+    return tuple(cp), tuple(co), tuple(ep), tuple(eo)
+
+_color_faces = {c: f for f, c in colors.items()}
+
+def from_stickers(state, check=True):
+    # Cubie state of a 54-sticker state. States in the sticker model's colour
+    # scheme are first turned back to the home orientation; any other labels
+    # (e.g. face letters) are read with each centre naming its own face.
+    face_of = {state[i]: f for f, i in _centers.items()}
+    if len(face_of) != 6:
+        raise ValueError('centres must show six different colours')
+    if set(face_of) == set(_color_faces) and face_of != _color_faces:
+        state, face_of = reorient(state), _color_faces
+    cp, co = _read_pieces(state, face_of, _corner_idx, _corner_by_faces, _corner_home)
+    ep, eo = _read_pieces(state, face_of, _edge_idx, _edge_by_faces, _edge_home)
+    cube = (cp, co, ep, eo)
+    return verify(cube) if check else cube
+
+def to_stickers(cube, palette=None):
+    # 54-sticker state (home orientation); `palette` maps faces to labels and
+    # defaults to the colour scheme of the sticker model.
+    palette = colors if palette is None else palette
+    cp, co, ep, eo = cube
+    state = [palette[f] for f in faces for _ in range(9)]
+    for i, idx in enumerate(_corner_idx):
+        home = _corner_home[cp[i]]
+        for n in range(3):
+            state[idx[(n + co[i]) % 3]] = palette[home[n]]
+    for i, idx in enumerate(_edge_idx):
+        home = _edge_home[ep[i]]
+        for n in range(2):
+            state[idx[(n + eo[i]) % 2]] = palette[home[n]]
+    return tuple(state)
+
+def from_facelets(facelets, check=True):
+    if len(facelets) != 54:
+        raise ValueError('facelet string must have 54 characters')
+    state = [None]*54
+    for i, ch in zip(_facelet_stickers, facelets):
+        state[i] = ch
+    return from_stickers(state, check)
+
+def to_facelets(cube):
+    state = to_stickers(cube, {f: f for f in faces})
+    return ''.join(state[i] for i in _facelet_stickers)
+
+def multiply(a, b):
+    # State reached by applying b's effect to a (Kociemba's a*b).
+    acp, aco, aep, aeo = a
+    bcp, bco, bep, beo = b
+    return (
+        tuple(acp[i] for i in bcp),
+        tuple((aco[i] + t) % 3 for i, t in zip(bcp, bco)),
+        tuple(aep[i] for i in bep),
+        tuple((aeo[i] + f) % 2 for i, f in zip(bep, beo)),
+    )
+
+def inverse(cube):
+    cp, co, ep, eo = cube
+    icp, ico, iep, ieo = [0]*8, [0]*8, [0]*12, [0]*12
+    for i, p in enumerate(cp):
+        icp[p] = i
+        ico[p] = -co[i] % 3
+    for i, p in enumerate(ep):
+        iep[p] = i
+        ieo[p] = eo[i]
+    return tuple(icp), tuple(ico), tuple(iep), tuple(ieo)
+
+# Face turn tables, read off the sticker model so both stay in step.
+FACE_MOVES = [f + s for f in 'URFDLB' for s in ('', '2', "'")]
+MOVE_CUBES = {m: from_stickers(apply_perm(solved(), MOVE_PERMS[m])) for m in FACE_MOVES}
+
+# Per move: corner gather, per-position twist lookups, edge gather and flip
+# lookups, so a move is two gathers and two C-level maps.
+_twists = [tuple((o + t) % 3 for o in range(3)) for t in range(3)]
+_flips = [tuple((o + f) % 2 for o in range(2)) for f in range(2)]
+_move_tables = {
+    m: (itemgetter(*cp), [_twists[t] for t in co], itemgetter(*ep), [_flips[f] for f in eo])
+    for m, (cp, co, ep, eo) in MOVE_CUBES.items()
+}
+
+def apply_move(cube, move):
+    # One face turn ('R', 'U2', "F'" ...); touches the 40 cubie integers only.
+    cp_get, twists, ep_get, flips = _move_tables[move]
+    cp, co, ep, eo = cube
+    return (
+        cp_get(cp),
+        tuple(map(getitem, twists, cp_get(co))),
+        ep_get(ep),
+        tuple(map(getitem, flips, ep_get(eo))),
+    )
+
+@lru_cache(maxsize=4096)
+def _compile_cubie(norm):
+    # Whole algorithm as one cubie state; slice, wide and rotation moves go
+    # through the sticker model (from_stickers re-reads the faces by centre).
+    tokens = norm.split()
+    if all(t in _move_tables for t in tokens):
+        cube = SOLVED
+        for t in tokens:
+            cube = apply_move(cube, t)
+        return cube
+    return from_stickers(apply_perm(solved(), compile_alg(norm)))
+
+def compile_alg_cubie(alg):
+    return _compile_cubie(normalize_alg(alg))
+
+def apply_alg(alg, cube=SOLVED, invert=False):
+    moves = compile_alg_cubie(alg)
+    return multiply(cube, inverse(moves) if invert else moves)
+
+def is_solved(cube):
+    return cube == SOLVED
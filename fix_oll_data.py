@@ -1,113 +1,137 @@
-import json
-import pathlib
+from functools import lru_cache
+from operator import itemgetter
 
 # --- Logic from f2l-animation.js / python tests ---
 
+# Bump when a change alters the states the simulator produces, so cached
+# derivations (regenerate_cases.py) are recomputed.
+SIMULATOR_VERSION = 2
+
 colors = {'U':'yellow','F':'green','R':'orange','D':'white','L':'red','B':'blue'}
 faces = list(colors.keys())
 
+# A state is a flat tuple of 54 stickers: face-major in `faces` order, each
+# face read row by row (index 4 is the centre). Every move is a precomputed
+# 54-entry gather: new_state[i] = state[perm[i]].
+
+def sticker(face, idx):
+    return faces.index(face)*9 + idx
+
+_solved = tuple(colors[f] for f in faces for _ in range(9))
+
 def solved():
-    return {f:[colors[f]]*9 for f in faces}
-
-def rotate_face_state(s):
-    old=s.copy()
-    s[0], s[1], s[2], s[3], s[5], s[6], s[7], s[8] = (
-        old[6], old[3], old[0], old[7], old[1], old[8], old[5], old[2]
-    )
-
-def cycle(state, positions):
-    last = state[positions[-1][0]][positions[-1][1]]
-    for i in range(len(positions)-1,0,-1):
-        f, idx = positions[i]
-        sf, sidx = positions[i-1]
-        state[f][idx] = state[sf][sidx]
-    f0, i0 = positions[0]
-    state[f0][i0] = last
-
-def move_U(state):
-    rotate_face_state(state['U'])
-    for col in [0,1,2]:
-        cycle(state, [('F',col),('L',col),('B',col),('R',col)])
-
-def move_D(state):
-    rotate_face_state(state['D'])
-    for idx in [6,7,8]:
-        cycle(state, [('F',idx),('R',idx),('B',idx),('L',idx)])
-
-def move_R(state):
-    rotate_face_state(state['R'])
-    cycle(state, [('F',2),('U',2),('B',6),('D',2)])
-    cycle(state, [('F',5),('U',5),('B',3),('D',5)])
-    cycle(state, [('F',8),('U',8),('B',0),('D',8)])
-
-def move_L(state):
-    rotate_face_state(state['L'])
-    cycle(state, [('F',0),('D',0),('B',8),('U',0)])
-    cycle(state, [('F',3),('D',3),('B',5),('U',3)])
-    cycle(state, [('F',6),('D',6),('B',2),('U',6)])
-
-def move_F(state):
-    rotate_face_state(state['F'])
-    cycle(state, [('U',6),('R',0),('D',2),('L',8)])
-    cycle(state, [('U',7),('R',3),('D',1),('L',5)])
-    cycle(state, [('U',8),('R',6),('D',0),('L',2)])
-
-def move_B(state):
-    rotate_face_state(state['B'])
-    cycle(state, [('U',2),('L',0),('D',6),('R',8)])
-    cycle(state, [('U',1),('L',3),('D',7),('R',5)])
-    cycle(state, [('U',0),('L',6),('D',8),('R',2)])
-
-def applyMPrime(state):
-    cycle(state, [('F',1),('U',1),('B',7),('D',1)])
-    cycle(state, [('F',4),('U',4),('B',4),('D',4)])
-    cycle(state, [('F',7),('U',7),('B',1),('D',7)])
-
-def applyS(state):
-    cycle(state, [('U',3),('R',1),('D',5),('L',7)])
-    cycle(state, [('U',4),('R',4),('D',4),('L',4)])
-    cycle(state, [('U',5),('R',7),('D',3),('L',1)])
-
-def apply_move(state, base):
-    if base == 'U': move_U(state)
-    elif base == 'D': move_D(state)
-    elif base == 'R': move_R(state)
-    elif base == 'L': move_L(state)
-    elif base == 'F': move_F(state)
-    elif base == 'B': move_B(state)
-    elif base == 'x':
-        move_R(state); applyMPrime(state); move_L(state); move_L(state); move_L(state)
-    elif base == 'y':
-        move_U(state)
-        # E' cycles F->L->B->R for positions 3,4,5
-        cycle(state, [('F',3),('L',3),('B',3),('R',3)])
-        cycle(state, [('F',4),('L',4),('B',4),('R',4)])
-        cycle(state, [('F',5),('L',5),('B',5),('R',5)])
-        move_D(state); move_D(state); move_D(state)
-    elif base == 'r':
-        move_R(state); applyMPrime(state)
-    elif base == 'l':
-        move_L(state); applyMPrime(state); applyMPrime(state); applyMPrime(state)
-    elif base == 'u':
-        apply_move(state,'y'); move_D(state)
-    elif base == 'd':
-        apply_move(state,'y'); apply_move(state,'y'); apply_move(state,'y'); move_U(state)
-    elif base == 'f':
-        move_F(state); applyS(state)
-    elif base == 'b':
-        move_B(state); applyS(state); applyS(state); applyS(state)
-    elif base == 'M':
-        applyMPrime(state); applyMPrime(state); applyMPrime(state)
-    elif base == 'E':
-        cycle(state, [('F',3),('R',3),('B',3),('L',3)])
-        cycle(state, [('F',4),('R',4),('B',4),('L',4)])
-        cycle(state, [('F',5),('R',5),('B',5),('L',5)])
-    elif base == 'S':
-        applyS(state)
-    else:
+    return _solved
+
+_identity = tuple(range(54))
+
+def compose(*perms):
+    # Permutation equivalent to applying `perms` left to right.
+    result = _identity
+    for p in perms:
+        result = tuple(result[i] for i in p)
+    return result
+
+def _face_perm(face, cycles):
+    perm = list(_identity)
+    base = sticker(face, 0)
+    for i, src in enumerate((6, 3, 0, 7, 4, 1, 8, 5, 2)):
+        perm[base+i] = base+src
+    return _cycles_perm(cycles, perm)
+
+def _cycles_perm(cycles, perm=None):
+    # Each cycle moves the sticker at positions[i-1] to positions[i].
+    perm = list(_identity) if perm is None else perm
+    for positions in cycles:
+        idx = [sticker(f, i) for f, i in positions]
+        for i in range(len(idx)):
+            perm[idx[i]] = idx[i-1]
+    return tuple(perm)
+
+_U = _face_perm('U', [[('F',c),('L',c),('B',c),('R',c)] for c in (0,1,2)])
+_D = _face_perm('D', [[('F',c),('R',c),('B',c),('L',c)] for c in (6,7,8)])
+_R = _face_perm('R', [
+    [('F',2),('U',2),('B',6),('D',2)],
+    [('F',5),('U',5),('B',3),('D',5)],
+    [('F',8),('U',8),('B',0),('D',8)],
+])
+_L = _face_perm('L', [
+    [('F',0),('D',0),('B',8),('U',0)],
+    [('F',3),('D',3),('B',5),('U',3)],
+    [('F',6),('D',6),('B',2),('U',6)],
+])
+_F = _face_perm('F', [
+    [('U',6),('R',0),('D',2),('L',8)],
+    [('U',7),('R',3),('D',1),('L',5)],
+    [('U',8),('R',6),('D',0),('L',2)],
+])
+_B = _face_perm('B', [
+    [('U',2),('L',0),('D',6),('R',8)],
+    [('U',1),('L',3),('D',7),('R',5)],
+    [('U',0),('L',6),('D',8),('R',2)],
+])
+_M_prime = _cycles_perm([
+    [('F',1),('U',1),('B',7),('D',1)],
+    [('F',4),('U',4),('B',4),('D',4)],
+    [('F',7),('U',7),('B',1),('D',7)],
+])
+_E = _cycles_perm([[('F',c),('R',c),('B',c),('L',c)] for c in (3,4,5)])
+_S = _cycles_perm([
+    [('U',3),('R',1),('D',5),('L',7)],
+    [('U',4),('R',4),('D',4),('L',4)],
+    [('U',5),('R',7),('D',3),('L',1)],
+])
+
+def _inverse(p):
+    return compose(p, p, p)
+
+_y = compose(_U, _inverse(_E), _inverse(_D))
+
+# Quarter turn of every supported base move, built once from the face cycles.
+_quarter_turns = {
+    'U': _U, 'D': _D, 'R': _R, 'L': _L, 'F': _F, 'B': _B,
+    'M': _inverse(_M_prime), 'E': _E, 'S': _S,
+    'x': compose(_R, _M_prime, _inverse(_L)),
+    'y': _y,
+    'z': compose(_F, _S, _inverse(_B)),
+    'r': compose(_R, _M_prime),
+    'l': compose(_L, _inverse(_M_prime)),
+    'u': compose(_y, _D),
+    'd': compose(_inverse(_y), _U),
+    'f': compose(_F, _S),
+    'b': compose(_B, _inverse(_S)),
+}
+
+MOVE_PERMS = {}
+for _base, _perm in _quarter_turns.items():
+    MOVE_PERMS[_base] = _perm
+    MOVE_PERMS[_base + '2'] = compose(_perm, _perm)
+    MOVE_PERMS[_base + "'"] = _inverse(_perm)
+    if _base in 'UDRLFB':
+        MOVE_PERMS[_base + 'w'] = _quarter_turns[_base.lower()]
+for _name in [n for n in MOVE_PERMS if n.endswith('w')]:
+    MOVE_PERMS[_name + '2'] = MOVE_PERMS[_name[0].lower() + '2']
+    MOVE_PERMS[_name + "'"] = MOVE_PERMS[_name[0].lower() + "'"]
+
+_move_gather = {name: itemgetter(*perm) for name, perm in MOVE_PERMS.items()}
+# (base, is_prime) -> gather, matching the tuples produced by parse_moves.
+_gather_by_move = {(name.rstrip("'"), name.endswith("'")): g
+                   for name, g in _move_gather.items() if '2' not in name}
+
+def apply_perm(state, perm):
+    return itemgetter(*perm)(state)
+
+def apply_move(state, base, is_prime=False):
+    gather = _gather_by_move.get((base, is_prime))
+    if gather is None:
         # Ignore unsupported moves if any, or raise
-        pass
-        # print(f"Warning: Unknown move {base}")
+        return state
+    return gather(state)
+
+def apply_moves(state, gathers):
+    # Move loop over gathers from resolve_alg: no lookups per move.
+    for gather in gathers:
+        state = gather(state)
+    return state
 
 
 def parse_moves(alg):
@@ -132,46 +156,222 @@ def invert_moves(moves):
         inv.append((base, not is_prime))
     return inv
 
-def apply_alg(alg, invert=False):
-    moves=parse_moves(alg)
+def _normalize_token(tok):
+    is_prime="'" in tok
+    is_double='2' in tok
+    base_raw=tok.replace("'",'').replace('2','')
+    base=base_raw[0].lower() if base_raw.endswith('w') else base_raw
+    if base not in _quarter_turns:
+        return None
+    return base + ('2' if is_double else "'" if is_prime else '')
+
+# Every move's own spelling, and its inverse, worked out once.
+_canonical_token={name: _normalize_token(name) for name in MOVE_PERMS}
+_inverse_token={name: name if name.endswith('2') else name[:-1] if name.endswith("'") else name + "'"
+                for name in MOVE_PERMS}
+
+@lru_cache(maxsize=4096)
+def normalize_alg(alg):
+    # Canonical spelling: wide moves as lowercase, R2' as R2, unknown tokens dropped.
+    tokens=(_canonical_token.get(t) or _normalize_token(t) for t in alg.split())
+    return ' '.join(t for t in tokens if t)
+
+def invert_perm(perm):
+    inv=[0]*54
+    for i, src in enumerate(perm):
+        inv[src]=i
+    return tuple(inv)
+
+def resolve_alg(alg, invert=False):
+    # One gather per move of `alg` (a double turn is one gather), resolved
+    # once, for apply_moves.
+    tokens=normalize_alg(alg).split()
     if invert:
-        moves=invert_moves(moves)
-    state=solved()
-    for base,is_prime in moves:
-        if is_prime:
-            for _ in range(3): apply_move(state, base)
+        return [_move_gather[_inverse_token[t]] for t in reversed(tokens)]
+    return [_move_gather[t] for t in tokens]
+
+@lru_cache(maxsize=4096)
+def _compile_normalized(norm, invert):
+    return apply_moves(_identity, resolve_alg(norm, invert))
+
+def compile_alg(alg, invert=False):
+    # Whole algorithm as one permutation, cached by its normalized spelling.
+    return _compile_normalized(normalize_alg(alg), invert)
+
+def apply_alg(alg, invert=False, state=None):
+    perm=compile_alg(alg, invert)
+    return apply_perm(solved() if state is None else state, perm)
+
+# Whole-cube rotations and case states
+centers=[sticker(f, 4) for f in faces]
+rotations=list({compose(MOVE_PERMS[a] if a else _identity, MOVE_PERMS[b] if b else _identity): None
+    for a in ('', 'x', 'x2', "x'", 'z', "z'") for b in ('', 'y', 'y2', "y'")})
+_rotation_by_centers={tuple(r[i] for i in centers): r for r in rotations}
+
+def net_rotation(perm):
+    # The whole-cube rotation that moves the centres the same way `perm` does.
+    return _rotation_by_centers[tuple(perm[i] for i in centers)]
+
+# Canonical move name of every move permutation (wide moves as lowercase).
+_name_by_perm={perm: name for name, perm in MOVE_PERMS.items() if 'w' not in name}
+
+def rename_move(frame, name):
+    # Canonical name of move `name` done after the whole-cube rotation `frame`
+    # (a permutation), as seen from the home orientation.
+    return _name_by_perm[compose(frame, MOVE_PERMS[name], invert_perm(frame))]
+
+def strip_rotations(alg):
+    # The same piece movement without x/y/z: every move after a rotation is
+    # renamed for the orientation it is done in. The result ends in the home
+    # orientation instead of the rotated one.
+    frame=_identity
+    out=[]
+    for tok in normalize_alg(alg).split():
+        if tok[0] in 'xyz':
+            frame=compose(frame, MOVE_PERMS[tok])
         else:
-            apply_move(state, base)
-    return state
+            out.append(rename_move(frame, tok))
+    return ' '.join(out)
+
+def reorient(state):
+    # Same cube turned so every centre is back on its home face.
+    home=solved()
+    for r in rotations:
+        turned=apply_perm(state, r)
+        if all(turned[i]==home[i] for i in centers):
+            return turned
+    raise ValueError('centres do not form a valid cube orientation')
+
+def case_state(alg, pre='', post='', state=None):
+    # State (home orientation) solved by `pre`, then `alg`, then `post` done after
+    # turning the cube back to its home orientation. Unlike apply_alg(alg, invert=True),
+    # this holds when the algorithm contains rotations or unbalanced wide/slice moves.
+    # `state` is the solved state to start from (any 54 labels; default solved()).
+    perm=compile_alg(alg)
+    state=apply_alg(post, invert=True, state=state)
+    state=apply_perm(state, net_rotation(perm))
+    state=apply_alg(alg, invert=True, state=state)
+    return apply_alg(pre, invert=True, state=state)
 
 # pattern extraction
-_top_order=[0,1,2,3,5,6,7,8]
-_ring_mapping=[('F',0),('F',1),('F',2),('R',2),('R',1),('R',0),('L',0),('L',1),('L',2),('B',2),('B',1),('B',0)]
+# Top view with B at the top of the diagram, matching the 5x5 boards in oll.js
+# and pll.js: top face row by row, then the ring north (B), west (L),
+# east (R) and south (F), each read top-to-bottom / left-to-right.
+top_order=[sticker('U', i) for i in (0,1,2,3,5,6,7,8)]
+ring_mapping=[sticker(f, i) for f, i in [('B',2),('B',1),('B',0),('L',0),('L',1),('L',2),('R',2),('R',1),('R',0),('F',0),('F',1),('F',2)]]
 
 def patterns_from_state(state):
-    top_bits=['1' if state['U'][i]=='yellow' else '0' for i in _top_order]
-    ring_bits=['1' if state[f][i]=='yellow' else '0' for f,i in _ring_mapping]
+    top_bits=['1' if state[i]=='yellow' else '0' for i in top_order]
+    ring_bits=['1' if state[i]=='yellow' else '0' for i in ring_mapping]
     return ''.join(top_bits), ''.join(ring_bits)
 
+_side_labels={sticker(f, 4): ch for f, ch in zip('FRBL', 'ABCD')}
+
+def pll_pattern_from_state(state):
+    # Ring stickers labelled by the centre they belong to: F=A R=B B=C L=D.
+    labels={state[i]: ch for i, ch in _side_labels.items()}
+    return ''.join(labels.get(state[i], '?') for i in ring_mapping)
+
+# Pieces, listed clockwise starting from the U/D sticker (corners) or the
+# U/D, else F/B, sticker (edges), so the index of a colour in the list is
+# its twist or flip.
+corner_facelets={name: [sticker(f, i) for f, i in spec] for name, spec in {
+    'UFR': [('U',8),('R',0),('F',2)], 'UFL': [('U',6),('F',0),('L',2)],
+    'UBL': [('U',0),('L',0),('B',2)], 'UBR': [('U',2),('B',0),('R',2)],
+    'DFR': [('D',2),('F',8),('R',6)], 'DFL': [('D',0),('L',8),('F',6)],
+    'DBL': [('D',6),('B',8),('L',6)], 'DBR': [('D',8),('R',8),('B',6)],
+}.items()}
+edge_facelets={name: [sticker(f, i) for f, i in spec] for name, spec in {
+    'UR': [('U',5),('R',1)], 'UF': [('U',7),('F',1)], 'UL': [('U',3),('L',1)], 'UB': [('U',1),('B',1)],
+    'DR': [('D',5),('R',7)], 'DF': [('D',1),('F',7)], 'DL': [('D',3),('L',7)], 'DB': [('D',7),('B',7)],
+    'FR': [('F',5),('R',3)], 'FL': [('F',3),('L',5)], 'BL': [('B',5),('L',3)], 'BR': [('B',3),('R',5)],
+}.items()}
+
+def locate_piece(state, facelets, piece_colors):
+    # (position, twist/flip) of the piece showing `piece_colors`; the twist is
+    # where piece_colors[0] sits in that position's facelet list.
+    wanted=set(piece_colors)
+    for name, idx in facelets.items():
+        shown=[state[i] for i in idx]
+        if set(shown)==wanted:
+            return name, shown.index(piece_colors[0])
+    raise ValueError(f'piece {piece_colors} not found')
+
+# --- Compact state value ---
+# Cube holds a state as 54 bytes (the index of each sticker's colour in
+# `faces`) with its hash computed once, so millions of states fit in sets and
+# dicts. Instances are immutable; moves return new ones.
+
+_color_index={colors[f]: i for i, f in enumerate(faces)}
+
+class Cube:
+    __slots__=('stickers', '_hash')
+
+    def __init__(self, stickers):
+        stickers=bytes(stickers)
+        if len(stickers)!=54:
+            raise ValueError('a cube has 54 stickers')
+        object.__setattr__(self, 'stickers', stickers)
+        object.__setattr__(self, '_hash', hash(stickers))
+
+    @classmethod
+    def solved(cls):
+        return _solved_cube
+
+    @classmethod
+    def from_state(cls, state):
+        # From a tuple of colour names (the sticker model above).
+        return cls(_color_index[c] for c in state)
+
+    def to_state(self):
+        return tuple(colors[faces[i]] for i in self.stickers)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Cube is immutable')
+
+    def __eq__(self, other):
+        if not isinstance(other, Cube):
+            return NotImplemented
+        return self._hash==other._hash and self.stickers==other.stickers
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (Cube, (self.stickers,))
+
+    def __repr__(self):
+        return f'Cube({self.stickers!r})'
+
+    def move(self, name):
+        # One move by name ('R', "U'", 'r2', 'x' ...).
+        return _make_cube(bytes(_move_gather[name](self.stickers)))
+
+    def apply(self, alg, invert=False):
+        # A whole algorithm, compiled to a single gather.
+        return _make_cube(bytes(apply_perm(self.stickers, compile_alg(alg, invert))))
+
+    def is_solved(self):
+        return self.stickers==_solved_cube.stickers
+
+# Unchecked constructor for the move methods: fills the slots directly.
+_set_stickers=Cube.stickers.__set__
+_set_hash=Cube._hash.__set__
+
+def _make_cube(stickers):
+    cube=object.__new__(Cube)
+    _set_stickers(cube, stickers)
+    _set_hash(cube, hash(stickers))
+    return cube
+
+_solved_cube=Cube.from_state(_solved)
+
 # --- Main Script ---
 
-json_path = pathlib.Path('data/oll_cases.json')
-cases = json.loads(json_path.read_text())
-
-count = 0
-for c in cases:
-    # Calculate correct pattern from solution
-    state = apply_alg(c['solution'], invert=True)
-    tp, rp = patterns_from_state(state)
-    
-    # Update if different
-    if tp != c['topPattern'] or rp != c['ringPattern']:
-        # print(f"Updating {c['id']}:")
-        # print(f"  Old: {c['topPattern']} {c['ringPattern']}")
-        # print(f"  New: {tp} {rp}")
-        c['topPattern'] = tp
-        c['ringPattern'] = rp
-        count += 1
-
-print(f"Updated {count} OLL cases.")
-json_path.write_text(json.dumps(cases, indent=2))
+def main():
+    # OLL-only regeneration; regenerate_cases.py covers all case files.
+    import regenerate_cases
+    regenerate_cases.main(['oll'])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+(() => {
+  // Decoder for data/cases.bin (written by build_case_binary.py): all OLL,
+  // PLL and F2L cases in one ArrayBuffer. Returns the same objects as the
+  // JSON case files.
+  const FORMAT_VERSION = 1;
+  const CORNER_POSITIONS = ['UFR', 'UFL', 'UBL', 'UBR', 'FR_SLOT'];
+  const EDGE_POSITIONS = ['UR', 'UF', 'UL', 'UB', 'FR'];
+  const PLL_LABELS = 'ABCD';
+
+  const bits = (value, width) => value.toString(2).padStart(width, '0');
+
+  const decode = (buffer) => {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== 'CFOP' || view.getUint16(4, true) !== FORMAT_VERSION) {
+      throw new Error('Unsupported case database');
+    }
+    const nStrings = view.getUint16(6, true);
+    const nOll = view.getUint16(8, true);
+    const nPll = view.getUint16(10, true);
+    const nF2l = view.getUint16(12, true);
+
+    let pos = 16;
+    const offsets = [];
+    for (let i = 0; i <= nStrings; i += 1) offsets.push(view.getUint32(pos + 4 * i, true));
+    pos += 4 * (nStrings + 1);
+
+    const blobStart = pos + 8 * (nOll + nPll + nF2l);
+    const utf8 = new TextDecoder();
+    const strings = [];
+    for (let i = 0; i < nStrings; i += 1) {
+      strings.push(utf8.decode(new Uint8Array(buffer, blobStart + offsets[i], offsets[i + 1] - offsets[i])));
+    }
+
+    const oll = [];
+    for (let i = 0; i < nOll; i += 1, pos += 8) {
+      const pattern = view.getUint32(pos + 4, true);
+      oll.push({
+        id: strings[view.getUint16(pos, true)],
+        topPattern: bits(pattern >>> 12, 8),
+        ringPattern: bits(pattern & 0xfff, 12),
+        solution: strings[view.getUint16(pos + 2, true)],
+      });
+    }
+
+    const pll = [];
+    for (let i = 0; i < nPll; i += 1, pos += 8) {
+      const word = view.getUint32(pos + 4, true);
+      let pattern = '';
+      for (let s = 0; s < 12; s += 1) pattern += PLL_LABELS[(word >>> (2 * s)) & 3];
+      pll.push({
+        id: strings[view.getUint16(pos, true)],
+        pattern,
+        solution: strings[view.getUint16(pos + 2, true)],
+      });
+    }
+
+    const f2l = [];
+    for (let i = 0; i < nF2l; i += 1, pos += 8) {
+      const corner = view.getUint8(pos + 6);
+      const edge = view.getUint8(pos + 7);
+      f2l.push({
+        id: strings[view.getUint16(pos, true)],
+        name: strings[view.getUint16(pos + 2, true)],
+        cornerPos: CORNER_POSITIONS[corner >> 2],
+        cornerOri: corner & 3,
+        edgePos: EDGE_POSITIONS[edge >> 1],
+        edgeOri: edge & 1,
+        solution: strings[view.getUint16(pos + 4, true)],
+      });
+    }
+
+    return { oll, pll, f2l };
+  };
+
+  let memo;
+  const load = () => {
+    if (!memo) {
+      memo = fetch('data/cases.bin').then((res) => {
+        if (!res.ok) throw new Error('Could not load case database');
+        return res.arrayBuffer();
+      }).then(decode);
+      memo.catch(() => { memo = undefined; });
+    }
+    return memo;
+  };
+
+  window.CaseData = { load, decode };
+})();
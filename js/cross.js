@@ -313,117 +313,112 @@
   };
 
   // --- Solver Implementation ---
-  const solve = () => {
+  // Optimal crosses come from data/cross_table.bin (build_cross_table.py):
+  // for every cross state, the first move of an optimal solution. Solving is a
+  // walk through the table, one lookup per move.
+  const MOVE_NAMES = ["U", "U2", "U'", "R", "R2", "R'", "F", "F2", "F'",
+    "D", "D2", "D'", "L", "L2", "L'", "B", "B2", "B'"];
+  const SOLVED_MOVE = 255;
+  // Edge positions in table order; the first sticker is the U/D (else F/B)
+  // one, so a piece's flip is the index of its white sticker.
+  const TABLE_EDGES = [
+    ['U5', 'R1'], ['U7', 'F1'], ['U3', 'L1'], ['U1', 'B1'],
+    ['D5', 'R7'], ['D1', 'F7'], ['D3', 'L7'], ['D7', 'B7'],
+    ['F5', 'R3'], ['F3', 'L5'], ['B5', 'L3'], ['B3', 'R5']
+  ];
+  // Cross pieces in table order (DR, DF, DL, DB) as edgeTypes indices.
+  const CROSS_TYPES = [1, 0, 3, 2];
+
+  let tablePromise;
+  const loadTable = () => {
+    if (!tablePromise) {
+      tablePromise = fetch('data/cross_table.bin').then((res) => {
+        if (!res.ok) throw new Error('Could not load cross table');
+        return res.arrayBuffer();
+      }).then((buffer) => {
+        const view = new DataView(buffer);
+        const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+        const nMoves = view.getUint16(6, true);
+        if (magic !== 'XTBL' || view.getUint16(4, true) !== 1 || nMoves !== MOVE_NAMES.length) {
+          throw new Error('Unsupported cross table');
+        }
+        const size = nMoves * 12;
+        return {
+          dest: new Uint8Array(buffer, 8, size),
+          flip: new Uint8Array(buffer, 8 + size, size),
+          next: new Uint8Array(buffer, 8 + 2 * size)
+        };
+      });
+      tablePromise.catch(() => { tablePromise = undefined; });
+    }
+    return tablePromise;
+  };
+
+  const crossIndex = (pos, flip) => {
+    let rank = 0;
+    for (let i = 0; i < 4; i++) {
+      let smaller = 0;
+      for (let j = 0; j < i; j++) if (pos[j] < pos[i]) smaller++;
+      rank = rank * (12 - i) + pos[i] - smaller;
+    }
+    return rank * 16 + flip[0] * 8 + flip[1] * 4 + flip[2] * 2 + flip[3];
+  };
+
+  const solveCross = (table, pos, flip) => {
+    const moves = [];
+    let idx = crossIndex(pos, flip);
+    while (table.next[idx] !== SOLVED_MOVE) {
+      const m = table.next[idx];
+      for (let i = 0; i < 4; i++) {
+        flip[i] ^= table.flip[m * 12 + pos[i]];
+        pos[i] = table.dest[m * 12 + pos[i]];
+      }
+      moves.push(MOVE_NAMES[m]);
+      idx = crossIndex(pos, flip);
+    }
+    return moves;
+  };
+
+  const solve = async () => {
     if (edgeAssignments.size < 4) {
       solutionEl.textContent = 'Please place all 4 white edges.';
       return;
     }
-    
-    const pieceLocs = {}; // typeIdx -> { edgeIdx, whitePart }
+
+    const whiteSticker = {}; // typeIdx -> sticker id showing white
     edgeAssignments.forEach((data, edgeIdx) => {
-      pieceLocs[data.typeIdx] = { edgeIdx, whitePart: data.whitePart };
+      const edge = edges[edgeIdx];
+      const s = data.whitePart === 0 ? edge.s1 : edge.s2;
+      whiteSticker[data.typeIdx] = `${s[0]}${s[1]}`;
     });
-    
-    // Initial State
-    const startState = [];
-    for(let i=0; i<4; i++) {
-      const loc = pieceLocs[i];
-      startState.push(loc.edgeIdx);
-      startState.push(loc.whitePart);
+
+    const pos = [];
+    const flip = [];
+    CROSS_TYPES.forEach((typeIdx) => {
+      const p = TABLE_EDGES.findIndex((stickers) => stickers.includes(whiteSticker[typeIdx]));
+      pos.push(p);
+      flip.push(TABLE_EDGES[p].indexOf(whiteSticker[typeIdx]));
+    });
+
+    let table;
+    try {
+      table = await loadTable();
+    } catch (err) {
+      solutionEl.textContent = 'Could not load the cross solver data.';
+      return;
     }
-    
-    // Target: 
-    // WG(0) -> DF(11), 0
-    // WO(1) -> DR(10), 0
-    // WB(2) -> DB(8), 0
-    // WR(3) -> DL(9), 0
-    const targetStr = JSON.stringify([11,0, 10,0, 8,0, 9,0]);
-    
-    // BFS
-    const queue = [[startState, []]]; // [state, moves]
-    const visited = new Set();
-    visited.add(JSON.stringify(startState));
-    
-    if (JSON.stringify(startState) === targetStr) {
+
+    const moves = solveCross(table, pos, flip);
+    if (moves.length === 0) {
       solutionEl.textContent = "Solved!";
       return;
     }
-    
-    let iterations = 0;
-    while(queue.length > 0 && iterations < 200000) {
-      iterations++;
-      const [currState, moves] = queue.shift();
-      
-      if (moves.length >= 8) continue; // Cap at 8 moves
-      
-      const moveNames = ["U", "U'", "D", "D'", "F", "F'", "B", "B'", "R", "R'", "L", "L'"];
-      
-      for (const m of moveNames) {
-        const nextState = applyMove(currState, m);
-        const nextStr = JSON.stringify(nextState);
-        
-        if (nextStr === targetStr) {
-          const solution = [...moves, m].join(' ');
-          solutionEl.innerHTML = solution;
-          
-          window.dispatchEvent(new CustomEvent('f2l-solution-found', { 
-            detail: { solution: solution } 
-          }));
-
-          return;
-        }
-        
-        if (!visited.has(nextStr)) {
-          visited.add(nextStr);
-          queue.push([nextState, [...moves, m]]);
-        }
-      }
-    }
-    
-    solutionEl.textContent = "No solution found within 8 moves.";
-  };
+    const solution = moves.join(' ');
+    solutionEl.innerHTML = solution;
 
-  const applyMove = (state, move) => {
-    // state: [p0, o0, p1, o1, p2, o2, p3, o3]
-    const newState = [...state];
-    
-    let cycle = [];
-    let flip = 0;
-    
-    const baseMove = move[0];
-    
-    // Edges:
-    // 0:UB, 1:UL, 2:UR, 3:UF
-    // 4:LB, 5:LF, 6:RB, 7:RF
-    // 8:DB, 9:DL, 10:DR, 11:DF
-    
-    // CW Cycles
-    switch(baseMove) {
-      case 'U': cycle = [0, 2, 3, 1]; flip = 0; break; // UB->UR->UF->UL
-      case 'D': cycle = [11, 10, 8, 9]; flip = 0; break; // DF->DR->DB->DL
-      case 'L': cycle = [1, 5, 9, 4]; flip = 1; break; // UL->LF->DL->LB
-      case 'R': cycle = [2, 6, 10, 7]; flip = 1; break; // UR->RB->DR->RF
-      case 'F': cycle = [3, 7, 11, 5]; flip = 0; break; // UF->RF->DF->LF
-      case 'B': cycle = [0, 4, 8, 6]; flip = 0; break; // UB->LB->DB->RB
-    }
-    
-    const times = move.endsWith("'") ? 3 : (move.endsWith("2") ? 2 : 1);
-    
-    for (let t=0; t<times; t++) {
-      for (let i=0; i<4; i++) {
-        const pos = newState[i*2];
-        const ori = newState[i*2+1];
-        
-        const idxInCycle = cycle.indexOf(pos);
-        if (idxInCycle !== -1) {
-          const nextPos = cycle[(idxInCycle + 1) % 4];
-          newState[i*2] = nextPos;
-          newState[i*2+1] = ori ^ flip;
-        }
-      }
-    }
-    
-    return newState;
+    window.dispatchEvent(new CustomEvent('f2l-solution-found', {
+      detail: { solution: solution }
+    }));
   };
 
   createStickers();
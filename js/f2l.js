@@ -271,6 +271,15 @@
   const loadCases = async () => {
     if (casesData.length > 0) return casesData;
     try {
+      if (window.CaseData) {
+        try {
+          casesData = (await window.CaseData.load()).f2l;
+          return casesData;
+        } catch (e) {
+          // Fall back to the JSON file below
+          console.error(e);
+        }
+      }
       const res = await fetch('data/f2l_cases.json');
       if (!res.ok) throw new Error('Failed to load cases');
       casesData = await res.json();
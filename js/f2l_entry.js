@@ -6,6 +6,7 @@
   const cornerOriBtn = document.getElementById('corner-ori');
   const edgeOriBtn = document.getElementById('edge-ori');
   const resetBtn = document.getElementById('f2l-reset');
+  const slotSelect = document.getElementById('slot-select');
   
   const addBtn = document.getElementById('add-case');
   const downloadBtn = document.getElementById('download-json');
@@ -20,6 +21,7 @@
   const faceR = cube.querySelector('.face-r');
 
   const state = {
+    slot: 'FR',
     corner: null,
     cornerOri: 0,
     edge: null,
@@ -28,6 +30,38 @@
 
   let collectedCases = [];
 
+  // Known cases keyed by "SLOT|cornerPos|cornerOri|edgePos|edgeOri"
+  // (data/f2l_index.json, written by build_f2l_index.py).
+  let f2lIndex = null;
+
+  // The cube always shows the pair in front-right; another slot is the same
+  // view turned by y. U-layer positions then move round a quarter turn per
+  // slot (U-layer edges also change flip on odd turns), and the slot's own
+  // pieces take the slot's name.
+  const SLOT_TURNS = { FR: 0, FL: 1, BL: 2, BR: 3 };
+  const U_CORNERS = ['UFR', 'UFL', 'UBL', 'UBR'];
+  const U_EDGES = ['UR', 'UF', 'UL', 'UB'];
+
+  const slotCorner = (slot, pos) => {
+    if (pos === 'FR_SLOT') return `${slot}_SLOT`;
+    return U_CORNERS[(U_CORNERS.indexOf(pos) + SLOT_TURNS[slot]) % 4];
+  };
+
+  const slotEdge = (slot, pos, ori) => {
+    if (pos === 'FR') return [slot, ori];
+    const turns = SLOT_TURNS[slot];
+    return [U_EDGES[(U_EDGES.indexOf(pos) + turns) % 4], turns % 2 ? 1 - ori : ori];
+  };
+
+  const lookupCase = () => {
+    if (!f2lIndex || !state.corner || !state.edge) return null;
+    const slot = state.slot;
+    const [edgePos, edgeOri] = slotEdge(slot, PIECE_IDS.edge[state.edge], state.edgeOri);
+    const key = [slot, slotCorner(slot, PIECE_IDS.corner[state.corner]), state.cornerOri,
+      edgePos, edgeOri].join('|');
+    return f2lIndex[key] || null;
+  };
+
   const PIECE_IDS = {
     corner: {
       UFR: 'UFR',
@@ -233,7 +267,9 @@
     if (!state.corner && !state.edge) {
       renderStatus('Select a corner and an edge on the cube.');
     } else {
-      renderStatus(`Corner: ${state.corner || '-'}  Edge: ${state.edge || '-'}`);
+      const known = lookupCase();
+      const match = known ? `  Known case ${known[0]}: ${known[1]}` : '';
+      renderStatus(`Slot: ${state.slot}  Corner: ${state.corner || '-'}  Edge: ${state.edge || '-'}${match}`);
     }
   };
 
@@ -334,10 +370,23 @@
     }
   });
 
+  if (slotSelect) slotSelect.addEventListener('change', () => {
+    state.slot = slotSelect.value;
+    render();
+  });
+
   if (resetBtn) resetBtn.addEventListener('click', reset);
   if (addBtn) addBtn.addEventListener('click', addCase);
   if (downloadBtn) downloadBtn.addEventListener('click', downloadJson);
 
+  fetch('data/f2l_index.json')
+    .then(res => res.json())
+    .then(data => {
+      f2lIndex = data;
+      render();
+    })
+    .catch(() => {});
+
   // Load existing if any (optional, but good for editing)
   fetch('data/f2l_cases.json')
     .then(res => res.json())
@@ -993,7 +993,7 @@ var min2phase = (function() {
 		CubieCube.urf2 = new CubieCube().initCoord(2089, 1906, 322752913, 2040);
 	}
 
-	function initBasic() {
+	function initSymTables() {
 		//init sym cubes
 		var c = new CubieCube();
 		var d = new CubieCube();
@@ -1056,6 +1056,12 @@ var min2phase = (function() {
 				}
 			}
 		}
+	}
+
+	function initBasic() {
+		initSymTables();
+		var c = new CubieCube();
+		var d;
 
 		// init sym 2 raw tables
 		function initSym2Raw(N_RAW, Sym2Raw, Raw2Sym, SelfSym, coord, setFunc, getFunc) {
@@ -1327,6 +1333,115 @@ var min2phase = (function() {
 		return false;
 	}
 
+	// Serialized tables (data/min2phase_tables.bin, built by
+	// build_min2phase_tables.py): everything initBasic and a full pruning
+	// search compute, except the small symmetry tables, which are rebuilt.
+	//
+	//   header  'M2PT', u16 version, u16 table count
+	//   sizes   u32 element count per table
+	//   tables  in TABLE_LAYOUT order, each padded to 4 bytes
+	var TABLE_MAGIC = 0x5450324d; // 'M2PT'
+	var TABLE_VERSION = 1;
+
+	function tableLayout() {
+		// [typed array type, current table, setter]
+		return [
+			[Int32Array, [TwstFlipPrunMax, SliceTwstPrunMax, SliceFlipPrunMax, MCPermPrunMax, EPermCCombPPrunMax],
+				function(t) {
+					TwstFlipPrunMax = t[0];
+					SliceTwstPrunMax = t[1];
+					SliceFlipPrunMax = t[2];
+					MCPermPrunMax = t[3];
+					EPermCCombPPrunMax = t[4];
+				}],
+			[Uint16Array, FlipS2R, function(t) { FlipS2R = t; }],
+			[Uint16Array, FlipR2S, function(t) { FlipR2S = t; }],
+			[Uint16Array, FlipSelfSym, function(t) { FlipSelfSym = t; }],
+			[Uint16Array, FlipS2RF, function(t) { FlipS2RF = t; }],
+			[Uint16Array, TwstS2R, function(t) { TwstS2R = t; }],
+			[Uint16Array, TwstR2S, function(t) { TwstR2S = t; }],
+			[Uint16Array, TwstSelfSym, function(t) { TwstSelfSym = t; }],
+			[Uint16Array, EPermS2R, function(t) { EPermS2R = t; }],
+			[Uint16Array, EPermR2S, function(t) { EPermR2S = t; }],
+			[Uint16Array, PermSelfSym, function(t) { PermSelfSym = t; }],
+			[Uint16Array, Perm2CombP, function(t) { Perm2CombP = t; }],
+			[Uint16Array, PermInvEdgeSym, function(t) { PermInvEdgeSym = t; }],
+			[Uint16Array, FlipMove, function(t) { FlipMove = t; }],
+			[Uint16Array, TwstMove, function(t) { TwstMove = t; }],
+			[Uint16Array, EPermMove, function(t) { EPermMove = t; }],
+			[Uint16Array, CPermMove, function(t) { CPermMove = t; }],
+			[Uint16Array, SliceMove, function(t) { SliceMove = t; }],
+			[Uint16Array, SliceConj, function(t) { SliceConj = t; }],
+			[Uint16Array, MPermMove, function(t) { MPermMove = t; }],
+			[Uint16Array, MPermConj, function(t) { MPermConj = t; }],
+			[Uint16Array, CCombPMove, function(t) { CCombPMove = t; }],
+			[Uint16Array, CCombPConj, function(t) { CCombPConj = t; }],
+			[Int32Array, TwstFlipPrun, function(t) { TwstFlipPrun = t; }],
+			[Int32Array, SliceTwstPrun, function(t) { SliceTwstPrun = t; }],
+			[Int32Array, SliceFlipPrun, function(t) { SliceFlipPrun = t; }],
+			[Int32Array, MCPermPrun, function(t) { MCPermPrun = t; }],
+			[Int32Array, EPermCCombPPrun, function(t) { EPermCCombPPrun = t; }]
+		];
+	}
+
+	function exportTables() {
+		PARTIAL_INIT_LEVEL = 0;
+		initPrunTables();
+		var layout = tableLayout();
+		var offset = 8 + 4 * layout.length;
+		var offsets = [];
+		for (var i = 0; i < layout.length; i++) {
+			offsets.push(offset);
+			offset += (layout[i][1].length * layout[i][0].BYTES_PER_ELEMENT + 3) & ~3;
+		}
+		var buffer = new ArrayBuffer(offset);
+		var view = new DataView(buffer);
+		view.setUint32(0, TABLE_MAGIC, true);
+		view.setUint16(4, TABLE_VERSION, true);
+		view.setUint16(6, layout.length, true);
+		for (var i = 0; i < layout.length; i++) {
+			var Type = layout[i][0];
+			var table = layout[i][1];
+			var out = new Type(buffer, offsets[i], table.length);
+			for (var j = 0; j < table.length; j++) {
+				out[j] = table[j];
+				if (out[j] !== table[j]) {
+					throw new Error("table " + i + " does not fit " + Type.name);
+				}
+			}
+			view.setUint32(8 + 4 * i, table.length, true);
+		}
+		return buffer;
+	}
+
+	function loadTables(buffer) {
+		var layout = tableLayout();
+		var view = new DataView(buffer);
+		if (buffer.byteLength < 8 || view.getUint32(0, true) != TABLE_MAGIC ||
+			view.getUint16(4, true) != TABLE_VERSION || view.getUint16(6, true) != layout.length) {
+			throw new Error("not a min2phase table file");
+		}
+		var offset = 8 + 4 * layout.length;
+		var tables = [];
+		for (var i = 0; i < layout.length; i++) {
+			var Type = layout[i][0];
+			var length = view.getUint32(8 + 4 * i, true);
+			if (offset + length * Type.BYTES_PER_ELEMENT > buffer.byteLength) {
+				throw new Error("truncated min2phase table file");
+			}
+			tables.push(new Type(buffer, offset, length));
+			offset += (length * Type.BYTES_PER_ELEMENT + 3) & ~3;
+		}
+		if (InitPrunProgress < 0) {
+			initSymTables();
+		}
+		for (var i = 0; i < layout.length; i++) {
+			layout[i][2](tables[i]);
+		}
+		// Marks the pruning tables as complete
+		InitPrunProgress = 99;
+	}
+
 	function randomCube() {
 		var ep, cp;
 		var eo = ~~(Math.random() * 2048);
@@ -1390,6 +1505,8 @@ var min2phase = (function() {
 			PARTIAL_INIT_LEVEL = 0;
 			initPrunTables();
 		},
+		exportTables: exportTables,
+		loadTables: loadTables,
 		INVERSE_SOLUTION: INVERSE_SOLUTION
 	}
 })();
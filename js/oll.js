@@ -221,10 +221,14 @@
   let casesPromise;
   const loadCases = () => {
     if (!casesPromise) {
-      casesPromise = fetch('data/oll_cases.json').then((res) => {
+      // The JSON file stands in when the packed database is missing or fails
+      const fromJson = () => fetch('data/oll_cases.json').then((res) => {
         if (!res.ok) throw new Error('Could not load OLL data');
         return res.json();
       });
+      casesPromise = window.CaseData
+        ? window.CaseData.load().then((data) => data.oll).catch(fromJson)
+        : fromJson();
     }
     return casesPromise;
   };
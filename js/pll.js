@@ -177,10 +177,14 @@
     let memo;
     return () => {
       if (!memo) {
-        memo = fetch('data/pll_cases.json').then((res) => {
+        // The JSON file stands in when the packed database is missing or fails
+        const fromJson = () => fetch('data/pll_cases.json').then((res) => {
           if (!res.ok) throw new Error('Could not load PLL data');
           return res.json();
         });
+        memo = window.CaseData
+          ? window.CaseData.load().then((data) => data.pll).catch(fromJson)
+          : fromJson();
       }
       return memo;
     };
@@ -0,0 +1 @@
+(()=>{importScripts('rubiks-cube-solver.js');const toSolverOrder=(facelets)=>['F','R','U','D','L','B'].map(f=>facelets.substr('URFDLB'.indexOf(f)*9,9)).join('').toLowerCase();const solveFacelets=(facelets)=>{const solver=new rubiksCubeSolver.Solver(toSolverOrder(facelets));solver.solve();return solver.getPartitions();};self.onmessage=(e)=>{const{id,facelets}=e.data;Promise.resolve(facelets).then(solveFacelets).then(result=>self.postMessage({id,result})).catch(err=>self.postMessage({id,error:String((err&&err.message)||err)}));};})();
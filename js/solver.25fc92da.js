@@ -0,0 +1,41 @@
+(()=>{const cube=document.getElementById('cube');const scene=document.getElementById('scene');const dragArea=document.querySelector('.board-wrap');const solveBtn=document.getElementById('solve-btn');const resetBtn=document.getElementById('reset-btn');const solutionContainer=document.getElementById('solution-container');const paletteColors=document.querySelectorAll('.palette-color');let currentColor='white';let ollCases=new Map();let ollIndex={};let pllCases=new Map();let pllTable={};fetch('data/oll_cases.json').then(r=>r.json()).then(d=>ollCases=new Map(d.map(c=>[c.id,c]))).catch(e=>console.error("Failed to load OLL",e));fetch('data/oll_index.json').then(r=>r.json()).then(d=>ollIndex=d).catch(e=>console.error("Failed to load OLL index",e));fetch('data/pll_cases.json').then(r=>r.json()).then(d=>pllCases=new Map(d.map(c=>[c.id,c]))).catch(e=>console.error("Failed to load PLL",e));fetch('data/pll_table.json').then(r=>r.json()).then(d=>pllTable=d).catch(e=>console.error("Failed to load PLL table",e));paletteColors.forEach(el=>{el.addEventListener('click',()=>{paletteColors.forEach(p=>p.classList.remove('active'));el.classList.add('active');currentColor=el.dataset.color;});});let rotX=-25;let rotY=-45;let isDragging=false;let startX,startY;const updateRotation=()=>{cube.style.transform=`rotateX(${rotX}deg) rotateY(${rotY}deg)`;};dragArea.addEventListener('mousedown',(e)=>{isDragging=true;startX=e.clientX;startY=e.clientY;dragArea.style.cursor='grabbing';e.preventDefault();});document.addEventListener('mousemove',(e)=>{if(!isDragging)return;const dx=e.clientX-startX;const dy=e.clientY-startY;rotY+=dx*1.5;rotX-=dy*1.5;startX=e.clientX;startY=e.clientY;updateRotation();});document.addEventListener('mouseup',()=>{isDragging=false;dragArea.style.cursor='default';});dragArea.addEventListener('touchstart',(e)=>{isDragging=true;startX=e.touches[0].clientX;startY=e.touches[0].clientY;e.preventDefault();});document.addEventListener('touchmove',(e)=>{if(!isDragging)return;const dx=e.touches[0].clientX-startX;const dy=e.touches[0].clientY-startY;rotY+=dx*1.5;rotX-=dy*1.5;startX=e.touches[0].clientX;startY=e.touches[0].clientY;updateRotation();});document.addEventListener('touchend',()=>{isDragging=false;});const faces=['U','L','F','R','B','D'];const faceEls={};faces.forEach(f=>faceEls[f]=cube.querySelector(`.face-${f.toLowerCase()}`));const cubeState=new Map();const getColorForFace=(f)=>{switch(f){case'U':return'yellow';case'F':return'green';case'R':return'orange';case'B':return'blue';case'L':return'red';case'D':return'white';}
+return'';};const createStickers=()=>{faces.forEach(f=>{const faceEl=faceEls[f];faceEl.innerHTML='';for(let i=0;i<9;i++){const el=document.createElement('div');el.className='sticker';const id=`${f}${i}`;el.dataset.id=id;if(i===4){const centerColor=getColorForFace(f);el.classList.add(centerColor);el.style.cursor='default';cubeState.set(id,centerColor);}else{el.addEventListener('click',handleStickerClick);}
+faceEl.appendChild(el);}});};const handleStickerClick=(e)=>{const el=e.target;const id=el.dataset.id;['white','yellow','green','blue','red','orange'].forEach(c=>el.classList.remove(c));el.classList.add(currentColor);cubeState.set(id,currentColor);};const faceletString=(faceOrder)=>{const colorToFace={};for(const f of faceOrder)colorToFace[cubeState.get(`${f}4`)]=f;let out="";for(const f of faceOrder){for(let i=0;i<9;i++){const id=`${f}${i}`;const color=cubeState.get(id);if(!color)throw new Error(`Missing color at ${id}`);out+=colorToFace[color];}}
+return out;};const validateState=()=>{const counts={white:0,yellow:0,green:0,blue:0,red:0,orange:0};for(const color of cubeState.values()){if(counts[color]!==undefined)counts[color]++;}
+const missing=[];for(const[c,count]of Object.entries(counts)){if(count!==9)missing.push(`${c}: ${count}/9`);}
+if(missing.length>0){return`Invalid State:\n${missing.join('\n')}`;}
+return null;};const analyzeCFOP=()=>{const report=[];const checkEdge=(dId,fId,dColor,fColor)=>{return cubeState.get(dId)===dColor&&cubeState.get(fId)===fColor;};const dColor='white';const fColor='green';const rColor='orange';const bColor='blue';const lColor='red';const crossEdges=[checkEdge('D1','F7',dColor,fColor),checkEdge('D5','R7',dColor,rColor),checkEdge('D7','B7',dColor,bColor),checkEdge('D3','L7',dColor,lColor)];const solvedCrossEdges=crossEdges.filter(x=>x).length;if(solvedCrossEdges===4){report.push("✅ Cross is Solved");}else{report.push(`⚠️ Cross: ${solvedCrossEdges}/4 edges solved`);}
+const uColor='yellow';let uPattern="";for(let i=0;i<9;i++){if(i===4)continue;uPattern+=(cubeState.get(`U${i}`)===uColor?"1":"0");}
+let ringPattern="";const ringIndices=[['B',2],['B',1],['B',0],['L',0],['L',1],['L',2],['R',2],['R',1],['R',0],['F',0],['F',1],['F',2]];for(const[f,i]of ringIndices){ringPattern+=(cubeState.get(`${f}${i}`)===uColor?"1":"0");}
+const ollMatch=ollIndex[parseInt(uPattern+ringPattern,2)];if(ollMatch){const[ollId,auf]=ollMatch;const ollCase=ollCases.get(ollId);report.push(`💡 OLL Case: ${ollId}`);if(ollCase)report.push(`   Alg: ${auf?auf+' ':''}${ollCase.solution}`);}else if(uPattern==="11111111"){report.push("✅ OLL is Solved");const centerToChar={[cubeState.get('F4')]:'A',[cubeState.get('R4')]:'B',[cubeState.get('B4')]:'C',[cubeState.get('L4')]:'D'};let pllString="";for(const[f,i]of ringIndices){pllString+=centerToChar[cubeState.get(`${f}${i}`)]||'?';}
+const isSolved=cubeState.get('F0')===cubeState.get('F1')&&cubeState.get('F1')===cubeState.get('F2')&&cubeState.get('R0')===cubeState.get('R1')&&cubeState.get('R1')===cubeState.get('R2')&&cubeState.get('B0')===cubeState.get('B1')&&cubeState.get('B1')===cubeState.get('B2')&&cubeState.get('L0')===cubeState.get('L1')&&cubeState.get('L1')===cubeState.get('L2');if(isSolved){report.push("✅ PLL is Solved (Cube Solved)");}else{const pllMatch=pllTable[pllString];const pllCase=pllMatch&&pllCases.get(pllMatch[0]);if(pllCase){const[pllId,preAuf,postAuf]=pllMatch;report.push(`💡 PLL Case: ${pllId}`);report.push(`   Alg: ${[preAuf,pllCase.solution,postAuf].filter(Boolean).join(' ')}`);}else{report.push("ℹ️ PLL Stage (no matching case)");}}}
+return report;};const formatMoves=(moves)=>{if(!moves)return"None";if(Array.isArray(moves))return moves.join("<br>");return moves;};const steps=[['cross','1. Cross'],['f2l','2. F2L (First Two Layers)'],['oll','3. OLL (Orientation)'],['pll','4. PLL (Permutation)']];const renderSolution=(solution)=>{let html=`
+      <div class="solution-section">
+        <h3>CFOP Solution</h3>
+    `;let totalMoves=0;for(const[phase,title]of steps){html+=`
+        <div class="solution-step">
+          <h4>${title}</h4>
+          <div class="solution-moves">${formatMoves(solution[phase])}</div>
+        </div>
+      `;const p=solution[phase];if(Array.isArray(p)){p.forEach(s=>totalMoves+=s.split(' ').length);}else if(typeof p==='string'){totalMoves+=p.split(' ').length;}}
+html+=`
+        <div class="solution-step" style="margin-top: 15px; border-top: 1px solid var(--border); padding-top: 10px;">
+          <h4>Total Moves: ${totalMoves}</h4>
+        </div>
+    `;return html;};const WORKER_URL='js/solver-worker.843b0d4c.js';const idleWorkers=[];let running=null;let nextRequestId=0;const spawnWorker=()=>{if(typeof Worker==='undefined')return;idleWorkers.push(new Worker(WORKER_URL));};const cancelSolve=()=>{if(!running)return;running.worker.terminate();const error=new Error('Solve cancelled');error.cancelled=true;running.reject(error);running=null;};const requestSolve=(facelets)=>new Promise((resolve,reject)=>{cancelSolve();if(!idleWorkers.length)spawnWorker();const worker=idleWorkers.shift();if(!worker){reject(new Error('This browser cannot run the solver (no Web Worker support).'));return;}
+const id=++nextRequestId;running={worker,id,resolve,reject};const finish=()=>{running=null;idleWorkers.push(worker);};worker.onmessage=(e)=>{if(!running||running.id!==e.data.id)return;finish();if(e.data.error)reject(new Error(e.data.error));else resolve(e.data.result);};worker.onerror=(e)=>{if(!running||running.id!==id)return;e.preventDefault();running=null;worker.terminate();reject(new Error(e.message||'Solver worker failed'));};worker.postMessage({id,facelets});if(!idleWorkers.length)spawnWorker();});spawnWorker();const solve=()=>{const error=validateState();if(error){alert(error);return;}
+solutionContainer.innerHTML='<div class="solution-section"><p>Analyzing...</p></div>';let facelets;Promise.resolve().then(()=>{facelets=faceletString(['U','R','F','D','L','B']);return requestSolve(facelets);}).then((result)=>{let html=renderSolution(result,facelets);const cfopReport=analyzeCFOP();if(cfopReport.length>0){html+=`
+          <div class="solution-step" style="margin-top:15px; border-top:1px solid var(--border); padding-top:10px;">
+            <h4>CFOP Analysis</h4>
+            <ul style="padding-left: 20px; margin: 5px 0;">
+              ${cfopReport.map(line=>`<li>${line}</li>`).join('')}
+            </ul>
+          </div>
+        `;}
+solutionContainer.innerHTML=html+'</div>';}).catch((e)=>{if(e.cancelled)return;console.error(e);solutionContainer.innerHTML=`
+        <div class="solution-section">
+          <p class="error" style="color: var(--accent-strong); font-weight: bold;">Unsolvable state.</p>
+          <p class="muted">Error details: ${e.message||e}</p>
+          <p class="muted" style="font-size:0.9em">Ensure all centers are correct and no pieces are twisted.</p>
+        </div>
+      `;});};solveBtn.addEventListener('click',solve);resetBtn.addEventListener('click',()=>{cancelSolve();cubeState.clear();createStickers();solutionContainer.innerHTML='<div class="solution-section"><p class="muted">Enter cube state to see solution.</p></div>';});createStickers();})();
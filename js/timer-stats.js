@@ -0,0 +1,242 @@
+(() => {
+  // Incremental statistics for js/timer.js. Times are milliseconds, or null
+  // for a DNF. Adding a run or changing one (a penalty) costs O(k log n) for k
+  // rolling windows; deleting a run also shifts the stored list.
+  //
+  // Every multiset of finished times is a treap keyed by time with subtree
+  // counts and sums, which gives the k-th smallest time and the sum of the k
+  // smallest in O(log n): the median of the session, and the trimmed mean of
+  // each aoN window (the fastest and slowest 5% dropped, at least one each,
+  // with DNFs counted as the slowest).
+
+  const node = (value, copies) => ({
+    value, copies, priority: Math.random(), left: null, right: null, count: copies, sum: value * copies,
+  });
+
+  const count = (t) => (t ? t.count : 0);
+  const sum = (t) => (t ? t.sum : 0);
+
+  const pull = (t) => {
+    t.count = t.copies + count(t.left) + count(t.right);
+    t.sum = t.value * t.copies + sum(t.left) + sum(t.right);
+    return t;
+  };
+
+  // [keys < value (or <= value when `inclusive`), the rest]
+  const split = (t, value, inclusive) => {
+    if (!t) return [null, null];
+    if (t.value < value || (inclusive && t.value === value)) {
+      const [left, right] = split(t.right, value, inclusive);
+      t.right = left;
+      return [pull(t), right];
+    }
+    const [left, right] = split(t.left, value, inclusive);
+    t.left = right;
+    return [left, pull(t)];
+  };
+
+  const merge = (a, b) => {
+    if (!a || !b) return a || b;
+    if (a.priority > b.priority) {
+      a.right = merge(a.right, b);
+      return pull(a);
+    }
+    b.left = merge(a, b.left);
+    return pull(b);
+  };
+
+  class OrderTree {
+    constructor() {
+      this.root = null;
+    }
+
+    get size() {
+      return count(this.root);
+    }
+
+    get total() {
+      return sum(this.root);
+    }
+
+    // Adds `change` copies of `value` (negative to remove)
+    adjust(value, change) {
+      const [less, rest] = split(this.root, value, false);
+      const [equal, greater] = split(rest, value, true);
+      let middle = equal;
+      if (middle) {
+        middle.copies += change;
+        middle = middle.copies > 0 ? pull(middle) : null;
+      } else if (change > 0) {
+        middle = node(value, change);
+      }
+      this.root = merge(merge(less, middle), greater);
+    }
+
+    insert(value) {
+      this.adjust(value, 1);
+    }
+
+    remove(value) {
+      this.adjust(value, -1);
+    }
+
+    // k-th smallest value, 0-based
+    kth(k) {
+      let t = this.root;
+      while (t) {
+        const left = count(t.left);
+        if (k < left) {
+          t = t.left;
+        } else if (k < left + t.copies) {
+          return t.value;
+        } else {
+          k -= left + t.copies;
+          t = t.right;
+        }
+      }
+      return undefined;
+    }
+
+    // Sum of the k smallest values
+    sumSmallest(k) {
+      let t = this.root;
+      let total = 0;
+      while (t && k > 0) {
+        const left = count(t.left);
+        if (k <= left) {
+          t = t.left;
+        } else {
+          const taken = Math.min(k - left, t.copies);
+          total += sum(t.left) + t.value * taken;
+          k -= left + taken;
+          t = t.right;
+        }
+      }
+      return total;
+    }
+  }
+
+  // Finished times in a tree plus a DNF count
+  class TimeSet {
+    constructor() {
+      this.tree = new OrderTree();
+      this.dnf = 0;
+    }
+
+    get size() {
+      return this.tree.size + this.dnf;
+    }
+
+    add(time) {
+      if (time === null) this.dnf += 1;
+      else this.tree.insert(time);
+    }
+
+    delete(time) {
+      if (time === null) this.dnf -= 1;
+      else this.tree.remove(time);
+    }
+
+    // Mean without the `trim` fastest and slowest; null when the DNFs reach
+    // into the counted times
+    trimmedMean(trim) {
+      if (this.dnf > trim) return null;
+      const finished = this.tree.size;
+      const kept = finished - (trim - this.dnf);
+      return (this.tree.sumSmallest(kept) - this.tree.sumSmallest(trim)) / (this.size - 2 * trim);
+    }
+  }
+
+  const trimFor = (n) => Math.max(1, Math.ceil(n * 0.05));
+
+  const normalise = (time) => (typeof time === 'number' && Number.isFinite(time) ? time : null);
+
+  class Stats {
+    constructor(windows) {
+      this.windows = windows;
+      this.reset([]);
+    }
+
+    reset(times) {
+      this.times = [];
+      this.all = new TimeSet();
+      this.recent = new Map(this.windows.map((n) => [n, new TimeSet()]));
+      times.forEach((time) => this.push(time));
+    }
+
+    push(time) {
+      time = normalise(time);
+      this.times.push(time);
+      this.all.add(time);
+      const last = this.times.length - 1;
+      this.recent.forEach((set, n) => {
+        set.add(time);
+        if (last >= n) set.delete(this.times[last - n]);
+      });
+    }
+
+    // Adds runs older than all the others (oldest first); each window only
+    // takes the newest of them that still fit
+    prepend(times) {
+      times = times.map(normalise);
+      times.forEach((time) => this.all.add(time));
+      this.recent.forEach((set, n) => {
+        const room = n - this.times.length;
+        if (room > 0) times.slice(-room).forEach((time) => set.add(time));
+      });
+      this.times = times.concat(this.times);
+    }
+
+    set(index, time) {
+      time = normalise(time);
+      const old = this.times[index];
+      this.times[index] = time;
+      this.all.delete(old);
+      this.all.add(time);
+      this.recent.forEach((set, n) => {
+        if (index >= this.times.length - n) {
+          set.delete(old);
+          set.add(time);
+        }
+      });
+    }
+
+    remove(index) {
+      const before = this.times.length;
+      const [old] = this.times.splice(index, 1);
+      this.all.delete(old);
+      const length = this.times.length;
+      this.recent.forEach((set, n) => {
+        // The run before the window moves into it
+        if (index >= before - n) {
+          set.delete(old);
+          if (length >= n) set.add(this.times[length - n]);
+        }
+      });
+    }
+
+    // { count, best, worst, mean, median } over finished runs (undefined when
+    // there are none), and averages: { n: ms, null for DNF, or undefined
+    // before n runs }
+    summary() {
+      const tree = this.all.tree;
+      const finished = tree.size;
+      const averages = {};
+      this.recent.forEach((set, n) => {
+        averages[n] = set.size === n ? set.trimmedMean(trimFor(n)) : undefined;
+      });
+      if (!finished) return { count: this.times.length, averages };
+      const mid = Math.floor(finished / 2);
+      return {
+        count: this.times.length,
+        best: tree.kth(0),
+        worst: tree.kth(finished - 1),
+        mean: tree.total / finished,
+        median: finished % 2 === 0 ? (tree.kth(mid - 1) + tree.kth(mid)) / 2 : tree.kth(mid),
+        averages,
+      };
+    }
+  }
+
+  window.TimerStats = { create: (windows) => new Stats(windows), OrderTree };
+})();
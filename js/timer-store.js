@@ -0,0 +1,113 @@
+(() => {
+  // Append-only timer history for js/timer.js in IndexedDB. Each run is one
+  // record under an auto-increment `seq` key, so a solve or penalty change
+  // writes one record instead of the whole history, and the newest runs can
+  // be read a page at a time. Writes run one after another, so an update
+  // queued right after an add always finds the run's key.
+  //
+  // Histories from the old single localStorage array are copied over once, in
+  // one transaction; the localStorage key is removed only after it commits.
+
+  const DB_NAME = 'cfop-timer';
+  const DB_VERSION = 1;
+  const STORE = 'runs';
+
+  const done = (request) => new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+
+  const committed = (tx) => new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error || new Error('Transaction aborted'));
+  });
+
+  const openDatabase = () => {
+    const request = indexedDB.open(DB_NAME, DB_VERSION);
+    request.onupgradeneeded = () => {
+      request.result.createObjectStore(STORE, { keyPath: 'seq', autoIncrement: true });
+    };
+    return done(request);
+  };
+
+  class Store {
+    constructor(db) {
+      this.db = db;
+      this.queue = Promise.resolve();
+    }
+
+    // Runs `op(objectStore)` in its own read-write transaction after every
+    // earlier write; resolves once the transaction commits
+    write(op) {
+      const run = this.queue.then(() => {
+        const tx = this.db.transaction(STORE, 'readwrite');
+        const result = op(tx.objectStore(STORE));
+        return committed(tx).then(() => result);
+      });
+      this.queue = run.catch((err) => console.error('Could not save timer data', err));
+      return run;
+    }
+
+    // Copies `runs` (oldest first) in one transaction
+    import(runs) {
+      return this.write((store) => {
+        runs.forEach((run) => {
+          done(store.add(run)).then((seq) => { run.seq = seq; });
+        });
+      });
+    }
+
+    add(run) {
+      return this.write((store) => done(store.add(run)).then((seq) => { run.seq = seq; }));
+    }
+
+    update(run) {
+      return this.write((store) => { store.put(run); });
+    }
+
+    remove(run) {
+      return this.write((store) => { store.delete(run.seq); });
+    }
+
+    clear() {
+      return this.write((store) => { store.clear(); });
+    }
+
+    // Up to `limit` runs older than `beforeSeq` (newest runs when undefined),
+    // oldest first
+    page(beforeSeq, limit) {
+      return this.queue.then(() => new Promise((resolve, reject) => {
+        const range = beforeSeq === undefined ? null : IDBKeyRange.upperBound(beforeSeq, true);
+        const request = this.db.transaction(STORE).objectStore(STORE).openCursor(range, 'prev');
+        const runs = [];
+        request.onsuccess = () => {
+          const cursor = request.result;
+          if (cursor && runs.length < limit) {
+            runs.push(cursor.value);
+            cursor.continue();
+          } else {
+            resolve(runs.reverse());
+          }
+        };
+        request.onerror = () => reject(request.error);
+      }));
+    }
+  }
+
+  // Resolves to a Store, after moving any runs kept under `legacyKey` in
+  // localStorage (read with `readLegacy`) into it
+  const open = ({ legacyKey, readLegacy }) => {
+    if (typeof indexedDB === 'undefined') return Promise.reject(new Error('IndexedDB is not available'));
+    return openDatabase().then((db) => {
+      const store = new Store(db);
+      if (localStorage.getItem(legacyKey) === null) return store;
+      return store.import(readLegacy()).then(() => {
+        localStorage.removeItem(legacyKey);
+        return store;
+      });
+    });
+  };
+
+  window.TimerStore = { open };
+})();
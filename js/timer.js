@@ -7,30 +7,54 @@
   const newScrambleBtn = document.getElementById('new-scramble');
   const rowsEl = document.getElementById('time-rows');
   const clearBtn = document.getElementById('clear-times');
+  const olderBtn = document.getElementById('older-times');
   const bestEl = document.getElementById('stat-best');
   const worstEl = document.getElementById('stat-worst');
   const avgEl = document.getElementById('stat-avg');
   const medianEl = document.getElementById('stat-median');
+  const averageEls = new Map([5, 12, 50, 100].map((n) => [n, document.getElementById(`stat-ao${n}`)]));
   const graphEl = document.getElementById('timer-graph');
   const triggerArea = document.getElementById('timer-touch');
 
   const storageKey = 'cfop-timer-runs';
+  const poolKey = 'cfop-timer-scramble-pool';
   const holdThreshold = 500; // ms
+  // Runs read from storage at a time, and rows added by "Show older times";
+  // one page covers the largest rolling average
+  const pageSize = 100;
 
   const axes = { R: 'R', L: 'R', U: 'U', D: 'U', F: 'F', B: 'F' };
   const faces = ['R', 'L', 'U', 'D', 'F', 'B'];
   const modifiers = ['', "'", '2'];
 
+  // Random-state scrambles from data/scrambles.bin (build_scramble_pool.py).
+  // Each is used once, starting from a random point; the move generator below
+  // covers the moment before the file arrives and an exhausted pool.
+  const POOL_VERSION = 1;
+  const poolMoves = ['U', 'R', 'F', 'D', 'L', 'B'].flatMap((face) => [face, `${face}2`, `${face}'`]);
+
   const state = {
     runs: [],
+    visibleRows: pageSize,
+    // Resolves to the TimerStore once the newest page of runs is loaded, or
+    // to null when runs stay in localStorage
+    storeReady: null,
+    historyComplete: false,
+    historyGeneration: 0,
     status: 'idle',
     holdTimer: null,
     holdStartedAt: 0,
     startTime: 0,
     tickId: null,
+    stats: window.TimerStats.create([...averageEls.keys()]),
     scramble: '',
+    scrambleFromPool: false,
+    pool: [],
+    poolCursor: null,
   };
 
+  // The localStorage array is what older versions stored, and the fallback
+  // when IndexedDB is unavailable
   const loadRuns = () => {
     try {
       const raw = localStorage.getItem(storageKey);
@@ -52,9 +76,115 @@
     localStorage.setItem(storageKey, JSON.stringify(state.runs));
   };
 
+  // Stores one change: 'add', 'update' or 'remove' of `entry`, or 'clear'
+  const persist = (change, entry) => {
+    state.storeReady.then((store) => {
+      if (store) return store[change](entry);
+      saveRuns();
+      return undefined;
+    }).catch((err) => console.error('Could not save timer data', err));
+  };
+
+  // Runs older than the loaded ones, oldest first; adds them to the history
+  const addOlderRuns = (older) => {
+    state.runs = older.concat(state.runs);
+    state.stats.prepend(older.map(computedTime));
+  };
+
+  // Reads the remaining history a page at a time while the page is idle
+  const loadOlderPages = (store) => {
+    const generation = state.historyGeneration;
+    const idle = (fn) => (window.requestIdleCallback ? window.requestIdleCallback(fn) : setTimeout(fn, 0));
+    const next = () => {
+      if (generation !== state.historyGeneration) return;
+      const oldest = state.runs.find((run) => run.seq !== undefined);
+      if (!oldest) {
+        state.historyComplete = true;
+        renderAll();
+        return;
+      }
+      store.page(oldest.seq, pageSize).then((older) => {
+        if (generation !== state.historyGeneration) return;
+        if (!older.length) {
+          state.historyComplete = true;
+          renderAll();
+          return;
+        }
+        addOlderRuns(older);
+        renderRows();
+        renderStats();
+        idle(next);
+      }).catch((err) => console.error('Could not load timer data', err));
+    };
+    idle(next);
+  };
+
+  const openHistory = () => {
+    // Runs cleared while the store opens must not come back
+    const generation = state.historyGeneration;
+    const cleared = () => generation !== state.historyGeneration;
+    state.storeReady = window.TimerStore.open({ legacyKey: storageKey, readLegacy: loadRuns })
+      .then((store) => store.page(undefined, pageSize).then((recent) => {
+        if (cleared()) return store;
+        addOlderRuns(recent);
+        renderAll();
+        loadOlderPages(store);
+        return store;
+      }))
+      .catch((err) => {
+        console.error('Timer history stays in localStorage', err);
+        if (cleared()) return null;
+        addOlderRuns(loadRuns());
+        state.historyComplete = true;
+        renderAll();
+        return null;
+      });
+  };
+
   const randomItem = (arr) => arr[Math.floor(Math.random() * arr.length)];
 
-  const generateScramble = () => {
+  const decodePool = (buffer) => {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== 'SCRM' || view.getUint16(4, true) !== POOL_VERSION || view.getUint16(6, true) !== poolMoves.length) {
+      throw new Error('Unsupported scramble pool');
+    }
+    const count = view.getUint32(8, true);
+    const bytes = new Uint8Array(buffer);
+    const scrambles = [];
+    let pos = 12;
+    for (let i = 0; i < count; i += 1) {
+      const length = bytes[pos];
+      scrambles.push(Array.from(bytes.subarray(pos + 1, pos + 1 + length), (m) => poolMoves[m]).join(' '));
+      pos += 1 + length;
+    }
+    return scrambles;
+  };
+
+  // { size, offset, drawn }; restarts at a new random offset when the pool
+  // file changes size.
+  const loadPoolCursor = (size) => {
+    try {
+      const cursor = JSON.parse(localStorage.getItem(poolKey));
+      if (cursor && cursor.size === size && Number.isInteger(cursor.offset) && Number.isInteger(cursor.drawn)) {
+        return cursor;
+      }
+    } catch (err) {
+      // Fall through to a fresh cursor
+    }
+    return { size, offset: Math.floor(Math.random() * size), drawn: 0 };
+  };
+
+  const drawPoolScramble = () => {
+    const cursor = state.poolCursor;
+    if (!cursor || cursor.drawn >= cursor.size) return null;
+    const scramble = state.pool[(cursor.offset + cursor.drawn) % cursor.size];
+    cursor.drawn += 1;
+    localStorage.setItem(poolKey, JSON.stringify(cursor));
+    return scramble;
+  };
+
+  const randomMoveScramble = () => {
     const length = 20 + Math.floor(Math.random() * 6);
     const moves = [];
     let prevAxis = null;
@@ -66,10 +196,28 @@
       moves.push(face + mod);
       prevAxis = axis;
     }
-    state.scramble = moves.join(' ');
+    return moves.join(' ');
+  };
+
+  const generateScramble = () => {
+    const pooled = drawPoolScramble();
+    state.scrambleFromPool = pooled !== null;
+    state.scramble = pooled ?? randomMoveScramble();
     scrambleEl.textContent = state.scramble;
   };
 
+  const loadPool = () => {
+    fetch('data/scrambles.bin').then((res) => {
+      if (!res.ok) throw new Error(`HTTP ${res.status}`);
+      return res.arrayBuffer();
+    }).then((buffer) => {
+      state.pool = decodePool(buffer);
+      state.poolCursor = state.pool.length ? loadPoolCursor(state.pool.length) : null;
+      // Swap out the stand-in scramble unless a solve is under way
+      if (!state.scrambleFromPool && state.status === 'idle') generateScramble();
+    }).catch((err) => console.error('Could not load scramble pool', err));
+  };
+
   const formatMs = (ms) => {
     if (Number.isNaN(ms)) return '—';
     if (ms >= 60000) {
@@ -93,29 +241,15 @@
   };
 
   const renderStats = () => {
-    const valid = state.runs
-      .map((run) => computedTime(run))
-      .filter((v) => typeof v === 'number' && !Number.isNaN(v));
-
-    if (!valid.length) {
-      bestEl.textContent = '—';
-      worstEl.textContent = '—';
-      avgEl.textContent = '—';
-      medianEl.textContent = '—';
-      return;
-    }
-
-    const best = Math.min(...valid);
-    const worst = Math.max(...valid);
-    const avg = valid.reduce((a, b) => a + b, 0) / valid.length;
-    const sorted = [...valid].sort((a, b) => a - b);
-    const mid = Math.floor(sorted.length / 2);
-    const median = sorted.length % 2 === 0 ? (sorted[mid - 1] + sorted[mid]) / 2 : sorted[mid];
-
-    bestEl.textContent = formatMs(best);
-    worstEl.textContent = formatMs(worst);
-    avgEl.textContent = formatMs(avg);
-    medianEl.textContent = formatMs(median);
+    const { best, worst, mean, median, averages } = state.stats.summary();
+    const show = (ms) => (ms === undefined ? '—' : formatMs(ms));
+    bestEl.textContent = show(best);
+    worstEl.textContent = show(worst);
+    avgEl.textContent = show(mean);
+    medianEl.textContent = show(median);
+    averageEls.forEach((el, n) => {
+      if (el) el.textContent = averages[n] === null ? 'DNF' : show(averages[n]);
+    });
   };
 
   const renderGraph = () => {
@@ -161,7 +295,12 @@
   const renderRows = () => {
     if (!rowsEl) return;
     rowsEl.innerHTML = '';
-    state.runs.forEach((entry, idx) => {
+    const first = Math.max(0, state.runs.length - state.visibleRows);
+    if (olderBtn) olderBtn.hidden = first === 0 && state.historyComplete;
+    // Older pages may have been added since this row was drawn
+    const indexOf = (entry) => state.runs.lastIndexOf(entry);
+    state.runs.slice(first).forEach((entry, offset) => {
+      const idx = first + offset;
       const row = document.createElement('div');
       row.className = 'time-row';
 
@@ -190,7 +329,8 @@
       if (entry.penalty === 'plus2') plusBtn.classList.add('active');
       plusBtn.addEventListener('click', () => {
         entry.penalty = entry.penalty === 'plus2' ? 'none' : 'plus2';
-        saveRuns();
+        state.stats.set(indexOf(entry), computedTime(entry));
+        persist('update', entry);
         renderAll();
       });
 
@@ -200,7 +340,8 @@
       if (entry.penalty === 'dnf') dnfBtn.classList.add('active');
       dnfBtn.addEventListener('click', () => {
         entry.penalty = entry.penalty === 'dnf' ? 'none' : 'dnf';
-        saveRuns();
+        state.stats.set(indexOf(entry), computedTime(entry));
+        persist('update', entry);
         renderAll();
       });
 
@@ -208,8 +349,10 @@
       delBtn.type = 'button';
       delBtn.textContent = 'Delete';
       delBtn.addEventListener('click', () => {
-        state.runs.splice(idx, 1);
-        saveRuns();
+        const current = indexOf(entry);
+        state.runs.splice(current, 1);
+        state.stats.remove(current);
+        persist('remove', entry);
         renderAll();
       });
 
@@ -231,13 +374,15 @@
   };
 
   const addRun = (ms) => {
-    state.runs.push({
+    const entry = {
       id: crypto.randomUUID?.() || `${Date.now()}-${Math.random().toString(16).slice(2)}`,
       ms,
       penalty: 'none',
       created: Date.now(),
-    });
-    saveRuns();
+    };
+    state.runs.push(entry);
+    state.stats.push(computedTime(entry));
+    persist('add', entry);
     renderAll();
   };
 
@@ -362,12 +507,21 @@
 
   clearBtn?.addEventListener('click', () => {
     state.runs = [];
-    saveRuns();
+    state.stats.reset([]);
+    state.historyGeneration += 1;
+    state.historyComplete = true;
+    persist('clear');
     renderAll();
   });
 
-  state.runs = loadRuns();
+  olderBtn?.addEventListener('click', () => {
+    state.visibleRows += pageSize;
+    renderRows();
+  });
+
+  openHistory();
   generateScramble();
+  loadPool();
   renderAll();
   setInstruction('Hold spacebar or left-click for 0.5s, release to start. Press again to stop.');
 })();
@@ -0,0 +1,191 @@
+import argparse
+import io
+import itertools
+
+import numpy as np
+
+from cubie import EDGES, CORNERS, FACE_MOVES, MOVE_CUBES
+from regenerate_cases import ROOT, write_if_changed
+
+# --- Coordinate move and pruning tables ---
+# A coordinate tracks a few pieces (their positions and twists/flips) and
+# packs them into a dense index. For each coordinate we store:
+#
+#   <name>_move.npy  int32 (size, 18): index after each face turn (FACE_MOVES order)
+#   <name>_dist.npy  uint8 (size,):    BFS distance (HTM) to the solved index
+#
+# Tables are plain .npy files opened with mmap_mode='r', so loading is a
+# header read and worker processes share the same pages. Rebuild them with
+# `python pruning_tables.py`.
+
+TABLE_DIR = ROOT / 'tables'
+UNREACHED = 255
+
+# Pieces tracked by each coordinate (indices into cubie.EDGES / CORNERS).
+SLOTS = {'FR': ('DFR', 'FR'), 'FL': ('DFL', 'FL'), 'BL': ('DBL', 'BL'), 'BR': ('DBR', 'BR')}
+COORDS = {'cross': ([EDGES.index(e) for e in ('DR', 'DF', 'DL', 'DB')], [])}
+for _slot, (_corner, _edge) in SLOTS.items():
+    COORDS[f'pair_{_slot}'] = ([EDGES.index(_edge)], [CORNERS.index(_corner)])
+
+def _piece_moves(n_pos, cube_part):
+    # dest[m, p] / dori[m, p]: where the piece at position p goes under move m
+    # and the twist/flip it gains.
+    dest = np.zeros((len(FACE_MOVES), n_pos), dtype=np.intp)
+    dori = np.zeros((len(FACE_MOVES), n_pos), dtype=np.intp)
+    for m, name in enumerate(FACE_MOVES):
+        perm, ori = cube_part(MOVE_CUBES[name])
+        for i, src in enumerate(perm):
+            dest[m, src] = i
+            dori[m, src] = ori[i]
+    return dest, dori
+
+_edge_moves = _piece_moves(12, lambda c: (c[2], c[3]))
+_corner_moves = _piece_moves(8, lambda c: (c[0], c[1]))
+
+def _perm_rank(pos, n):
+    # Dense rank of ordered distinct positions (rows of `pos`) among nPk.
+    k = pos.shape[1]
+    rank = np.zeros(len(pos), dtype=np.int64)
+    for i in range(k):
+        smaller_used = (pos[:, :i] < pos[:, i:i+1]).sum(axis=1)
+        rank = rank * (n - i) + pos[:, i] - smaller_used
+    return rank
+
+def _ori_rank(ori, base):
+    rank = np.zeros(len(ori), dtype=np.int64)
+    for i in range(ori.shape[1]):
+        rank = rank * base + ori[:, i]
+    return rank
+
+class Coordinate:
+    # Dense index over the positions/orientations of `edges` and `corners`:
+    # edge part (12Pk * 2^k) is the major digit, corner part (8Pj * 3^j) minor.
+    def __init__(self, edges, corners):
+        self.edges = list(edges)
+        self.corners = list(corners)
+        k, j = len(self.edges), len(self.corners)
+        self.corner_size = _npk(8, j) * 3**j
+        self.size = _npk(12, k) * 2**k * self.corner_size
+
+    def index(self, ep, eo, cp, co):
+        # Arrays of shape (N, k) / (N, j): positions and orientations of the
+        # tracked pieces, in `edges` / `corners` order.
+        edge_rank = _perm_rank(ep, 12) * 2**ep.shape[1] + _ori_rank(eo, 2)
+        corner_rank = _perm_rank(cp, 8) * 3**cp.shape[1] + _ori_rank(co, 3)
+        return edge_rank * self.corner_size + corner_rank
+
+    def of(self, cube):
+        # Index of a cubie-model state.
+        cp, co, ep, eo = cube
+        epos = [ep.index(e) for e in self.edges]
+        cpos = [cp.index(c) for c in self.corners]
+        return self._index_one(epos, [eo[p] for p in epos], cpos, [co[p] for p in cpos])
+
+    def solved_index(self):
+        return self._index_one(self.edges, [0]*len(self.edges), self.corners, [0]*len(self.corners))
+
+    def _index_one(self, ep, eo, cp, co):
+        return int(self.index(_rows([ep], len(ep)), _rows([eo], len(eo)),
+                              _rows([cp], len(cp)), _rows([co], len(co)))[0])
+
+    def enumerate_states(self):
+        # Every (ep, eo, cp, co) combination, ordered by index.
+        k, j = len(self.edges), len(self.corners)
+        parts = [
+            _rows(list(itertools.permutations(range(12), k)), k),
+            _rows(list(itertools.product(range(2), repeat=k)), k),
+            _rows(list(itertools.permutations(range(8), j)), j),
+            _rows(list(itertools.product(range(3), repeat=j)), j),
+        ]
+        grids = np.meshgrid(*[np.arange(len(p)) for p in parts], indexing='ij')
+        return [p[g.ravel()] for p, g in zip(parts, grids)]
+
+    def move_table(self):
+        ep, eo, cp, co = self.enumerate_states()
+        assert (self.index(ep, eo, cp, co) == np.arange(self.size)).all()
+        (e_dest, e_dori), (c_dest, c_dori) = _edge_moves, _corner_moves
+        table = np.empty((self.size, len(FACE_MOVES)), dtype=np.int32)
+        for m in range(len(FACE_MOVES)):
+            table[:, m] = self.index(
+                e_dest[m][ep], (eo + e_dori[m][ep]) % 2,
+                c_dest[m][cp], (co + c_dori[m][cp]) % 3,
+            )
+        return table
+
+def _rows(seq, width):
+    return np.array(seq, dtype=np.intp).reshape(len(seq), width)
+
+def _npk(n, k):
+    result = 1
+    for i in range(k):
+        result *= n - i
+    return result
+
+def bfs_distances(move_table, start):
+    dist = np.full(len(move_table), UNREACHED, dtype=np.uint8)
+    dist[start] = 0
+    frontier = np.array([start])
+    depth = 0
+    while len(frontier):
+        depth += 1
+        nxt = np.unique(move_table[frontier].ravel())
+        frontier = nxt[dist[nxt] == UNREACHED]
+        dist[frontier] = depth
+    return dist
+
+_coordinates = {}
+
+def coordinate(name):
+    if name not in _coordinates:
+        _coordinates[name] = Coordinate(*COORDS[name])
+    return _coordinates[name]
+
+def table_path(name, kind):
+    return TABLE_DIR / f'{name}_{kind}.npy'
+
+def _npy_bytes(array):
+    buf = io.BytesIO()
+    np.save(buf, array)
+    return buf.getvalue()
+
+def build(name):
+    coord = coordinate(name)
+    moves = coord.move_table()
+    dist = bfs_distances(moves, coord.solved_index())
+    write_if_changed(table_path(name, 'move'), _npy_bytes(moves))
+    write_if_changed(table_path(name, 'dist'), _npy_bytes(dist))
+    return dist
+
+_loaded = {}
+
+def load_table(name, kind):
+    # Read-only memory map, opened once per process.
+    key = (name, kind)
+    if key not in _loaded:
+        path = table_path(name, kind)
+        if not path.exists():
+            raise FileNotFoundError(f'{path} is missing; run python pruning_tables.py')
+        _loaded[key] = np.load(path, mmap_mode='r')
+    return _loaded[key]
+
+def distance(name, cube):
+    # Face turns needed to solve the pieces of coordinate `name` in `cube`.
+    return int(load_table(name, 'dist')[coordinate(name).of(cube)])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build coordinate move and pruning tables.')
+    parser.add_argument('names', nargs='*', metavar='NAME',
+                        help=f"tables to build: {', '.join(COORDS)} (default: all)")
+    args = parser.parse_args(argv)
+    names = args.names or list(COORDS)
+    unknown = sorted(set(names) - set(COORDS))
+    if unknown:
+        parser.error(f"unknown table(s): {', '.join(unknown)}")
+    for name in names:
+        dist = build(name)
+        counts = np.bincount(dist[dist != UNREACHED])
+        print(f"{name}: {len(dist)} states, max depth {len(counts) - 1}, "
+              f"by depth {counts.tolist()}")
+
+if __name__ == '__main__':
+    main()
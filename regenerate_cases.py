@@ -0,0 +1,190 @@
+import argparse
+import hashlib
+import json
+import os
+import pathlib
+import sys
+
+from fix_oll_data import (
+    SIMULATOR_VERSION, case_state, colors, corner_facelets, edge_facelets, locate_piece,
+    patterns_from_state, pll_pattern_from_state,
+)
+
+# --- Case data validation / regeneration ---
+# Every derived field in data/*_cases.json is recomputed from the case's
+# solution: OLL top/ring patterns, PLL ring patterns and the F2L pair
+# (front-right slot) positions and orientations.
+
+ROOT = pathlib.Path(__file__).resolve().parent
+DATA_DIR = ROOT / 'data'
+CASE_FILES = {
+    'oll': DATA_DIR / 'oll_cases.json',
+    'pll': DATA_DIR / 'pll_cases.json',
+    'f2l': DATA_DIR / 'f2l_cases.json',
+}
+
+# Derived fields keyed by a hash of (simulator version, kind, solution), so
+# unchanged cases are never re-simulated. --check reads it but never writes it.
+CACHE_PATH = ROOT / '.cache' / 'case_derivations.json'
+
+# F2L slot pieces: the DFR corner (D colour first) and the FR edge (F colour first).
+_f2l_corner = [colors['D'], colors['F'], colors['R']]
+_f2l_edge = [colors['F'], colors['R']]
+
+def derive_oll(solution):
+    top, ring = patterns_from_state(case_state(solution))
+    return {'topPattern': top, 'ringPattern': ring}
+
+def derive_pll(solution):
+    return {'pattern': pll_pattern_from_state(case_state(solution))}
+
+def derive_f2l(solution):
+    state = case_state(solution)
+    corner_pos, corner_ori = locate_piece(state, corner_facelets, _f2l_corner)
+    edge_pos, edge_ori = locate_piece(state, edge_facelets, _f2l_edge)
+    return {
+        # The data names the solved corner position by its slot.
+        'cornerPos': 'FR_SLOT' if corner_pos == 'DFR' else corner_pos,
+        'cornerOri': corner_ori,
+        'edgePos': edge_pos,
+        'edgeOri': edge_ori,
+    }
+
+DERIVERS = {'oll': derive_oll, 'pll': derive_pll, 'f2l': derive_f2l}
+
+def _derive(job):
+    kind, solution = job
+    return DERIVERS[kind](solution)
+
+def derive_all(jobs_in, jobs=None):
+    # Derived fields for each (kind, solution) job, in order.
+    if jobs == 1 or len(jobs_in) <= 1:
+        return [_derive(job) for job in jobs_in]
+    # Imported here so fully cached runs skip the multiprocessing start-up cost.
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_derive, jobs_in, chunksize=16))
+
+def cache_key(kind, solution):
+    # Prefixed with the kind so runs over some kinds can prune only their own.
+    digest = hashlib.sha1(f'{SIMULATOR_VERSION}:{kind}:{solution}'.encode()).hexdigest()
+    return f'{kind}:{digest}'
+
+def prune_cache(cache, cases_by_kind):
+    # Entries still in use: every key of the kinds just checked, and all
+    # entries of the kinds that were not. Edited or deleted algorithms and
+    # older simulator versions drop out.
+    used = {cache_key(kind, c['solution']) for kind, cases in cases_by_kind.items() for c in cases}
+    others = set(CASE_FILES) - set(cases_by_kind)
+    return {k: v for k, v in cache.items() if k in used or k.split(':')[0] in others}
+
+def load_cache():
+    try:
+        return json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def write_if_changed(path, content):
+    # Leaves the file (and its mtime) alone when the content is unchanged.
+    # `content` may be str or bytes.
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+def derive_cached(jobs_in, jobs=None, cache=None):
+    # derive_all, skipping jobs already in `cache` (updated in place).
+    if cache is None:
+        return derive_all(jobs_in, jobs)
+    keys = [cache_key(*job) for job in jobs_in]
+    missing = {k: job for k, job in zip(keys, jobs_in) if k not in cache}
+    if missing:
+        cache.update(zip(missing, derive_all(list(missing.values()), jobs)))
+    return [cache[k] for k in keys]
+
+def load_cases(kinds):
+    return {kind: json.loads(CASE_FILES[kind].read_text()) for kind in kinds}
+
+def find_mismatches(cases_by_kind, jobs=None, cache=None):
+    # Compares stored fields with derived ones. Returns (mismatches, derived),
+    # where mismatches is a list of JSON-ready dicts.
+    work = [(kind, c) for kind, cases in cases_by_kind.items() for c in cases]
+    derived = derive_cached([(kind, c['solution']) for kind, c in work], jobs, cache)
+    mismatches = []
+    for (kind, c), fields in zip(work, derived):
+        for field, value in fields.items():
+            if c.get(field) != value:
+                mismatches.append({
+                    'file': CASE_FILES[kind].name, 'id': c['id'], 'field': field,
+                    'stored': c.get(field), 'derived': value,
+                })
+    return mismatches, derived
+
+def apply_updates(cases_by_kind, derived):
+    # Writes derived fields back; returns the kinds whose data changed.
+    changed = set()
+    items = iter(derived)
+    for kind, cases in cases_by_kind.items():
+        for c in cases:
+            fields = next(items)
+            if any(c.get(k) != v for k, v in fields.items()):
+                c.update(fields)
+                changed.add(kind)
+    for kind in changed:
+        write_if_changed(CASE_FILES[kind], json.dumps(cases_by_kind[kind], indent=2))
+    return changed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Validate and regenerate derived case data.')
+    parser.add_argument('kinds', nargs='*', metavar='KIND',
+                        help=f"case files to process: {', '.join(CASE_FILES)} (default: all)")
+    parser.add_argument('--check', action='store_true',
+                        help='only report mismatches; exit with status 1 if any are found')
+    parser.add_argument('--report', metavar='PATH',
+                        help="write the mismatch report as JSON to PATH ('-' for stdout)")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help='worker processes (1 runs in-process)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='ignore and do not update the derivation cache')
+    args = parser.parse_args(argv)
+
+    kinds = args.kinds or list(CASE_FILES)
+    unknown = sorted(set(kinds) - set(CASE_FILES))
+    if unknown:
+        parser.error(f"unknown case file(s): {', '.join(unknown)}")
+    cases_by_kind = load_cases(kinds)
+    cache = None if args.no_cache else load_cache()
+    cached = dict(cache or {})
+    mismatches, derived = find_mismatches(cases_by_kind, args.jobs, cache)
+    if cache is not None and not args.check:
+        cache = prune_cache(cache, cases_by_kind)
+        if cache != cached:
+            write_if_changed(CACHE_PATH, json.dumps(cache, sort_keys=True, separators=(',', ':')))
+
+    if args.report:
+        report = json.dumps({'checked': {k: len(v) for k, v in cases_by_kind.items()},
+                             'mismatches': mismatches}, indent=2)
+        if args.report == '-':
+            print(report)
+        else:
+            pathlib.Path(args.report).write_text(report)
+
+    if args.check:
+        if args.report != '-':
+            print(f"{len(mismatches)} mismatched fields in {', '.join(kinds)} case data.")
+        return 1 if mismatches else 0
+
+    apply_updates(cases_by_kind, derived)
+    if args.report != '-':
+        for kind in kinds:
+            updated = len({m['id'] for m in mismatches if m['file'] == CASE_FILES[kind].name})
+            print(f"Updated {updated} {kind.upper()} cases.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,247 @@
+import argparse
+import json
+import multiprocessing
+import os
+import pathlib
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+from fix_oll_data import MOVE_PERMS, case_state, colors, faces, invert_perm, sticker
+from regenerate_cases import CASE_FILES
+from simplify_alg import AXES, move_count
+
+# --- Meet-in-the-middle algorithm search ---
+# Finds every minimal-length algorithm over a generator set (e.g. <R,U,F>) for
+# an OLL or PLL case. States are 54 bytes of sticker labels:
+#
+#   OLL  top-layer stickers reduced to "yellow" / "not yellow", first two
+#        layers exact, so any top-layer permutation counts as solved
+#   PLL  full colours; the four AUFs of the solved cube all count as solved
+#
+# U turns before and after the algorithm (AUF) are free: the search starts
+# from all four U turns of the case and ends at any U turn of solved.
+#
+# A backward table holds every state within B moves of a solved state together
+# with all its minimal paths there. Forward sequences of length L - B are then
+# enumerated in a process pool and looked up in it, for L = 0, 1, 2, ... The
+# first L with a hit gives all minimal solutions: every suffix of a minimal
+# solution is itself minimal, so it is always in the table. B is the deepest
+# level that keeps the table under --max-states.
+
+_color_codes = {colors[f]: i for i, f in enumerate(faces)}
+_top_layer = {sticker('U', i) for i in range(9)} | \
+    {sticker(f, i) for f in 'FRBL' for i in range(3)}
+_yellow = colors['U']
+_OTHER = len(faces)
+
+_axis_of = {}
+_axis_rank = {}
+for _axis, _layers in AXES.items():
+    for _rank, _layer in enumerate(_layers):
+        _axis_of[_layer] = _axis_of[_layer.lower()] = _axis
+        _axis_rank[_layer] = _axis_rank[_layer.lower()] = _rank
+
+_aufs = ('', 'U', 'U2', "U'")
+_inverse_aufs = {'': '', 'U': "U'", 'U2': 'U2', "U'": 'U'}
+
+def _turn(state, move):
+    return bytes(itemgetter(*MOVE_PERMS[move])(state)) if move else state
+
+def parse_generators(text):
+    # "<R,U,F>", "R,U,F" or "RUF" -> ['R', 'U', 'F'].
+    letters = [ch for ch in text if ch not in '<>, ']
+    unknown = [ch for ch in letters if ch not in MOVE_PERMS]
+    if unknown or not letters:
+        raise ValueError(f'bad generator set {text!r}')
+    return letters
+
+def _labels(kind):
+    # Label of each home sticker for the case kind (see above).
+    home = [colors[f] for f in faces for _ in range(9)]
+    if kind == 'pll':
+        return [_color_codes[c] for c in home]
+    return [(_color_codes[c] if c == _yellow else _OTHER) if i in _top_layer else _color_codes[c]
+            for i, c in enumerate(home)]
+
+class Problem:
+    def __init__(self, kind, solution, generators):
+        self.kind = kind
+        self.generators = list(generators)
+        self.moves = [g + s for g in self.generators for s in ('', '2', "'")]
+        self._forward = [itemgetter(*MOVE_PERMS[m]) for m in self.moves]
+        self._backward = [itemgetter(*invert_perm(MOVE_PERMS[m])) for m in self.moves]
+        labels = _labels(kind)
+        # Sticker i of the case holds home sticker case_state(...)[i].
+        layout = case_state(solution, state=tuple(range(54)))
+        start = bytes(labels[i] for i in layout)
+        solved = bytes(labels)
+        self.starts = {}
+        self.goals = {}
+        for auf in _aufs:
+            # starts[state]: the AUF that turns the case into `state`;
+            # goals[state]: the AUF still to do once `state` is reached.
+            self.starts.setdefault(_turn(start, auf), auf)
+            self.goals.setdefault(_turn(solved, _inverse_aufs[auf]), auf)
+
+    def allowed(self, prev, move):
+        # No two turns of one layer in a row, and same-axis runs in axis order
+        # (R L, never L R), so commuting spellings are produced once.
+        if prev is None:
+            return True
+        a, b = self.generators[prev // 3], self.generators[move // 3]
+        if a == b:
+            return False
+        return _axis_of[a] != _axis_of[b] or _axis_rank[a] < _axis_rank[b]
+
+    def backward_table(self, max_states):
+        # {state: (depth, [paths])}; each path is a tuple of move indices that
+        # solves the state (ending with the goal's AUF still to do).
+        table = {state: (0, [()]) for state in self.goals}
+        frontier = list(table)
+        depth = 0
+        while frontier:
+            level = {}
+            for state in frontier:
+                paths = table[state][1]
+                for m, gather in enumerate(self._backward):
+                    prev = bytes(gather(state))
+                    if prev in table:
+                        continue
+                    new = [(m,) + p for p in paths if not p or self.allowed(m, p[0])]
+                    if new:
+                        level.setdefault(prev, []).extend(new)
+            if len(table) + len(level) > max_states:
+                break
+            depth += 1
+            for state, paths in level.items():
+                table[state] = (depth, paths)
+            frontier = list(level)
+        return table, depth
+
+    def spell(self, path):
+        return ' '.join(self.moves[m] for m in path)
+
+# Worker state: the problem and backward table are set before the pool is
+# created, so forked workers share them copy-on-write.
+_problem = None
+_table = None
+
+def _search_prefix(args):
+    # Minimal solutions of total length `length` from `start` whose forward
+    # part begins with `prefix` and is `forward` moves long.
+    start, prefix, forward, length = args
+    problem, table = _problem, _table
+    state = start
+    for m in prefix:
+        state = bytes(problem._forward[m](state))
+    found = []
+
+    def visit(state, path):
+        if len(path) == forward:
+            hit = table.get(state)
+            if hit and hit[0] == length - forward:
+                for tail in hit[1]:
+                    if not tail or not path or problem.allowed(path[-1], tail[0]):
+                        found.append((start, path + tail))
+            return
+        prev = path[-1] if path else None
+        for m, gather in enumerate(problem._forward):
+            if problem.allowed(prev, m):
+                visit(bytes(gather(state)), path + (m,))
+
+    visit(state, tuple(prefix))
+    return found
+
+def _prefixes(problem, depth):
+    out = [()]
+    for _ in range(depth):
+        out = [p + (m,) for p in out for m in range(len(problem.moves))
+               if problem.allowed(p[-1] if p else None, m)]
+    return out
+
+def search(kind, solution, generators, max_length=14, max_states=1_000_000, jobs=None):
+    # (length, [(pre AUF, alg, post AUF)]) for all minimal solutions up to
+    # max_length; length is None when nothing was found.
+    global _problem, _table
+    _problem = Problem(kind, solution, generators)
+    _table, depth = _problem.backward_table(max_states)
+    problem, table = _problem, _table
+    pool = None
+    try:
+        for length in range(max_length + 1):
+            forward = max(0, length - depth)
+            if forward == 0:
+                paths = []
+                for start in problem.starts:
+                    hit = table.get(start)
+                    if hit and hit[0] == length:
+                        paths += [(start, p) for p in hit[1]]
+            else:
+                split = min(2, forward)
+                tasks = [(start, p, forward, length)
+                         for start in problem.starts for p in _prefixes(problem, split)]
+                if jobs == 1 or forward < 3:
+                    results = map(_search_prefix, tasks)
+                else:
+                    if pool is None:
+                        ctx = multiprocessing.get_context('fork') if os.name == 'posix' else None
+                        pool = ProcessPoolExecutor(max_workers=jobs, mp_context=ctx)
+                    results = pool.map(_search_prefix, tasks)
+                paths = [p for r in results for p in r]
+            if paths:
+                sols = set()
+                for start, p in paths:
+                    state = start
+                    for m in p:
+                        state = bytes(problem._forward[m](state))
+                    sols.add((problem.starts[start], problem.spell(p), problem.goals[state]))
+                return length, sorted(sols, key=lambda sol: (sol[1], sol[0], sol[2]))
+        return None, []
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Search for minimal OLL/PLL algorithms.')
+    parser.add_argument('kind', choices=['oll', 'pll'])
+    parser.add_argument('ids', nargs='*', metavar='ID', help='case ids (default: every case)')
+    parser.add_argument('--gens', default='RUF', help='generator set, e.g. "<R,U,F>" or RUD (default RUF)')
+    parser.add_argument('--max-length', type=int, default=14)
+    parser.add_argument('--max-states', type=int, default=1_000_000,
+                        help='size cap for the backward table (bounds memory)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('--report', metavar='PATH', help='write results as JSON to PATH')
+    args = parser.parse_args(argv)
+
+    generators = parse_generators(args.gens)
+    cases = json.loads(CASE_FILES[args.kind].read_text())
+    if args.ids:
+        unknown = sorted(set(args.ids) - {c['id'] for c in cases})
+        if unknown:
+            parser.error(f"unknown case id(s): {', '.join(unknown)}")
+        cases = [c for c in cases if c['id'] in args.ids]
+
+    report = []
+    for c in cases:
+        start = time.perf_counter()
+        length, sols = search(args.kind, c['solution'], generators,
+                              args.max_length, args.max_states, args.jobs)
+        current = move_count(c['solution'])
+        report.append({'id': c['id'], 'solution': c['solution'], 'length': current,
+                       'minimal': length,
+                       'found': [{'pre': pre, 'alg': alg, 'post': post} for pre, alg, post in sols]})
+        best = f'{length} moves, {len(sols)} solutions' if length is not None else 'none found'
+        shorter = '  SHORTER' if length is not None and length < current else ''
+        print(f"{c['id']}: current {current}, <{','.join(generators)}> {best} "
+              f"({time.perf_counter() - start:.1f}s){shorter}")
+        for pre, alg, post in sols[:3]:
+            print(f"    {f'({pre}) ' if pre else ''}{alg}{f' ({post})' if post else ''}")
+
+    if args.report:
+        pathlib.Path(args.report).write_text(json.dumps(report, indent=2))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
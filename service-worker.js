@@ -1,47 +1,97 @@
-// Bump version to invalidate old cached assets (JS/HTML changes)
-const CACHE_NAME = 'learnop-v2';
-const ASSETS_TO_CACHE = [
-  './',
-  './index.html',
-  './cross.html',
-  './f2l_entry.html',
-  './f2l.html',
-  './oll.html',
-  './pll.html',
-  './scanner.html',
-  './solver_demo.html',
-  './solver.html',
-  './test_solver.html',
-  './timer.html',
-  './css/styles.css',
-  './css/loader.css',
-  './js/site.js',
-  './js/cross.js',
-  './js/f2l_entry.js',
-  './js/f2l-animation.js',
-  './js/f2l.js',
-  './js/min2phase.js',
-  './js/oll.js',
-  './js/pll.js',
-  './js/rubiks-cube-solver.js',
-  './js/scanner.js',
-  './js/solver.js',
-  './js/timer.js',
-  './data/f2l_cases.json',
-  './data/oll_cases.json',
-  './data/pll_cases.json',
-  './manifest.json'
+// [url, revision] for every site asset. Generated by build_precache.py from
+// file content hashes; do not edit by hand.
+const PRECACHE_MANIFEST = [
+  ['./', '4caca20f5d'],
+  ['./algorithm.html', '58debc606c'],
+  ['./cross.html', '65fb669d3c'],
+  ['./f2l.html', '567009aa87'],
+  ['./f2l_entry.html', '9fbabc367c'],
+  ['./full-solution.html', '26058c46e2'],
+  ['./index.html', '4caca20f5d'],
+  ['./manifest.json', 'cc5ce6db31'],
+  ['./oll.html', 'd9dfc3abb3'],
+  ['./pll.html', '196f887741'],
+  ['./scanner.html', '7bb7c1749c'],
+  ['./solver.html', '811ab03f45'],
+  ['./solver_demo.html', 'fafaecfb9c'],
+  ['./test_solver.html', '01dc031e3d'],
+  ['./timer.html', '5c7e95b0aa'],
+  ['./css/loader.css', '97edd5236f'],
+  ['./css/styles.css', '1ac9c06d0c'],
+  ['./js/algorithm.js', '9da87c2f43'],
+  ['./js/case-data.js', 'dbb8a6287b'],
+  ['./js/cross.js', 'f2efbdd382'],
+  ['./js/f2l-animation.js', '6066620f46'],
+  ['./js/f2l.js', '6235e782c3'],
+  ['./js/f2l_entry.js', '0491a3f731'],
+  ['./js/full-solution.js', 'ad23fb95f8'],
+  ['./js/min2phase.js', '8daa061af8'],
+  ['./js/oll.js', 'adbed7fcb4'],
+  ['./js/pll.js', '483980018f'],
+  ['./js/rubiks-cube-solver.js', '2706be61c2'],
+  ['./js/scanner.js', '535f76cb00'],
+  ['./js/site.js', '83c858771b'],
+  ['./js/solver-worker.843b0d4c.js', '843b0d4c9d'],
+  ['./js/solver.25fc92da.js', '25fc92da98'],
+  ['./js/timer-stats.js', 'a60db95624'],
+  ['./js/timer-store.js', 'fc177e891f'],
+  ['./js/timer.js', '8079891581'],
+  ['./data/cases.bin', '41bae96c13'],
+  ['./data/cross_table.bin', '75d6855652'],
+  ['./data/f2l_cases.json', '43be06babb'],
+  ['./data/f2l_index.json', '172b3f2376'],
+  ['./data/oll_cases.json', '401c9dc6cb'],
+  ['./data/oll_index.json', '65066bcb49'],
+  ['./data/pll_cases.json', '7780d0f5ad'],
+  ['./data/pll_table.json', '6450894c2e'],
+  ['./data/scrambles.bin', '10a1401260'],
+  ['./icons/icon.svg', '07d34eae3e']
 ];
 
+const PRECACHE_NAME = 'learnop-precache';
+const RUNTIME_NAME = 'learnop-runtime';
+
+// Each asset is cached under its URL plus revision, so a new service worker
+// only downloads the assets whose revision changed.
+const cacheKey = (url, revision) => {
+  const key = new URL(url, self.location);
+  key.searchParams.set('__rev', revision);
+  return key.href;
+};
+
+const PRECACHE_KEYS = new Map(
+  PRECACHE_MANIFEST.map(([url, revision]) => [new URL(url, self.location).href, cacheKey(url, revision)])
+);
+
 self.addEventListener('install', (event) => {
   event.waitUntil(
-    caches.open(CACHE_NAME).then((cache) => {
-      return cache.addAll(ASSETS_TO_CACHE);
+    caches.open(PRECACHE_NAME).then((cache) => {
+      return Promise.all(PRECACHE_MANIFEST.map(async ([url, revision]) => {
+        const key = cacheKey(url, revision);
+        if (await cache.match(key)) return;
+        // Bypass the HTTP cache so the new revision is what gets stored
+        const response = await fetch(new Request(url, { cache: 'reload' }));
+        if (!response.ok) throw new Error(`Precache failed for ${url}: ${response.status}`);
+        await cache.put(key, response);
+      }));
     })
   );
 });
 
 self.addEventListener('fetch', (event) => {
+  const url = new URL(event.request.url);
+  url.search = '';
+  url.hash = '';
+  const key = PRECACHE_KEYS.get(url.href);
+  if (key) {
+    event.respondWith(
+      caches.open(PRECACHE_NAME)
+        .then((cache) => cache.match(key))
+        .then((response) => response || fetch(event.request))
+    );
+    return;
+  }
+
   event.respondWith(
     caches.match(event.request).then((response) => {
       // Cache hit - return response
@@ -57,7 +107,7 @@ self.addEventListener('fetch', (event) => {
         // Clone the response
         const responseToCache = response.clone();
 
-        caches.open(CACHE_NAME).then((cache) => {
+        caches.open(RUNTIME_NAME).then((cache) => {
           cache.put(event.request, responseToCache);
         });
 
@@ -68,7 +118,8 @@ self.addEventListener('fetch', (event) => {
 });
 
 self.addEventListener('activate', (event) => {
-  const cacheWhitelist = [CACHE_NAME];
+  const cacheWhitelist = [PRECACHE_NAME, RUNTIME_NAME];
+  const current = new Set(PRECACHE_KEYS.values());
   event.waitUntil(
     caches.keys().then((cacheNames) => {
       return Promise.all(
@@ -78,6 +129,11 @@ self.addEventListener('activate', (event) => {
           }
         })
       );
+    }).then(() => caches.open(PRECACHE_NAME)).then((cache) => {
+      // Drop revisions that are no longer in the manifest
+      return cache.keys().then((requests) => Promise.all(
+        requests.filter((request) => !current.has(request.url)).map((request) => cache.delete(request))
+      ));
     })
   );
 });
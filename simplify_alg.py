@@ -0,0 +1,149 @@
+import argparse
+import sys
+from functools import lru_cache
+
+from fix_oll_data import MOVE_PERMS, compose, normalize_alg, rename_move, rotations
+
+# --- Algorithm simplification ---
+# Every move (face, slice, wide or rotation) is a vector of quarter turns on
+# the three layers of its axis, counted in the direction of R, U or F:
+#
+#   x axis: R M L    y axis: U E D    z axis: F S B
+#
+# e.g. R = (1,0,0), M = (0,-1,0), r = (1,1,0), x = (1,1,1). Consecutive moves
+# on one axis commute, so they are summed mod 4 (R L R' -> L, U D U -> U2 D).
+# Turning all three layers together is a whole-cube rotation, so (k,k,k) is
+# subtracted from each vector for the k that is cheapest in the metric, and
+# the rotation is carried forward by renaming every later move. The result has
+# no rotations and is equivalent up to the cube's final orientation.
+
+METRICS = ('HTM', 'QTM', 'STM')
+
+AXES = {'x': ('R', 'M', 'L'), 'y': ('U', 'E', 'D'), 'z': ('F', 'S', 'B')}
+# Quarter turn of each layer measured in its axis direction.
+_layer_signs = {'R': 1, 'M': -1, 'L': -1, 'U': 1, 'E': -1, 'D': -1, 'F': 1, 'S': 1, 'B': -1}
+_layer_of = {name: (axis, i) for axis, names in AXES.items() for i, name in enumerate(names)}
+
+_base_vectors = {}
+for _axis, (_pos, _mid, _neg) in AXES.items():
+    _wide_pos, _wide_neg = _pos.lower(), _neg.lower()
+    for _name, _layers in {_pos: [_pos], _mid: [_mid], _neg: [_neg],
+                           _wide_pos: [_pos, _mid], _wide_neg: [_neg, _mid],
+                           _axis: [_pos, _mid, _neg]}.items():
+        _vec = [0, 0, 0]
+        for _layer in _layers:
+            # The middle layer of a wide move turns with its outer face.
+            _vec[_layer_of[_layer][1]] = _layer_signs[_layers[0]]
+        _base_vectors[_name] = (_axis, tuple(_vec))
+
+_suffix_amounts = {'': 1, '2': 2, "'": 3}
+_amount_suffixes = {1: '', 2: '2', 3: "'"}
+
+def move_vector(token):
+    # (axis, layer quarter turns mod 4) of a normalized move token.
+    axis, vec = _base_vectors[token[0]]
+    amount = _suffix_amounts[token[1:]]
+    return axis, tuple(v * amount % 4 for v in vec)
+
+_rotation_names = {}
+for _a in ('', 'x', 'x2', "x'", 'z', "z'"):
+    for _b in ('', 'y', 'y2', "y'"):
+        _perm = compose(*(MOVE_PERMS[t] for t in (_a, _b) if t))
+        _rotation_names.setdefault(_perm, ' '.join(t for t in (_a, _b) if t))
+_axis_rotations = {axis: [compose(*[MOVE_PERMS[axis]]*k) for k in range(4)] for axis in AXES}
+_identity = rotations[0]
+
+@lru_cache(maxsize=None)
+def _rename_vector(frame, axis, vec):
+    # `vec` done after the rotation `frame`, as a home-orientation vector.
+    new_axis = _layer_of[rename_move(frame, AXES[axis][0])[0]][0]
+    new = [0, 0, 0]
+    for layer, amount in zip(AXES[axis], vec):
+        if amount:
+            name = rename_move(frame, layer)
+            sign = _layer_signs[layer] * _layer_signs[name[0]] * (-1 if name[1:] == "'" else 1)
+            new[_layer_of[name[0]][1]] = amount * sign % 4
+    return new_axis, tuple(new)
+
+def _cost(vec, metric):
+    if metric == 'STM':
+        return sum(1 for v in vec if v)
+    outer = [v for i, v in enumerate(vec) if i != 1 and v]
+    if metric == 'HTM':
+        return len(outer)
+    return sum(2 if v == 2 else 1 for v in outer)
+
+def reduce_vector(vec, metric='HTM'):
+    # (vector, k): cheapest spelling of `vec` once k quarter turns of the
+    # whole cube are taken out. HTM and QTM only use face turns, so the middle
+    # layer must be left unturned; STM may keep a slice.
+    if metric == 'STM':
+        candidates = range(4)
+    else:
+        candidates = [vec[1]]
+    def shifted(k):
+        return tuple((v - k) % 4 for v in vec)
+    k = min(candidates, key=lambda k: (_cost(shifted(k), metric), shifted(k)[1] != 0, k))
+    return shifted(k), k
+
+def _spell(axis, vec):
+    moves = []
+    for layer, amount in zip(AXES[axis], vec):
+        if amount:
+            moves.append(layer + _amount_suffixes[amount * _layer_signs[layer] % 4])
+    return moves
+
+@lru_cache(maxsize=4096)
+def _simplify_normalized(norm, metric, keep_orientation):
+    frame = _identity
+    groups = []  # [axis, vec] in home orientation, rotations taken out
+    for tok in norm.split():
+        axis, vec = _rename_vector(frame, *move_vector(tok))
+        if groups and groups[-1][0] == axis:
+            vec = tuple((a + b) % 4 for a, b in zip(groups.pop()[1], vec))
+        vec, k = reduce_vector(vec, metric)
+        if k:
+            frame = compose(_axis_rotations[axis][k], frame)
+        if any(vec):
+            groups.append((axis, vec))
+    moves = [m for axis, vec in groups for m in _spell(axis, vec)]
+    if keep_orientation and frame != _identity:
+        moves.append(_rotation_names[frame])
+    return ' '.join(moves)
+
+def simplify(alg, metric='HTM', keep_orientation=False):
+    # Shortest spelling found by merging same-axis moves. With
+    # keep_orientation the net rotation is appended, so the cube also ends in
+    # the same orientation as after `alg`.
+    if metric not in METRICS:
+        raise ValueError(f'unknown metric {metric!r}')
+    return _simplify_normalized(normalize_alg(alg), metric, keep_orientation)
+
+def simplify_all(algs, metric='HTM', keep_orientation=False):
+    # Batch form for cleaning generated solutions; repeated inputs are cached.
+    return [simplify(alg, metric, keep_orientation) for alg in algs]
+
+def move_count(alg, metric='HTM'):
+    # Length of `alg` in the metric; rotations are free, slices cost two face
+    # turns in HTM/QTM.
+    total = 0
+    for tok in normalize_alg(alg).split():
+        if tok[0] in AXES:
+            continue
+        turns = 2 if tok.endswith('2') and metric == 'QTM' else 1
+        total += turns * (2 if tok[0] in 'MES' and metric != 'STM' else 1)
+    return total
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Simplify algorithms (one per argument or stdin line).')
+    parser.add_argument('algs', nargs='*', metavar='ALG')
+    parser.add_argument('--metric', choices=METRICS, default='HTM')
+    parser.add_argument('--keep-orientation', action='store_true',
+                        help='append the net rotation so the final orientation is unchanged')
+    args = parser.parse_args(argv)
+    algs = args.algs or [line.strip() for line in sys.stdin if line.strip()]
+    for alg, simple in zip(algs, simplify_all(algs, args.metric, args.keep_orientation)):
+        print(f'{simple}\t({move_count(alg, args.metric)} -> {move_count(simple, args.metric)} {args.metric})')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+import argparse
+import collections
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+import cubie
+from build_cross_table import SOLVED_MOVE, read_next_moves
+from build_f2l_index import INDEX_PATH as F2L_INDEX_PATH, SLOTS, key, pair_case, slot_algorithm
+from build_oll_index import pack_patterns
+from fix_oll_data import apply_alg, patterns_from_state, pll_pattern_from_state, solved
+from pruning_tables import coordinate
+from regenerate_cases import CASE_FILES, DATA_DIR
+from simplify_alg import move_count, simplify
+
+# --- Batch CFOP solver ---
+# Reads facelet strings (54 face letters in U R F D L B order, as built by
+# solver.js), one per line, and writes one JSON object per line:
+#
+#   {"line": 1, "facelets": "...",
+#    "cross": {"moves": "...", "count": 6},
+#    "f2l": [{"slot": "FR", "case": "F2L-12", "moves": "...", "count": 9}, ...],
+#    "oll": {"case": "OLL27", "moves": "...", "count": 8},
+#    "pll": {"case": "T", "moves": "...", "count": 15},
+#    "count": 57}
+#
+# or {"line": ..., "facelets": ..., "error": "..."} for a line that is not a
+# solvable cube. The cross is optimal (data/cross_table.bin); F2L pairs, OLL
+# and PLL come from the case tables the site uses, with AUFs tried for each.
+# A pair whose pieces are stuck in a slot (another one, or its own but wrongly
+# inserted) is first taken out with that slot's R U R'. Every segment is
+# simplified to face turns, counts are HTM, and a skipped step has case null
+# and no moves.
+#
+# Lines are solved in chunks across a process pool with a bounded number of
+# chunks in flight and written in input order, so memory stays flat however
+# long the input is.
+
+AUFS = ('', 'U', "U'", 'U2')
+# R U R' done on each slot: lifts both of its pieces into the U layer.
+EXTRACT = {slot: slot_algorithm("R U R'", slot) for slot in SLOTS}
+# Slot that owns each D-layer corner and middle-layer edge position.
+_slot_of_position = {}
+for _slot, (_corner, _edge, _) in SLOTS.items():
+    _slot_of_position[f'{_slot}_SLOT'] = _slot_of_position[_corner] = _slot_of_position[_edge] = _slot
+_solved = solved()
+_solved_pairs = {slot: pair_case(_solved, slot) for slot in SLOTS}
+MAX_F2L_STEPS = 12
+
+@lru_cache(maxsize=None)
+def tables():
+    # Loaded once per process (before forking, so workers share them).
+    def load(path):
+        return json.loads(path.read_text())
+    return {
+        'cross': read_next_moves(),
+        'cross_coord': coordinate('cross'),
+        'f2l': load(F2L_INDEX_PATH),
+        'oll': load(DATA_DIR / 'oll_index.json'),
+        'oll_algs': {c['id']: c['solution'] for c in load(CASE_FILES['oll'])},
+        'pll': load(DATA_DIR / 'pll_table.json'),
+        'pll_algs': {c['id']: c['solution'] for c in load(CASE_FILES['pll'])},
+    }
+
+def _segment(case, moves):
+    return {'case': case, 'moves': moves, 'count': move_count(moves)}
+
+def _apply(moves, state):
+    return apply_alg(moves, state=state) if moves else state
+
+def solve_cross(state):
+    t = tables()
+    coord, next_moves = t['cross_coord'], t['cross']
+    moves = []
+    while True:
+        m = next_moves[coord.of(cubie.from_stickers(state, check=False))]
+        if m == SOLVED_MOVE:
+            return state, ' '.join(moves)
+        moves.append(cubie.FACE_MOVES[m])
+        state = _apply(moves[-1], state)
+
+def _stuck_slot(state, slots):
+    # A slot holding a piece of one of `slots`' pairs (possibly its own pair,
+    # wrongly inserted); None when all of those pieces are in the U layer.
+    for slot in slots:
+        corner, _, edge, _ = pair_case(state, slot)
+        for position in (corner, edge):
+            if position in _slot_of_position:
+                return _slot_of_position[position]
+    return None
+
+def solve_f2l(state):
+    f2l = tables()['f2l']
+    segments = []
+    pending = ''  # extraction moves done for the next pair
+    for _ in range(MAX_F2L_STEPS):
+        todo = [slot for slot in SLOTS if pair_case(state, slot) != _solved_pairs[slot]]
+        if not todo:
+            return state, segments
+        best = None
+        for slot in todo:
+            for auf in AUFS:
+                hit = f2l.get(key(slot, *pair_case(_apply(auf, state), slot)))
+                if hit:
+                    moves = simplify(f'{auf} {hit[1]}')
+                    candidate = (move_count(moves), slot, hit[0], moves)
+                    best = min(best, candidate) if best else candidate
+        if best is None:
+            slot = _stuck_slot(state, todo)
+            if slot is None:
+                raise ValueError('unrecognised F2L case')
+            pending = simplify(f'{pending} {EXTRACT[slot]}')
+            state = _apply(EXTRACT[slot], state)
+            continue
+        _, slot, case, moves = best
+        state = _apply(moves, state)
+        segments.append({'slot': slot, **_segment(case, simplify(f'{pending} {moves}'))})
+        pending = ''
+    raise ValueError('F2L did not finish')
+
+def solve_oll(state):
+    t = tables()
+    top, ring = patterns_from_state(state)
+    if top == '1' * len(top):
+        return state, _segment(None, '')
+    hit = t['oll'].get(str(pack_patterns(top, ring)))
+    if hit is None:
+        raise ValueError('unrecognised OLL case')
+    case, auf = hit
+    moves = simplify(f"{auf} {t['oll_algs'][case]}")
+    return _apply(moves, state), _segment(case, moves)
+
+def solve_pll(state):
+    t = tables()
+    for auf in AUFS:
+        if _apply(auf, state) == _solved:
+            return _apply(auf, state), _segment(None, auf)
+    hit = t['pll'].get(pll_pattern_from_state(state))
+    if hit is None:
+        raise ValueError('unrecognised PLL case')
+    case, pre, post = hit
+    # `post` is done in the home orientation, after any rotation in the
+    # algorithm is undone; simplify() drops rotations by relabelling later
+    # moves, so it is added afterwards.
+    moves = simplify(f"{pre} {t['pll_algs'][case]}")
+    moves = simplify(f'{moves} {post}')
+    return _apply(moves, state), _segment(case, moves)
+
+def solve(facelets):
+    # CFOP breakdown of one facelet string (see above); ValueError if the
+    # string is not a solvable cube.
+    state = cubie.to_stickers(cubie.from_facelets(facelets))
+    state, cross = solve_cross(state)
+    state, f2l = solve_f2l(state)
+    state, oll = solve_oll(state)
+    state, pll = solve_pll(state)
+    if state != _solved:
+        raise ValueError('solution does not solve the cube')
+    cross = _segment(None, cross)
+    del cross['case']
+    total = cross['count'] + sum(s['count'] for s in f2l) + oll['count'] + pll['count']
+    return {'cross': cross, 'f2l': f2l, 'oll': oll, 'pll': pll, 'count': total}
+
+def solve_line(line_no, text):
+    record = {'line': line_no, 'facelets': text}
+    try:
+        record.update(solve(text))
+    except ValueError as e:
+        record['error'] = str(e)
+    return json.dumps(record, separators=(',', ':'))
+
+def solve_chunk(chunk):
+    return [solve_line(n, text) for n, text in chunk]
+
+def read_chunks(lines, size):
+    # [(line number, facelets)] chunks; blank lines are skipped.
+    numbered = ((n, line.strip()) for n, line in enumerate(lines, 1))
+    numbered = (item for item in numbered if item[1])
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield chunk
+
+def run(lines, out, jobs=None, chunk_size=256):
+    # Solves every line, writing results in input order; at most 2 chunks
+    # per worker are queued at any time. Returns (lines, errors).
+    jobs = jobs or os.cpu_count()
+    solved_count = errors = 0
+    tables()
+    chunks = read_chunks(lines, chunk_size)
+    if jobs == 1:
+        results = map(solve_chunk, chunks)
+    else:
+        ctx = multiprocessing.get_context('fork') if os.name == 'posix' else None
+        pool = ProcessPoolExecutor(max_workers=jobs, mp_context=ctx)
+        results = _bounded_map(pool, chunks, 2 * jobs)
+    try:
+        for records in results:
+            for record in records:
+                out.write(record + '\n')
+                solved_count += 1
+                errors += '"error":' in record
+    finally:
+        if jobs != 1:
+            pool.shutdown(cancel_futures=True)
+    return solved_count, errors
+
+def _bounded_map(pool, chunks, window):
+    pending = collections.deque()
+    for chunk in chunks:
+        pending.append(pool.submit(solve_chunk, chunk))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Solve facelet strings with CFOP and write JSONL breakdowns.')
+    parser.add_argument('input', nargs='?', default='-', help='file of facelet strings (default: stdin)')
+    parser.add_argument('-o', '--output', default='-', help='JSONL output file (default: stdout)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('--chunk-size', type=int, default=256, help='lines per task')
+    args = parser.parse_args(argv)
+
+    src = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        count, errors = run(src, out, args.jobs, args.chunk_size)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+    print(f'Solved {count - errors} of {count} states ({errors} errors).', file=sys.stderr)
+    return 1 if errors else 0
+
+if __name__ == '__main__':
+    sys.exit(main())